@@ -1,10 +1,11 @@
 from tkinter import * 
 from tkinter import messagebox
-import pyomo.environ as pe
-import pyomo.opt as po
+from instances import input_array
+from gui_worker import file_input, run_in_background, solver_panel
 
 # Συνάρτηση για την επίλυση του Assignment Problem
-def solve_assignment():
+# engine="hungarian": απευθείας επίλυση με τον αλγόριθμο Hungarian (χωρίς Pyomo/GLPK)
+def solve_assignment(engine="pyomo"):
     try:
         # Ανάγνωση δεδομένων από το GUI
         num_workers = int(entry_num_workers.get())
@@ -15,57 +16,24 @@ def solve_assignment():
         if num_workers != num_tasks:
             raise ValueError("The Assignment Problem requires an equal number of workers and jobs.")
         
-        # Μετατροπή κόστους από είσοδο σε πίνακα
-        costs = [
-            list(map(float, row.split()))
-            for row in cost_input.split("\n") if row.strip()
-        ]
-        if len(costs) != num_workers or any(len(row) != num_tasks for row in costs):
-            raise ValueError("The cost table is not configured correctly.")
+        # Πίνακας κόστους από το πεδίο κειμένου ή όνομα αρχείου (ελέγχονται μόνο οι διαστάσεις του)
+        costs = input_array(cost_input, costs_file["path"], (num_workers, num_tasks), "The cost table")
         
-        # Δημιουργία μοντέλου Pyomo
-        model = pe.ConcreteModel()
+        # Εμφάνιση αποτελεσμάτων όταν τελειώσει η επίλυση
+        def show_results(result):
+            if result["status"] != "optimal":
+                raise ValueError("No optimal solution found.")
 
-        # Σετ εργατών και εργασιών
-        model.workers = pe.Set(initialize=range(num_workers))
-        model.tasks = pe.Set(initialize=range(num_tasks))
+            # Ανάγνωση αποτελεσμάτων
+            total_cost = result["total_cost"]
+            assignments = [f"Worker {w+1} -> Task {t+1}" for w, t in result["assignments"]]
 
-        # Μεταβλητές ανάθεσης (binary)
-        model.x = pe.Var(model.workers, model.tasks, domain=pe.Binary)
+            # Εμφάνιση αποτελεσμάτων
+            result_text = f"Final Cost: {total_cost}\nAssignments:\n" + "\n".join(assignments)
+            messagebox.showinfo("Results", result_text)
 
-        # Συνάρτηση στόχου: Ελαχιστοποίηση κόστους
-        def objective_rule(model):
-            return sum(model.x[w, t] * costs[w][t] for w in model.workers for t in model.tasks)
-        
-        model.obj = pe.Objective(rule=objective_rule, sense=pe.minimize)
-
-        # Περιορισμός: Κάθε εργάτης αναλαμβάνει ακριβώς μία εργασία
-        def worker_constraint_rule(model, w):
-            return sum(model.x[w, t] for t in model.tasks) == 1
-        
-        model.worker_constraints = pe.Constraint(model.workers, rule=worker_constraint_rule)
-
-        # Περιορισμός: Κάθε εργασία ανατίθεται σε ακριβώς έναν εργάτη
-        def task_constraint_rule(model, t):
-            return sum(model.x[w, t] for w in model.workers) == 1
-        
-        model.task_constraints = pe.Constraint(model.tasks, rule=task_constraint_rule)
-
-        # Επίλυση
-        solver = po.SolverFactory('glpk')
-        result = solver.solve(model, tee=True)
-
-        # Ανάγνωση αποτελεσμάτων
-        assignments = []
-        total_cost = pe.value(model.obj)
-        for w in model.workers:
-            for t in model.tasks:
-                if pe.value(model.x[w, t]) == 1:
-                    assignments.append(f"Worker {w+1} -> Task {t+1}")
-
-        # Εμφάνιση αποτελεσμάτων
-        result_text = f"Final Cost: {total_cost}\nAssignments:\n" + "\n".join(assignments)
-        messagebox.showinfo("Results", result_text)
+        # Επίλυση στο παρασκήνιο, ώστε το παράθυρο να μην παγώνει
+        run_in_background(panel, "assignment", {"costs": costs}, {"engine": engine}, show_results)
 
     except Exception as e:
         messagebox.showerror("Error", f"An error occurred: {e}")
@@ -86,10 +54,19 @@ entry_num_tasks.grid(row=1, column=1)
 Label(root, text="Cost Table (space-separated lines):").grid(row=2, column=0, sticky="nw")
 text_costs = Text(root, height=10, width=40)
 text_costs.grid(row=2, column=1)
+costs_file = file_input(root, row=2)
+
+# Επιλογή μηχανής επίλυσης
+Label(root, text="Engine:").grid(row=3, column=0, sticky="w")
+engine_var = StringVar(value="hungarian")
+OptionMenu(root, engine_var, "hungarian", "pyomo").grid(row=3, column=1, sticky="w")
 
 # Κουμπί επίλυσης
-solve_button = Button(root, text="Solve the problem", command=solve_assignment)
-solve_button.grid(row=3, column=0, columnspan=2)
+solve_button = Button(root, text="Solve the problem", command=lambda: solve_assignment(engine=engine_var.get()))
+solve_button.grid(row=4, column=0, columnspan=2)
+
+# Log του solver, χρόνος επίλυσης και Cancel
+panel = solver_panel(root, row=5, columnspan=3)
 
 # Εκκίνηση του Tkinter loop
 root.mainloop()
@@ -1,6 +1,8 @@
 import pyomo.environ as pe
 import pyomo.opt as po
 
+from solution_arrays import selected_indices
+
 # Δημιουργία του AbstractModel
 model = pe.AbstractModel()
 
@@ -51,9 +53,7 @@ result = solver.solve(instance, tee=True)
 
 # Εκτύπωση αποτελεσμάτων
 print("Αποτέλεσμα Ανάθεσης:")
-for i in instance.Workers:
-    for j in instance.Tasks:
-        if pe.value(instance.x[i, j]) == 1:
-            print(f"Εργαζόμενος {i} αναλαμβάνει Εργασία {j}")
+for i, j in selected_indices(instance.x):
+    print(f"Εργαζόμενος {i} αναλαμβάνει Εργασία {j}")
 
 print(f"Συνολικό κόστος: {pe.value(instance.obj)}")
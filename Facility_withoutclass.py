@@ -1,10 +1,12 @@
 from tkinter import *
 from tkinter import messagebox
-import pyomo.environ as pe
-import pyomo.opt as po
+from instances import input_array, parse_vector
+from gui_worker import file_input, run_in_background, solver_panel
 
 # Συνάρτηση για την επίλυση του Facility Location Problem
-def solve_facility_location():
+# engine="pyomo": μοντέλο MIP με GLPK, engine="search": τοπική αναζήτηση με λαγκρανζιανό φράγμα για μεγάλα instances
+# engine="benders": Benders decomposition, βέλτιστη λύση για μεσαία instances
+def solve_facility_location(engine="pyomo"):
     try:
         # Ανάγνωση δεδομένων από το GUI
         num_facilities = int(entry_num_facilities.get())
@@ -12,72 +14,30 @@ def solve_facility_location():
         facility_costs_input = text_facility_costs.get("1.0", END).strip()
         transport_costs_input = text_transport_costs.get("1.0", END).strip()
 
-        # Μετατροπή δεδομένων
-        facility_costs = list(map(float, facility_costs_input.split()))
-        transport_costs = [
-            list(map(float, row.split()))
-            for row in transport_costs_input.split("\n") if row.strip()
-        ]
-
-        # Έλεγχος για ορθότητα δεδομένων
-        if len(facility_costs) != num_facilities:
-            raise ValueError("The number of facility costs must match the number of facilities.")
-        if len(transport_costs) != num_facilities or any(len(row) != num_clients for row in transport_costs):
-            raise ValueError("The transport cost table is not configured correctly.")
-        
-        # Δημιουργία μοντέλου Pyomo
-        model = pe.ConcreteModel()
-
-        # Σετ εγκαταστάσεων και πελατών
-        model.facilities = pe.Set(initialize=range(num_facilities))
-        model.clients = pe.Set(initialize=range(num_clients))
-
-        # Μεταβλητές απόφασης
-        model.y = pe.Var(model.facilities, domain=pe.Binary)  # Εγκατάσταση (1 αν ανοίξει η εγκατάσταση)
-        model.x = pe.Var(model.facilities, model.clients, domain=pe.Binary)  # Αντιστοίχιση πελατών σε εγκαταστάσεις
-
-        # Συνάρτηση στόχου: Ελαχιστοποίηση κόστους
-        def objective_rule(model):
-            facility_cost = sum(model.y[f] * facility_costs[f] for f in model.facilities)
-            transport_cost = sum(model.x[f, c] * transport_costs[f][c] for f in model.facilities for c in model.clients)
-            return facility_cost + transport_cost
-        
-        model.obj = pe.Objective(rule=objective_rule, sense=pe.minimize)
-
-        # Περιορισμός: Κάθε πελάτης εξυπηρετείται από μία εγκατάσταση
-        def client_constraint_rule(model, c):
-            return sum(model.x[f, c] for f in model.facilities) == 1
-        
-        model.client_constraints = pe.Constraint(model.clients, rule=client_constraint_rule)
-
-        # Περιορισμός: Ένας πελάτης μπορεί να εξυπηρετηθεί μόνο από ανοιχτή εγκατάσταση
-        def facility_constraint_rule(model, f, c):
-            return model.x[f, c] <= model.y[f]
-        
-        model.facility_constraints = pe.Constraint(model.facilities, model.clients, rule=facility_constraint_rule)
-
-        # Επίλυση
-        solver = po.SolverFactory('glpk')
-        result = solver.solve(model, tee=True)
-
-        # Ανάγνωση αποτελεσμάτων
-        opened_facilities = []
-        client_assignments = []
-        total_cost = pe.value(model.obj)
-
-        for f in model.facilities:
-            if pe.value(model.y[f]) == 1:
-                opened_facilities.append(f"Facility {f+1}")
-
-        for c in model.clients:
-            for f in model.facilities:
-                if pe.value(model.x[f, c]) == 1:
-                    client_assignments.append(f"Client {c+1} -> Facility {f+1}")
-
-        # Εμφάνιση αποτελεσμάτων
-        result_text = f"Total Cost: {total_cost}\n\nOpened Facilities:\n" + "\n".join(opened_facilities) + \
-                      "\n\nClient Assignments:\n" + "\n".join(client_assignments)
-        messagebox.showinfo("Results", result_text)
+        # Δεδομένα από τα πεδία κειμένου ή ονόματα αρχείων, με έλεγχο διαστάσεων
+        facility_costs = input_array(facility_costs_input, facility_costs_file["path"], (num_facilities,),
+                                     "The facility costs", parse=parse_vector)
+        transport_costs = input_array(transport_costs_input, transport_costs_file["path"], (num_facilities, num_clients),
+                                      "The transport cost table")
+
+        # Εμφάνιση αποτελεσμάτων όταν τελειώσει η επίλυση
+        def show_results(result):
+            # Στο time limit το Benders επιστρέφει την καλύτερη λύση μέχρι τότε ("maxTimeLimit")
+            if result["total_cost"] is None:
+                raise ValueError("No feasible solution found.")
+
+            # Ανάγνωση αποτελεσμάτων
+            total_cost = result["total_cost"]
+            opened_facilities = [f"Facility {f+1}" for f in result["opened_facilities"]]
+            client_assignments = [f"Client {c+1} -> Facility {f+1}" for c, f in result["client_assignments"]]
+
+            # Εμφάνιση αποτελεσμάτων
+            result_text = f"Total Cost: {total_cost}\n\nOpened Facilities:\n" + "\n".join(opened_facilities) + \
+                          "\n\nClient Assignments:\n" + "\n".join(client_assignments)
+            messagebox.showinfo("Results", result_text)
+
+        # Επίλυση στο παρασκήνιο, ώστε το παράθυρο να μην παγώνει
+        run_in_background(panel, "facility", {"facility_costs": facility_costs, "transport_costs": transport_costs}, {"engine": engine}, show_results)
 
     except Exception as e:
         messagebox.showerror("Error", f"An error occurred: {e}")
@@ -98,14 +58,24 @@ entry_num_clients.grid(row=1, column=1)
 Label(root, text="Facility Opening Costs (space-separated):").grid(row=2, column=0, sticky="nw")
 text_facility_costs = Text(root, height=5, width=40)
 text_facility_costs.grid(row=2, column=1)
+facility_costs_file = file_input(root, row=2)
 
 Label(root, text="Transport Costs (space-separated rows):").grid(row=3, column=0, sticky="nw")
 text_transport_costs = Text(root, height=10, width=40)
 text_transport_costs.grid(row=3, column=1)
+transport_costs_file = file_input(root, row=3)
+
+# Επιλογή μηχανής επίλυσης
+Label(root, text="Engine:").grid(row=4, column=0, sticky="w")
+engine_var = StringVar(value="pyomo")
+OptionMenu(root, engine_var, "pyomo", "search", "benders").grid(row=4, column=1, sticky="w")
 
 # Κουμπί επίλυσης
-solve_button = Button(root, text="Solve the problem", command=solve_facility_location)
-solve_button.grid(row=4, column=0, columnspan=2)
+solve_button = Button(root, text="Solve the problem", command=lambda: solve_facility_location(engine=engine_var.get()))
+solve_button.grid(row=5, column=0, columnspan=2)
+
+# Log του solver, χρόνος επίλυσης και Cancel
+panel = solver_panel(root, row=6, columnspan=3)
 
 # Εκκίνηση του Tkinter loop
 root.mainloop()
@@ -1,10 +1,11 @@
 from tkinter import * 
 from tkinter import messagebox
-import pyomo.environ as pe
-import pyomo.opt as po
+from instances import parse_vector
+from gui_worker import run_in_background, solver_panel
 
 # Συνάρτηση για την επίλυση του Knapsack Problem
-def solve_knapsack():
+# engine="auto", "dp" ή "bb": απευθείας επίλυση χωρίς εξωτερικό solver, engine="pyomo": μοντέλο MIP με GLPK
+def solve_knapsack(engine="pyomo"):
     try:
         # Ανάγνωση δεδομένων από το GUI
         capacity = float(entry_capacity.get())
@@ -12,50 +13,31 @@ def solve_knapsack():
         weights_input = text_weights.get("1.0", END).strip()
 
         # Μετατροπή αξιών και βαρών από είσοδο σε λίστες
-        values = list(map(float, values_input.split()))
-        weights = list(map(float, weights_input.split()))
+        values = parse_vector(values_input)
+        weights = parse_vector(weights_input)
 
         # Έλεγχος αν ο αριθμός των αντικειμένων είναι ίδιος
         if len(values) != len(weights):
             raise ValueError("The number of values and weights must be the same.")
-        
-        num_items = len(values)
 
-        # Δημιουργία μοντέλου Pyomo
-        model = pe.ConcreteModel()
+        # Εμφάνιση αποτελεσμάτων όταν τελειώσει η επίλυση
+        def show_results(result):
+            if result["status"] != "optimal":
+                raise ValueError("No optimal solution found.")
 
-        # Σετ αντικειμένων
-        model.items = pe.Set(initialize=range(num_items))
+            # Ανάγνωση αποτελεσμάτων
+            total_value = result["total_value"]
+            selected_items = [
+                f"Item {i+1} (Value: {values[i]}, Weight: {weights[i]})"
+                for i in result["selected"]
+            ]
 
-        # Μεταβλητές απόφασης (binary): Αν το αντικείμενο i μπει στο σακίδιο
-        model.x = pe.Var(model.items, domain=pe.Binary)
+            # Εμφάνιση αποτελεσμάτων
+            result_text = f"Total Value: {total_value}\nSelected Items:\n" + "\n".join(selected_items)
+            messagebox.showinfo("Results", result_text)
 
-        # Συνάρτηση στόχου: Μέγιστη συνολική αξία
-        def objective_rule(model):
-            return sum(model.x[i] * values[i] for i in model.items)
-        
-        model.obj = pe.Objective(rule=objective_rule, sense=pe.maximize)
-
-        # Περιορισμός: Το συνολικό βάρος να μην υπερβαίνει τη χωρητικότητα
-        def weight_constraint_rule(model):
-            return sum(model.x[i] * weights[i] for i in model.items) <= capacity
-        
-        model.weight_constraint = pe.Constraint(rule=weight_constraint_rule)
-
-        # Επίλυση
-        solver = po.SolverFactory('glpk')
-        result = solver.solve(model, tee=True)
-
-        # Ανάγνωση αποτελεσμάτων
-        selected_items = []
-        total_value = pe.value(model.obj)
-        for i in model.items:
-            if pe.value(model.x[i]) == 1:
-                selected_items.append(f"Item {i+1} (Value: {values[i]}, Weight: {weights[i]})")
-
-        # Εμφάνιση αποτελεσμάτων
-        result_text = f"Total Value: {total_value}\nSelected Items:\n" + "\n".join(selected_items)
-        messagebox.showinfo("Results", result_text)
+        # Επίλυση στο παρασκήνιο, ώστε το παράθυρο να μην παγώνει
+        run_in_background(panel, "knapsack", {"values": values, "weights": weights, "capacity": capacity}, {"engine": engine}, show_results)
 
     except Exception as e:
         messagebox.showerror("Error", f"An error occurred: {e}")
@@ -77,9 +59,17 @@ Label(root, text="Weights (space-separated):").grid(row=2, column=0, sticky="nw"
 text_weights = Text(root, height=5, width=40)
 text_weights.grid(row=2, column=1)
 
+# Επιλογή μηχανής επίλυσης
+Label(root, text="Engine:").grid(row=3, column=0, sticky="w")
+engine_var = StringVar(value="auto")
+OptionMenu(root, engine_var, "auto", "dp", "bb", "pyomo").grid(row=3, column=1, sticky="w")
+
 # Κουμπί επίλυσης
-solve_button = Button(root, text="Solve the problem", command=solve_knapsack)
-solve_button.grid(row=3, column=0, columnspan=2)
+solve_button = Button(root, text="Solve the problem", command=lambda: solve_knapsack(engine=engine_var.get()))
+solve_button.grid(row=4, column=0, columnspan=2)
+
+# Log του solver, χρόνος επίλυσης και Cancel
+panel = solver_panel(root, row=5)
 
 # Εκκίνηση του Tkinter loop
 root.mainloop()
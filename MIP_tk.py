@@ -1,7 +1,8 @@
 from tkinter import *
 from tkinter import messagebox
-import pyomo.environ as pe
-import pyomo.opt as po
+import mip
+from instances import parse_vector
+from gui_worker import run_in_background, solver_panel
 
 
 def solve_mip():
@@ -12,61 +13,28 @@ def solve_mip():
         var_types_input = text_var_types.get("1.0", END).strip()
 
         # Επεξεργασία συνάρτησης στόχου
-        objective = list(map(float, objective_input.split()))
+        objective = parse_vector(objective_input)
         
         # Επεξεργασία περιορισμών
-        constraints = []
-        for line in constraints_input.split("\n"):
-            if line.strip():
-                parts = line.split(",")
-                lhs = list(map(float, parts[0].split()))
-                sense = parts[1].strip()
-                rhs = float(parts[2].strip())
-                constraints.append((lhs, sense, rhs))
+        constraints = mip.parse_constraints(constraints_input)
         
         # Επεξεργασία τύπων μεταβλητών
         var_types = var_types_input.split()
 
-        # Δημιουργία του μοντέλου Pyomo
-        model = pe.ConcreteModel()
-
-        # Δημιουργία μεταβλητών
-        model.vars = pe.Var(range(len(var_types)), domain=pe.Reals)
-        for i, var_type in enumerate(var_types):
-            if var_type == 'binary':
-                model.vars[i].domain = pe.Binary
-            elif var_type == 'integer':
-                model.vars[i].domain = pe.Integers
-
-        # Προσθήκη συνάρτησης στόχου
-        model.obj = pe.Objective(
-            expr=sum(objective[i] * model.vars[i] for i in range(len(objective))),
-            sense=pe.minimize,
-        )
-
-        # Προσθήκη περιορισμών
-        model.constraints = pe.ConstraintList()
-        for lhs, sense, rhs in constraints:
-            if sense == '<=':
-                model.constraints.add(sum(lhs[i] * model.vars[i] for i in range(len(lhs))) <= rhs)
-            elif sense == '>=':
-                model.constraints.add(sum(lhs[i] * model.vars[i] for i in range(len(lhs))) >= rhs)
-            elif sense == '==':
-                model.constraints.add(sum(lhs[i] * model.vars[i] for i in range(len(lhs))) == rhs)
-
-        # Επίλυση
-        solver = po.SolverFactory('glpk')
-        result = solver.solve(model)
-
-        # Ανάγνωση αποτελεσμάτων
-        if result.solver.termination_condition == pe.TerminationCondition.optimal:
-            solution = {f"x{i}": pe.value(var) for i, var in enumerate(model.vars.values())}
-            total_cost = pe.value(model.obj)
-            result_text = f"Optimal Solution Found!\n\nObjective Value: {total_cost}\nVariables:\n"
-            result_text += "\n".join([f"{var} = {value}" for var, value in solution.items()])
-            messagebox.showinfo("Results", result_text)
-        else:
-            messagebox.showerror("Error", "No optimal solution found.")
+        # Εμφάνιση αποτελεσμάτων όταν τελειώσει η επίλυση
+        def show_results(result):
+            # Ανάγνωση αποτελεσμάτων
+            if result["status"] == "optimal":
+                solution = {f"x{i}": value for i, value in enumerate(result["values"])}
+                total_cost = result["objective"]
+                result_text = f"Optimal Solution Found!\n\nObjective Value: {total_cost}\nVariables:\n"
+                result_text += "\n".join([f"{var} = {value}" for var, value in solution.items()])
+                messagebox.showinfo("Results", result_text)
+            else:
+                messagebox.showerror("Error", "No optimal solution found.")
+
+        # Επίλυση στο παρασκήνιο, ώστε το παράθυρο να μην παγώνει
+        run_in_background(panel, "mip", {"objective": objective, "constraints": constraints, "var_types": var_types}, {}, show_results)
 
     except Exception as e:
         messagebox.showerror("Error", f"An error occurred: {e}")
@@ -93,5 +61,8 @@ text_var_types.grid(row=5, column=0, padx=10, pady=5)
 solve_button = Button(root, text="Solve MIP Problem", command=solve_mip)
 solve_button.grid(row=6, column=0, pady=10)
 
+# Log του solver, χρόνος επίλυσης και Cancel
+panel = solver_panel(root, row=7, columnspan=1)
+
 # Εκκίνηση της εφαρμογής
 root.mainloop()
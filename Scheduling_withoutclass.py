@@ -1,7 +1,7 @@
 from tkinter import *
 from tkinter import messagebox
-import pyomo.environ as pe
-import pyomo.opt as po
+from instances import parse_vector
+from gui_worker import run_in_background, solver_panel
 
 # Συνάρτηση για την επίλυση του Scheduling Problem
 def solve_scheduling():
@@ -12,73 +12,30 @@ def solve_scheduling():
         task_durations_input = text_task_durations.get("1.0", END).strip()
 
         # Μετατροπή δεδομένων
-        task_durations = list(map(float, task_durations_input.split()))
+        task_durations = parse_vector(task_durations_input)
 
         # Έλεγχος δεδομένων
         if len(task_durations) != num_tasks:
             raise ValueError("The number of task durations must match the number of tasks.")
 
-        # Δημιουργία μοντέλου Pyomo
-        model = pe.ConcreteModel()
+        # Εμφάνιση αποτελεσμάτων όταν τελειώσει η επίλυση
+        def show_results(result):
+            if result["status"] != "optimal":
+                raise ValueError("No optimal solution found.")
 
-        # Σετ εργασιών και μηχανών
-        model.tasks = pe.Set(initialize=range(num_tasks))
-        model.machines = pe.Set(initialize=range(num_machines))
+            # Ανάγνωση αποτελεσμάτων
+            total_makespan = result["makespan"]
+            schedule = [
+                f"Task {item['task']+1} -> Machine {item['machine']+1} (Start: {item['start']})"
+                for item in result["schedule"]
+            ]
 
-        # Μεταβλητές απόφασης
-        model.start_time = pe.Var(model.tasks, domain=pe.NonNegativeReals)  # Χρόνος έναρξης εργασίας
-        model.machine_assignment = pe.Var(model.tasks, model.machines, domain=pe.Binary)  # Ανάθεση μηχανής
+            # Εμφάνιση αποτελεσμάτων
+            result_text = f"Total Makespan: {total_makespan}\n\nSchedule:\n" + "\n".join(schedule)
+            messagebox.showinfo("Results", result_text)
 
-        # Μεταβλητή για το makespan (συνολικό χρόνο ολοκλήρωσης)
-        model.makespan = pe.Var(domain=pe.NonNegativeReals)
-
-        # Συνάρτηση στόχου: Ελαχιστοποίηση του makespan
-        def objective_rule(model):
-            return model.makespan
-        
-        model.obj = pe.Objective(rule=objective_rule, sense=pe.minimize)
-
-        # Περιορισμός: Κάθε εργασία πρέπει να εκτελείται από μία μηχανή
-        def task_assignment_rule(model, t):
-            return sum(model.machine_assignment[t, m] for m in model.machines) == 1
-        
-        model.task_constraints = pe.Constraint(model.tasks, rule=task_assignment_rule)
-
-        # Περιορισμός: Καμία εργασία δεν ξεκινά πριν να έχει εκχωρηθεί σε μηχανή
-        def start_time_rule(model, t):
-            return model.start_time[t] >= 0
-        
-        model.start_time_constraints = pe.Constraint(model.tasks, rule=start_time_rule)
-
-        # Περιορισμός: Εργασίες που εκτελούνται στην ίδια μηχανή δεν επικαλύπτονται
-        def no_overlap_rule(model, t1, t2, m):
-            if t1 != t2:
-                return model.start_time[t1] + task_durations[t1] * model.machine_assignment[t1, m] <= model.start_time[t2] + (1 - model.machine_assignment[t2, m]) * 1e6
-            return pe.Constraint.Skip
-        
-        model.no_overlap_constraints = pe.Constraint(model.tasks, model.tasks, model.machines, rule=no_overlap_rule)
-
-        # Περιορισμός: Ο makespan είναι μεγαλύτερος ή ίσος από το χρόνο ολοκλήρωσης κάθε εργασίας
-        def makespan_rule(model, t):
-            return model.makespan >= model.start_time[t] + sum(model.machine_assignment[t, m] * task_durations[t] for m in model.machines)
-        
-        model.makespan_constraints = pe.Constraint(model.tasks, rule=makespan_rule)
-
-        # Επίλυση
-        solver = po.SolverFactory('glpk')
-        result = solver.solve(model, tee=True)
-
-        # Ανάγνωση αποτελεσμάτων
-        schedule = []
-        total_makespan = pe.value(model.makespan)
-        for t in model.tasks:
-            assigned_machine = next(m for m in model.machines if pe.value(model.machine_assignment[t, m]) == 1)
-            start_time = pe.value(model.start_time[t])
-            schedule.append(f"Task {t+1} -> Machine {assigned_machine+1} (Start: {start_time})")
-
-        # Εμφάνιση αποτελεσμάτων
-        result_text = f"Total Makespan: {total_makespan}\n\nSchedule:\n" + "\n".join(schedule)
-        messagebox.showinfo("Results", result_text)
+        # Επίλυση στο παρασκήνιο, ώστε το παράθυρο να μην παγώνει
+        run_in_background(panel, "scheduling", {"durations": task_durations, "num_machines": num_machines}, {}, show_results)
 
     except Exception as e:
         messagebox.showerror("Error", f"An error occurred: {e}")
@@ -104,5 +61,8 @@ text_task_durations.grid(row=2, column=1)
 solve_button = Button(root, text="Solve the problem", command=solve_scheduling)
 solve_button.grid(row=3, column=0, columnspan=2)
 
+# Log του solver, χρόνος επίλυσης και Cancel
+panel = solver_panel(root, row=4)
+
 # Εκκίνηση του Tkinter loop
 root.mainloop()
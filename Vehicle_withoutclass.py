@@ -1,10 +1,11 @@
 from tkinter import *
 from tkinter import messagebox
-import pyomo.environ as pe
-import pyomo.opt as po
+from instances import input_array, parse_vector
+from gui_worker import file_input, run_in_background, solver_panel
 
 # Συνάρτηση για την επίλυση του VRP
-def solve_vrp():
+# engine="pyomo": ακριβής επίλυση με GLPK, engine="lns": ευρετική επίλυση για μεγάλα instances
+def solve_vrp(engine="pyomo"):
     try:
         # Ανάγνωση δεδομένων από το GUI
         num_customers = int(entry_num_customers.get())
@@ -13,79 +14,28 @@ def solve_vrp():
         demand_input = text_demand.get("1.0", END).strip()
         cost_input = text_costs.get("1.0", END).strip()
 
-        # Μετατροπή δεδομένων
-        demands = list(map(int, demand_input.split()))
-        costs = [
-            list(map(float, row.split()))
-            for row in cost_input.split("\n") if row.strip()
-        ]
-
-        # Έλεγχος δεδομένων
-        if len(demands) != num_customers or len(costs) != num_customers + 1 or any(len(row) != num_customers + 1 for row in costs):
-            raise ValueError("The demand vector or cost matrix is not correctly formatted.")
-
-        # Δημιουργία μοντέλου Pyomo
-        model = pe.ConcreteModel()
-
-        # Σετ πελατών και κόμβων (πελάτες + αποθήκη)
-        model.customers = pe.Set(initialize=range(1, num_customers + 1))
-        model.nodes = pe.Set(initialize=range(num_customers + 1))  # 0 = αποθήκη
-        model.vehicles = pe.Set(initialize=range(num_vehicles))
-
-        # Μεταβλητές απόφασης
-        model.x = pe.Var(model.nodes, model.nodes, model.vehicles, domain=pe.Binary)  # Αν το όχημα k πάει από i σε j
-        model.load = pe.Var(model.nodes, domain=pe.NonNegativeReals)  # Φορτίο που μεταφέρει το όχημα στο κόμβο i
-
-        # Συνάρτηση στόχου: Ελαχιστοποίηση κόστους
-        def objective_rule(model):
-            return sum(model.x[i, j, k] * costs[i][j] for i in model.nodes for j in model.nodes for k in model.vehicles if i != j)
-
-        model.obj = pe.Objective(rule=objective_rule, sense=pe.minimize)
-
-        # Περιορισμός: Κάθε πελάτης εξυπηρετείται ακριβώς μία φορά
-        def visit_customer_rule(model, j):
-            return sum(model.x[i, j, k] for i in model.nodes if i != j for k in model.vehicles) == 1
-
-        model.visit_constraints = pe.Constraint(model.customers, rule=visit_customer_rule)
-
-        # Περιορισμός: Ροή οχημάτων (αρχή και τέλος στην αποθήκη)
-        def flow_balance_rule(model, i, k):
-            if i == 0:  # Αποθήκη
-                return sum(model.x[0, j, k] for j in model.customers) == 1
-            elif i in model.customers:
-                return sum(model.x[i, j, k] for j in model.nodes if i != j) == sum(
-                    model.x[j, i, k] for j in model.nodes if i != j
-                )
-            else:
-                return pe.Constraint.Skip
-
-        model.flow_constraints = pe.Constraint(model.nodes, model.vehicles, rule=flow_balance_rule)
-
-        # Περιορισμός: Χωρητικότητα οχημάτων
-        def capacity_rule(model, j, k):
-            return model.load[j] >= demands[j - 1] if j > 0 else pe.Constraint.Skip
-
-        model.capacity_constraints = pe.Constraint(model.nodes, model.vehicles, rule=capacity_rule)
-
-        # Επίλυση
-        solver = po.SolverFactory('glpk')
-        result = solver.solve(model, tee=True)
-
-        # Ανάγνωση αποτελεσμάτων
-        routes = []
-        total_cost = pe.value(model.obj)
-        for k in model.vehicles:
-            route = []
-            for i in model.nodes:
-                for j in model.nodes:
-                    if i != j and pe.value(model.x[i, j, k]) == 1:
-                        route.append((i, j))
-            if route:
-                routes.append(f"Vehicle {k+1}: " + " -> ".join(f"{i}->{j}" for i, j in route))
-
-        # Εμφάνιση αποτελεσμάτων
-        result_text = f"Total Cost: {total_cost}\n\nRoutes:\n" + "\n".join(routes)
-        messagebox.showinfo("Results", result_text)
+        # Δεδομένα από τα πεδία κειμένου ή ονόματα αρχείων, με έλεγχο διαστάσεων
+        demands = input_array(demand_input, demand_file["path"], (num_customers,), "The demand vector", parse=parse_vector)
+        costs = input_array(cost_input, costs_file["path"], (num_customers + 1, num_customers + 1), "The cost matrix")
+
+        # Εμφάνιση αποτελεσμάτων όταν τελειώσει η επίλυση
+        def show_results(result):
+            if result["status"] not in ("optimal", "feasible"):
+                raise ValueError("No feasible solution found.")
+
+            # Ανάγνωση αποτελεσμάτων
+            total_cost = result["total_cost"]
+            routes = [
+                f"Vehicle {route['vehicle']+1}: " + " -> ".join(f"{i}->{j}" for i, j in route["arcs"])
+                for route in result["routes"]
+            ]
+
+            # Εμφάνιση αποτελεσμάτων
+            result_text = f"Total Cost: {total_cost}\n\nRoutes:\n" + "\n".join(routes)
+            messagebox.showinfo("Results", result_text)
+
+        # Επίλυση στο παρασκήνιο, ώστε το παράθυρο να μην παγώνει
+        run_in_background(panel, "vrp", {"demands": demands, "costs": costs, "num_vehicles": num_vehicles, "capacity": capacity}, {"engine": engine}, show_results)
 
     except Exception as e:
         messagebox.showerror("Error", f"An error occurred: {e}")
@@ -110,14 +60,24 @@ entry_vehicle_capacity.grid(row=2, column=1)
 Label(root, text="Demand per Customer (space-separated):").grid(row=3, column=0, sticky="nw")
 text_demand = Text(root, height=5, width=40)
 text_demand.grid(row=3, column=1)
+demand_file = file_input(root, row=3)
 
 Label(root, text="Cost Matrix (space-separated rows):").grid(row=4, column=0, sticky="nw")
 text_costs = Text(root, height=10, width=40)
 text_costs.grid(row=4, column=1)
+costs_file = file_input(root, row=4)
+
+# Επιλογή μηχανής επίλυσης
+Label(root, text="Engine:").grid(row=5, column=0, sticky="w")
+engine_var = StringVar(value="pyomo")
+OptionMenu(root, engine_var, "pyomo", "lns").grid(row=5, column=1, sticky="w")
 
 # Κουμπί επίλυσης
-solve_button = Button(root, text="Solve the problem", command=solve_vrp)
-solve_button.grid(row=5, column=0, columnspan=2)
+solve_button = Button(root, text="Solve the problem", command=lambda: solve_vrp(engine=engine_var.get()))
+solve_button.grid(row=6, column=0, columnspan=2)
+
+# Log του solver, χρόνος επίλυσης και Cancel
+panel = solver_panel(root, row=7, columnspan=3)
 
 # Εκκίνηση του Tkinter loop
 root.mainloop()
@@ -0,0 +1,182 @@
+import numpy as np
+import pyomo.environ as pe
+
+from model_templates import get_template, solve_template
+from solution_arrays import selected_indices
+from solve_metrics import phase
+from solver_backends import solve_model
+
+
+# Αλγόριθμος Hungarian (shortest augmenting path, O(n^3)) πάνω σε πίνακα κόστους NumPy.
+# Επιστρέφει (rows, cols) ώστε ο εργάτης rows[k] να αναλαμβάνει την εργασία cols[k].
+def hungarian(costs):
+    costs = np.asarray(costs, dtype=float)
+    if costs.ndim != 2:
+        raise ValueError("The cost table must be two-dimensional.")
+    if not np.isfinite(costs).all():
+        raise ValueError("The cost table must contain only finite values.")
+
+    # Ο αλγόριθμος δουλεύει με γραμμές <= στήλες, οπότε αναστρέφουμε αν χρειάζεται
+    transposed = costs.shape[0] > costs.shape[1]
+    if transposed:
+        costs = costs.T
+    n, m = costs.shape
+
+    # Δυναμικά γραμμών/στηλών και αντιστοίχιση στήλης -> γραμμής (1-based, 0 = ελεύθερη)
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    p = np.zeros(m + 1, dtype=np.intp)
+    way = np.zeros(m + 1, dtype=np.intp)
+
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+
+        # Αναζήτηση συντομότερου επαυξάνοντος μονοπατιού από τη γραμμή i
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            free = ~used[1:]
+            reduced = costs[i0 - 1] - u[i0] - v[1:]
+            better = free & (reduced < minv[1:])
+            minv[1:][better] = reduced[better]
+            way[1:][better] = j0
+
+            candidates = np.where(free, minv[1:], np.inf)
+            j1 = int(np.argmin(candidates)) + 1
+            delta = candidates[j1 - 1]
+
+            u[p[used]] += delta
+            v[used] -= delta
+            minv[~used] -= delta
+
+            j0 = j1
+            if p[j0] == 0:
+                break
+
+        # Επαύξηση της αντιστοίχισης κατά μήκος του μονοπατιού
+        while j0 != 0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+
+    cols = np.nonzero(p[1:])[0]
+    rows = p[1:][cols] - 1
+    if transposed:
+        rows, cols = cols, rows
+    order = np.argsort(rows)
+    return rows[order], cols[order]
+
+
+# Δημιουργία μοντέλου Pyomo για το Assignment Problem.
+# side_constraints: λίστα από συναρτήσεις rule(model) που επιστρέφουν επιπλέον περιορισμούς
+# mutable=True: τα κόστη μπαίνουν σε mutable Param, ώστε το μοντέλο να ξαναλύνεται με νέες τιμές
+def build_assignment_model(costs, side_constraints=None, mutable=False):
+    costs = np.asarray(costs, dtype=float)
+    c = costs.tolist()
+    model = pe.ConcreteModel()
+
+    # Σετ εργατών και εργασιών
+    model.workers = pe.Set(initialize=range(costs.shape[0]))
+    model.tasks = pe.Set(initialize=range(costs.shape[1]))
+
+    # Μεταβλητές ανάθεσης (binary)
+    model.x = pe.Var(model.workers, model.tasks, domain=pe.Binary)
+
+    if mutable:
+        model.cost = pe.Param(model.workers, model.tasks, mutable=True, initialize=lambda model, w, t: c[w][t])
+
+    # Συνάρτηση στόχου: Ελαχιστοποίηση κόστους
+    def objective_rule(model):
+        if mutable:
+            return sum(model.x[w, t] * model.cost[w, t] for w in model.workers for t in model.tasks)
+        return sum(model.x[w, t] * c[w][t] for w in model.workers for t in model.tasks)
+
+    model.obj = pe.Objective(rule=objective_rule, sense=pe.minimize)
+
+    # Περιορισμός: Κάθε εργάτης αναλαμβάνει ακριβώς μία εργασία
+    def worker_constraint_rule(model, w):
+        return sum(model.x[w, t] for t in model.tasks) == 1
+
+    model.worker_constraints = pe.Constraint(model.workers, rule=worker_constraint_rule)
+
+    # Περιορισμός: Κάθε εργασία ανατίθεται σε ακριβώς έναν εργάτη
+    def task_constraint_rule(model, t):
+        return sum(model.x[w, t] for w in model.workers) == 1
+
+    model.task_constraints = pe.Constraint(model.tasks, rule=task_constraint_rule)
+
+    # Επιπλέον περιορισμοί που δίνει ο χρήστης
+    model.side_constraints = pe.ConstraintList()
+    for rule in side_constraints or []:
+        model.side_constraints.add(rule(model))
+
+    return model
+
+
+# Νέα κόστη σε μοντέλο που χτίστηκε με mutable=True (ίδιες διαστάσεις)
+def set_assignment_costs(model, costs):
+    values = np.asarray(costs, dtype=float).ravel().tolist()
+    for param, value in zip(model.cost.values(), values):
+        param.set_value(value)
+
+
+# Ανάγνωση αποτελεσμάτων από λυμένο μοντέλο (δείκτες με αρίθμηση από το 0). Με τον πίνακα
+# costs το κόστος υπολογίζεται από τις αναθέσεις, χωρίς να αποτιμηθεί η συνάρτηση στόχου του
+# μοντέλου (ένας όρος ανά μεταβλητή).
+def extract_assignment(model, costs=None):
+    assignments = selected_indices(model.x)
+    if costs is None:
+        total_cost = pe.value(model.obj)
+    else:
+        rows, cols = np.array(assignments, dtype=np.intp).reshape(-1, 2).T
+        total_cost = float(np.asarray(costs, dtype=float)[rows, cols].sum())
+    return {"total_cost": total_cost, "assignments": assignments}
+
+
+# Επίλυση του Assignment Problem χωρίς GUI: πίνακας κόστους μέσα, αποτέλεσμα ως dict έξω.
+# engine="hungarian": απευθείας επίλυση με τον αλγόριθμο Hungarian (χωρίς Pyomo/GLPK),
+# εκτός αν υπάρχουν side_constraints, οπότε χρησιμοποιείται το μοντέλο Pyomo.
+# reuse_model=True: το μοντέλο Pyomo χτίζεται μία φορά ανά διάσταση και solver και στις
+# επόμενες κλήσεις αλλάζουν μόνο τα κόστη (με persistent solver μένει και ο solver φορτωμένος).
+# engine="matrix": μοντέλο πινάκων (matrix_models) χωρίς αντικείμενα Pyomo, για πολύ μεγάλα n.
+def solve_assignment(costs, engine="pyomo", side_constraints=None, solver="glpk", tee=False, reuse_model=False):
+    costs = np.asarray(costs, dtype=float)
+    if costs.ndim != 2 or costs.shape[0] != costs.shape[1]:
+        raise ValueError("The Assignment Problem requires an equal number of workers and jobs.")
+    if engine not in ("pyomo", "hungarian", "matrix"):
+        raise ValueError(f"Unknown engine: {engine}")
+
+    if engine == "matrix":
+        if side_constraints:
+            raise ValueError("Side constraints require the pyomo engine.")
+        from matrix_models import solve_assignment_matrix
+
+        return solve_assignment_matrix(costs, solver, tee)
+
+    if engine == "hungarian" and not side_constraints:
+        rows, cols = hungarian(costs)
+        return {
+            "status": "optimal",
+            "total_cost": float(costs[rows, cols].sum()),
+            "assignments": list(zip(rows.tolist(), cols.tolist())),
+        }
+
+    if reuse_model and not side_constraints:
+        key = ("assignment", costs.shape, solver)
+        with phase("build"):
+            template, created = get_template(key, lambda: build_assignment_model(costs, mutable=True), solver)
+            model = template["model"]
+            if not created:
+                set_assignment_costs(model, costs)
+        status = solve_template(template, tee)
+    else:
+        with phase("build"):
+            model = build_assignment_model(costs, side_constraints)
+        status = solve_model(model, solver, tee)
+    if status != "optimal":
+        return {"status": status, "total_cost": None, "assignments": []}
+    with phase("format"):
+        return {"status": status, **extract_assignment(model, None if side_constraints else costs)}
@@ -0,0 +1,184 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import signal
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+import problems
+from instances import ARRAY_EXTENSIONS, MIP_EXTENSIONS, json_default, load_instance
+
+INSTANCE_EXTENSIONS = (".json",) + ARRAY_EXTENSIONS + MIP_EXTENSIONS
+
+
+# Όλα τα αρχεία instances: τα directories σαρώνονται με ταξινομημένη σειρά
+def collect_instances(paths):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if os.path.splitext(name)[1].lower() in INSTANCE_EXTENSIONS:
+                    files.append(os.path.join(path, name))
+        else:
+            files.append(path)
+    return files
+
+
+def _on_timeout(signum, frame):
+    raise TimeoutError
+
+
+# Επίλυση ενός instance μέσα σε worker process. Το όριο χρόνου εφαρμόζεται με SIGALRM
+# (όπου υπάρχει): η εξαίρεση διακόπτει το build/solve και τερματίζει και τη διεργασία του solver.
+def _solve_one(index, path, problem, options, time_limit):
+    record = {"index": index, "instance": path, "problem": problem}
+    start = time.perf_counter()
+    use_alarm = time_limit is not None and hasattr(signal, "SIGALRM")
+    try:
+        if use_alarm:
+            signal.signal(signal.SIGALRM, _on_timeout)
+            signal.setitimer(signal.ITIMER_REAL, time_limit)
+        problem, instance = load_instance(path, problem)
+        record["problem"] = problem
+
+        # Το log του solver δεν χρειάζεται στο batch
+        with contextlib.redirect_stdout(io.StringIO()):
+            record["result"] = problems.solve(problem, instance, **options)
+    except TimeoutError:
+        record["error"] = f"Time limit of {time_limit} s exceeded."
+        record["timed_out"] = True
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    record["elapsed"] = time.perf_counter() - start
+    return record
+
+
+# Εγγραφές που έχουν ήδη ολοκληρωθεί σε προηγούμενη εκτέλεση (ανά αρχείο instance)
+def read_manifest(path):
+    done = {}
+    if path and os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # μισογραμμένη τελευταία γραμμή από διακοπή
+                done[record["instance"]] = record
+    return done
+
+
+# Επίλυση ενός instance σε δική του διεργασία, για instances που ήταν σε εξέλιξη όταν κάποιος
+# worker τερματίστηκε απότομα (π.χ. από τον OOM killer): έτσι φαίνεται ποιο instance τον τερμάτισε
+def _solve_isolated(index, path, problem, options, time_limit):
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        try:
+            return executor.submit(_solve_one, index, path, problem, options, time_limit).result()
+        except BrokenProcessPool as e:
+            return {"index": index, "instance": path, "problem": problem, "error": f"Worker crashed: {e}"}
+
+
+# Επίλυση πολλών instances σε ProcessPoolExecutor. Κάθε ολοκληρωμένο instance γράφεται αμέσως
+# στο manifest, ώστε μια διακοπείσα εκτέλεση να συνεχίσει από εκεί που σταμάτησε.
+# Επιστρέφει τις εγγραφές με τη σειρά υποβολής. Σφάλματα δεν σταματούν το batch: αν ένας worker
+# τερματιστεί απότομα, το pool ξαναδημιουργείται, τα instances που έτρεχαν εκείνη τη στιγμή
+# ξαναλύνονται το καθένα μόνο του και τα υπόλοιπα συνεχίζουν κανονικά.
+def run_batch(paths, problem=None, workers=None, time_limit=None, manifest=None, retry_failed=False, **options):
+    files = collect_instances(paths)
+    previous = read_manifest(manifest)
+    if retry_failed:
+        previous = {path: record for path, record in previous.items() if "error" not in record}
+
+    records = [None] * len(files)
+    pending = []
+    for index, path in enumerate(files):
+        if path in previous:
+            records[index] = dict(previous[path], index=index)
+        else:
+            pending.append((index, path))
+
+    manifest_file = open(manifest, "a", encoding="utf-8") if manifest else None
+
+    def finish(record):
+        records[record["index"]] = record
+        # Instance που τερμάτισε τον worker δεν γράφεται στο manifest, ώστε να ξαναλυθεί
+        if manifest_file and not record.get("error", "").startswith("Worker crashed"):
+            manifest_file.write(json.dumps(record, default=json_default) + "\n")
+            manifest_file.flush()
+
+    # Το πολύ ένα instance ανά worker σε εξέλιξη: όταν σπάσει το pool, ύποπτα είναι μόνο αυτά
+    limit = workers or os.cpu_count() or 1
+    queue = deque(pending)
+    try:
+        while queue:
+            suspects = []
+            with ProcessPoolExecutor(max_workers=limit) as executor:
+                running = {}
+                while queue or running:
+                    while queue and len(running) < limit:
+                        index, path = queue.popleft()
+                        future = executor.submit(_solve_one, index, path, problem, options, time_limit)
+                        running[future] = (index, path)
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index, path = running.pop(future)
+                        try:
+                            finish(future.result())
+                        except BrokenProcessPool:
+                            suspects.append((index, path))
+                    if suspects:
+                        suspects.extend(running.values())
+                        break
+            for index, path in suspects:
+                finish(_solve_isolated(index, path, problem, options, time_limit))
+    finally:
+        if manifest_file:
+            manifest_file.close()
+
+    return records
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve directories of instances in parallel.")
+    parser.add_argument("paths", nargs="+", help="instance files or directories")
+    parser.add_argument("--problem", choices=sorted(problems.SOLVERS), help="problem type for files that do not name it")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes (default: all cores)")
+    parser.add_argument("--time-limit", type=float, default=None, help="time limit per instance in seconds")
+    parser.add_argument("--manifest", help="JSON lines file of finished instances; an existing one is resumed")
+    parser.add_argument("--retry-failed", action="store_true", help="solve again the instances that failed before")
+    parser.add_argument("--output", help="write the results in submission order to this file instead of stdout")
+    parser.add_argument("--engine", help="solution engine, e.g. pyomo, hungarian, dp, bb")
+    parser.add_argument("--solver", help="Pyomo solver name, e.g. glpk")
+    args = parser.parse_args(argv)
+
+    options = {}
+    if args.engine:
+        options["engine"] = args.engine
+    if args.solver:
+        options["solver"] = args.solver
+
+    records = run_batch(args.paths, args.problem, args.workers, args.time_limit,
+                        args.manifest, args.retry_failed, **options)
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for record in records:
+            out.write(json.dumps(record, default=json_default) + "\n")
+    finally:
+        if args.output:
+            out.close()
+
+    failures = sum(1 for record in records if "error" in record)
+    print(f"{len(records) - failures} solved, {failures} failed", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,376 @@
+import argparse
+import json
+import math
+import multiprocessing
+import platform
+import sys
+import time
+
+import numpy as np
+
+from instances import json_default
+
+# Πόσο πιο αργή (λόγος) και πόσα δευτερόλεπτα τουλάχιστον πρέπει να είναι μια φάση για να
+# θεωρηθεί regression σε σχέση με το baseline
+REGRESSION_RATIO = 1.25
+REGRESSION_SECONDS = 0.05
+
+# Φάσεις που μετρώνται για τη μηχανή "pyomo"· οι άλλες μηχανές μετρώνται μόνο ως "solve"
+PHASES = ("build", "io", "solve", "extract")
+
+
+# Γεννήτριες τυχαίων instances: (rng, scale) -> dict με τα ορίσματα του solve_* του προβλήματος.
+# Το μέγεθος μεγαλώνει γραμμικά με το scale.
+def generate_assignment(rng, scale):
+    n = 20 * scale
+    return {"costs": rng.integers(1, 100, (n, n)).tolist()}
+
+
+def generate_knapsack(rng, scale):
+    n = 100 * scale
+    weights = rng.integers(1, 50, n)
+    return {
+        "values": (weights + rng.integers(0, 20, n)).tolist(),
+        "weights": weights.tolist(),
+        "capacity": int(weights.sum() // 3),
+    }
+
+
+# Generalized assignment με τη μορφή του exercise_1.py: εργάτες, εργασίες, κόστος/ώρες ανά ζεύγος
+def generate_gap(rng, scale):
+    num_workers, num_tasks = 3 * scale, 10 * scale
+    workers = [f"W{w}" for w in range(num_workers)]
+    tasks = list(range(1, num_tasks + 1))
+    c = {}
+    for t in tasks:
+        eligible = rng.choice(num_workers, size=min(num_workers, 2 + int(rng.integers(0, 2))), replace=False)
+        for w in eligible:
+            c[(workers[w], t)] = int(rng.integers(1, 25))
+    max_hours = math.ceil(1.5 * sum(c.values()) / len(c) * num_tasks / num_workers)
+    return {"workers": workers, "tasks": tasks, "c": c, "max_hours": max_hours}
+
+
+def generate_scheduling(rng, scale):
+    return {"durations": rng.integers(1, 100, 20 * scale).tolist(), "num_machines": 2 + scale}
+
+
+def generate_facility(rng, scale):
+    num_facilities, num_clients = 10 * scale, 50 * scale
+    facilities = rng.uniform(0, 100, (num_facilities, 2))
+    clients = rng.uniform(0, 100, (num_clients, 2))
+    return {
+        "facility_costs": rng.uniform(100, 300, num_facilities).tolist(),
+        "transport_costs": np.linalg.norm(facilities[:, None] - clients[None], axis=2).tolist(),
+    }
+
+
+def generate_vrp(rng, scale):
+    num_customers = 4 + 2 * scale
+    points = rng.uniform(0, 100, (num_customers + 1, 2))
+    demands = rng.integers(1, 10, num_customers)
+    capacity = 25
+    return {
+        "demands": demands.tolist(),
+        "costs": np.linalg.norm(points[:, None] - points[None], axis=2).tolist(),
+        "num_vehicles": int(math.ceil(demands.sum() / capacity)) + 1,
+        "capacity": capacity,
+    }
+
+
+# Γενικό MIP σε μορφή πίνακα (sparse_mip): max c'x με Ax <= b, A >= 0 με ~5 μη μηδενικά ανά γραμμή
+def generate_sparse_mip(rng, scale):
+    num_vars, num_rows = 30 * scale, 20 * scale
+    per_row = min(5, num_vars)
+    rows = np.repeat(np.arange(num_rows), per_row)
+    columns = np.concatenate([rng.choice(num_vars, per_row, replace=False) for _ in range(num_rows)])
+    values = rng.integers(1, 10, len(rows)).astype(float)
+    return {
+        "objective": (-rng.integers(1, 20, num_vars)).astype(float).tolist(),
+        "matrix": (rows.tolist(), columns.tolist(), values.tolist()),
+        "senses": ["<="] * num_rows,
+        "rhs": rng.integers(10, 40, num_rows).astype(float).tolist(),
+        "var_types": rng.choice(["integer", "continuous"], num_vars).tolist(),
+        "lower": [0.0] * num_vars,
+        "upper": [10.0] * num_vars,
+    }
+
+
+# Το ίδιο MIP με πυκνές γραμμές για το mip.solve_mip (τα όρια γίνονται περιορισμοί)
+def generate_mip(rng, scale):
+    sparse = generate_sparse_mip(rng, scale)
+    num_vars = len(sparse["objective"])
+    constraints = [([0.0] * num_vars, sense, rhs) for sense, rhs in zip(sparse["senses"], sparse["rhs"])]
+    for r, j, value in zip(*sparse["matrix"]):
+        constraints[r][0][j] = value
+    for j in range(num_vars):
+        unit = [0.0] * num_vars
+        unit[j] = 1.0
+        constraints += [(unit, ">=", 0.0), (unit, "<=", 10.0)]
+    return {"objective": sparse["objective"], "constraints": constraints, "var_types": sparse["var_types"]}
+
+
+GENERATORS = {
+    "assignment": generate_assignment,
+    "knapsack": generate_knapsack,
+    "gap": generate_gap,
+    "scheduling": generate_scheduling,
+    "facility": generate_facility,
+    "vrp": generate_vrp,
+    "mip": generate_mip,
+    "sparse_mip": generate_sparse_mip,
+}
+
+# Μηχανές ανά πρόβλημα: η πρώτη ("pyomo") μετριέται ανά φάση
+ENGINES = {
+    "assignment": ("pyomo", "hungarian", "matrix"),
+    "knapsack": ("pyomo", "auto"),
+    "gap": ("pyomo", "lagrangian"),
+    "scheduling": ("pyomo", "heuristic"),
+    "facility": ("pyomo", "search", "benders", "matrix"),
+    "vrp": ("pyomo", "lns"),
+    "mip": ("pyomo",),
+    "sparse_mip": ("pyomo",),
+}
+
+# Επιπλέον επιλογές των anytime μηχανών, ώστε να τελειώνουν σε λογικό χρόνο
+ENGINE_OPTIONS = {"lns": {"time_limit": 2.0}, "search": {"time_limit": 10.0}}
+
+
+# Δημιουργία μοντέλου και ανάγνωση λύσης για κάθε πρόβλημα: (build(instance), extract(model))
+def _pipeline(problem):
+    if problem == "assignment":
+        import assignment
+
+        return lambda i: assignment.build_assignment_model(i["costs"]), assignment.extract_assignment
+    if problem == "knapsack":
+        import knapsack
+
+        return (
+            lambda i: knapsack.build_knapsack_model(i["values"], i["weights"], i["capacity"]),
+            knapsack.extract_knapsack,
+        )
+    if problem == "gap":
+        # Το var_series φορτώνει το pandas μόνο όταν χρειαστεί: εδώ, ώστε το import να μη μετρηθεί στο extract
+        import pandas  # noqa: F401
+        from exercise_1 import build_model
+        from solution_arrays import var_series
+
+        def extract(model):
+            x = var_series(model.x)
+            return {"assignment": {t: w for (w, t) in x.index[x > 0.5]}}
+
+        return lambda i: build_model(i["workers"], i["tasks"], i["c"], i["max_hours"], sparse=True), extract
+    if problem == "scheduling":
+        import scheduling
+
+        return (
+            lambda i: scheduling.build_scheduling_model(i["durations"], i["num_machines"]),
+            scheduling.extract_schedule,
+        )
+    if problem == "facility":
+        import facility
+
+        return (
+            lambda i: facility.build_facility_model(i["facility_costs"], i["transport_costs"]),
+            facility.extract_facility_location,
+        )
+    if problem == "vrp":
+        import vrp
+
+        # Ένας γύρος του βρόχου των capacity cuts: το μοντέλο χωρίς cuts και οι διαδρομές/subtours του
+        return (
+            lambda i: vrp.build_vrp_model(*vrp._prepare(i["demands"], i["costs"]), i["num_vehicles"], i["capacity"]),
+            vrp._solution_routes,
+        )
+    if problem == "mip":
+        import mip
+
+        return lambda i: mip.build_mip_model(i["objective"], i["constraints"], i["var_types"]), mip.extract_mip
+    if problem == "sparse_mip":
+        import mip
+
+        return lambda i: mip.build_sparse_mip_model(**i), mip.extract_mip
+    raise ValueError(f"Unknown problem: {problem}")
+
+
+# Επίλυση με μηχανή εκτός Pyomo (ολόκληρη η κλήση μετράει ως "solve")
+def _solve_engine(problem, instance, engine, solver):
+    if problem == "gap":
+        from gap import solve_gap
+
+        result = solve_gap(instance["workers"], instance["tasks"], instance["c"], instance["max_hours"])
+        return "optimal" if result["gap"] <= 1e-4 else "feasible"
+    import problems
+
+    options = dict(ENGINE_OPTIONS.get(engine, {}), engine=engine)
+    if engine in ("benders", "matrix"):
+        options["solver"] = solver
+    return problems.solve(problem, instance, **options)["status"]
+
+
+def _peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Σε macOS σε bytes, σε Linux σε KB
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
+
+
+# Μία μέτρηση (σε ξεχωριστή διεργασία, ώστε η μέγιστη RSS να αφορά μόνο αυτήν)
+def run_case(problem, engine, scale, seed, solver):
+    from solver_backends import create_solver, solve_model
+
+    instance = GENERATORS[problem](np.random.default_rng(seed), scale)
+    record = {"problem": problem, "engine": engine, "scale": scale, "seed": seed, "solver": solver}
+    # Τα imports και η φόρτωση του solver γίνονται πριν από τη μέτρηση
+    if engine == "pyomo":
+        build, extract = _pipeline(problem)
+        create_solver(solver).available()
+    record["rss_start_mb"] = _peak_rss_mb()
+    start = time.perf_counter()
+    if engine == "pyomo":
+        model = build(instance)
+        record["build"] = time.perf_counter() - start
+        timing = {}
+        record["status"] = solve_model(model, solver, timing=timing)
+        record.update(timing)
+        if record["status"] in ("optimal", "feasible"):
+            extracted = time.perf_counter()
+            extract(model)
+            record["extract"] = time.perf_counter() - extracted
+        record["variables"] = model.nvariables()
+        record["constraints"] = model.nconstraints()
+    else:
+        record["status"] = _solve_engine(problem, instance, engine, solver)
+        record["solve"] = time.perf_counter() - start
+    record["total"] = time.perf_counter() - start
+    record["peak_rss_mb"] = _peak_rss_mb()
+    return record
+
+
+def _case_worker(arguments, connection):
+    try:
+        connection.send(run_case(*arguments))
+    except Exception as e:
+        connection.send({"error": f"{type(e).__name__}: {e}"})
+    connection.close()
+
+
+# Όλες οι μετρήσεις, μία-μία καθώς τελειώνουν: κάθε (πρόβλημα, μηχανή, scale, seed) σε νέα διεργασία
+# (spawn) με όριο χρόνου
+def run_suite(problems=None, engines=None, scales=(1, 2, 4), seeds=(0,), solver="highs", time_limit=300.0):
+    context = multiprocessing.get_context("spawn")
+    for problem in problems or GENERATORS:
+        for engine in ENGINES[problem]:
+            if engines and engine not in engines:
+                continue
+            for scale in scales:
+                for seed in seeds:
+                    reader, writer = context.Pipe(duplex=False)
+                    process = context.Process(
+                        target=_case_worker, args=((problem, engine, scale, seed, solver), writer), daemon=True
+                    )
+                    process.start()
+                    writer.close()
+                    base = {"problem": problem, "engine": engine, "scale": scale, "seed": seed, "solver": solver}
+                    if reader.poll(time_limit):
+                        try:
+                            record = reader.recv()
+                        except EOFError:
+                            record = {"error": "The benchmark process exited without a result."}
+                    else:
+                        process.kill()
+                        record = {"status": "timeout"}
+                    process.join()
+                    reader.close()
+                    yield {**base, **record}
+
+
+def _key(record):
+    return (record["problem"], record["engine"], record["scale"], record["seed"], record.get("solver"))
+
+
+# Σύγκριση με baseline: για κάθε κοινή μέτρηση ο λόγος χρόνων ανά φάση. Regression όταν μια φάση
+# είναι πάνω από ratio φορές πιο αργή και τουλάχιστον min_seconds πιο αργή.
+def compare(records, baseline, ratio=REGRESSION_RATIO, min_seconds=REGRESSION_SECONDS):
+    previous = {_key(record): record for record in baseline}
+    comparisons = []
+    for record in records:
+        old = previous.get(_key(record))
+        if old is None:
+            continue
+        for phase in PHASES + ("total",):
+            new_time, old_time = record.get(phase), old.get(phase)
+            if new_time is None or old_time is None:
+                continue
+            comparisons.append({
+                "problem": record["problem"], "engine": record["engine"], "scale": record["scale"],
+                "seed": record["seed"], "phase": phase, "baseline": old_time, "current": new_time,
+                "ratio": new_time / old_time if old_time > 0 else math.inf,
+                "regression": new_time > ratio * old_time and new_time - old_time >= min_seconds,
+            })
+    return comparisons
+
+
+def _environment():
+    import pyomo
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pyomo": pyomo.version.version,
+        "numpy": np.__version__,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def _format(value):
+    return "-" if value is None else f"{value:.3f}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time model building, solver I/O, solving and extraction.")
+    parser.add_argument("--problems", nargs="+", choices=sorted(GENERATORS), help="problem classes (default: all)")
+    parser.add_argument("--engines", nargs="+", help="engines to run (default: all of each problem)")
+    parser.add_argument("--scales", nargs="+", type=int, default=[1, 2, 4], help="instance size multipliers")
+    parser.add_argument("--seeds", nargs="+", type=int, default=[0], help="random seeds")
+    parser.add_argument("--solver", default="highs", help="solver for the pyomo engine")
+    parser.add_argument("--time-limit", type=float, default=300.0, help="seconds per measurement")
+    parser.add_argument("--output", help="JSON file for the results")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare against")
+    args = parser.parse_args(argv)
+
+    records = []
+    print(f"{'problem':<12}{'engine':<12}{'scale':>6}  {'status':<14}" + "".join(f"{p:>9}" for p in PHASES + ("total",))
+          + f"{'RSS MB':>9}")
+    for record in run_suite(args.problems, args.engines, args.scales, args.seeds, args.solver, args.time_limit):
+        records.append(record)
+        status = record.get("status", "error")
+        print(f"{record['problem']:<12}{record['engine']:<12}{record['scale']:>6}  {status:<14}"
+              + "".join(f"{_format(record.get(p)):>9}" for p in PHASES + ("total",))
+              + f"{_format(record.get('peak_rss_mb')):>9}", flush=True)
+        if "error" in record:
+            print(f"    {record['error']}", flush=True)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        comparisons = compare(records, baseline)
+        regressions = [c for c in comparisons if c["regression"]]
+        for c in regressions:
+            print(f"REGRESSION {c['problem']}/{c['engine']} scale {c['scale']} {c['phase']}: "
+                  f"{c['baseline']:.3f} s -> {c['current']:.3f} s ({c['ratio']:.2f}x)")
+    if args.output:
+        output = {"environment": _environment(), "results": records}
+        if args.baseline:
+            output["comparison"] = comparisons
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(output, f, indent=2, default=json_default)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
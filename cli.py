@@ -0,0 +1,110 @@
+import argparse
+import contextlib
+import json
+import sys
+
+import portfolio
+import problems
+import solution_cache
+import solve_metrics
+from instances import instance_from_dict, json_default, load_instance
+
+
+# Πηγές instances: αρχεία ή "-" για γραμμές JSON από το stdin
+def _sources(paths):
+    for path in paths:
+        if path == "-":
+            for number, line in enumerate(sys.stdin, 1):
+                if line.strip():
+                    yield f"<stdin>:{number}", line
+        else:
+            yield path, None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Solve optimization instances without the GUI and print one JSON line per instance."
+    )
+    parser.add_argument("instances", nargs="+", help="instance files (.json, .csv, .npy, .parquet, .mps, .lp) or - for JSON lines on stdin")
+    parser.add_argument("--problem", choices=sorted(problems.SOLVERS), help="problem type for files that do not name it")
+    parser.add_argument("--engine", help="solution engine, e.g. pyomo, hungarian, matrix, dp, bb")
+    parser.add_argument("--solver", help="Pyomo solver name, e.g. glpk; 'portfolio' races several solvers, "
+                                         "'auto' uses the solver that won most portfolio races for the problem")
+    parser.add_argument("--portfolio-solvers", metavar="SOLVER,...",
+                        help="comma-separated solvers raced by --solver portfolio (default: all installed)")
+    parser.add_argument("--time-limit", type=float, default=60.0,
+                        help="seconds before --solver portfolio returns the best finished solution")
+    parser.add_argument("--tee", action="store_true", help="print the solver log to stderr")
+    parser.add_argument("--reuse-model", action="store_true",
+                        help="keep one Pyomo model per problem size and only update its parameters")
+    parser.add_argument("--cache", action="store_true", help="reuse solutions of identical instances")
+    parser.add_argument("--cache-db", help="SQLite file that keeps cached solutions between runs (implies --cache)")
+    parser.add_argument("--metrics-log", metavar="PATH",
+                        help="append one JSON line with timings, model size and termination per solve (- for stderr)")
+    parser.add_argument("--metrics-file", metavar="PATH", help="Prometheus text-format snapshot rewritten after every solve")
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE",
+                        help="extra instance field; VALUE is parsed as JSON")
+    args = parser.parse_args(argv)
+
+    options = {}
+    if args.engine:
+        options["engine"] = args.engine
+    if args.solver and args.solver not in ("portfolio", "auto"):
+        options["solver"] = args.solver
+    if args.reuse_model:
+        options["reuse_model"] = True
+
+    extra = {}
+    for item in args.set:
+        name, _, value = item.partition("=")
+        extra[name] = json.loads(value)
+
+    solve = problems.solve
+    if args.solver == "portfolio":
+        if args.cache or args.cache_db:
+            parser.error("--cache cannot be combined with --solver portfolio")
+        solvers = args.portfolio_solvers.split(",") if args.portfolio_solvers else None
+
+        def solve(problem, instance, **options):
+            return portfolio.solve_portfolio(
+                problem, instance, solvers, args.time_limit, **options
+            )
+    elif args.cache or args.cache_db:
+        solution_cache.configure_cache(path=args.cache_db)
+        solve = solution_cache.cached_solve
+
+    if args.metrics_log or args.metrics_file:
+        solve_metrics.configure_metrics(args.metrics_log, args.metrics_file)
+
+    failures = 0
+    for source, line in _sources(args.instances):
+        record = {"instance": source, "problem": args.problem}
+        # Η καταγραφή περιλαμβάνει και την ανάγνωση του instance (φάση parse)
+        with solve_metrics.solve_context(args.problem, instance=source):
+            try:
+                with solve_metrics.phase("parse"):
+                    if line is None:
+                        problem, instance = load_instance(source, args.problem)
+                    else:
+                        problem, instance = instance_from_dict(json.loads(line), args.problem)
+                record["problem"] = problem
+                solve_metrics.annotate(problem=problem)
+                instance.update(extra)
+                if args.solver == "auto":
+                    options["solver"] = portfolio.learned_solver(problem)
+
+                # Το stdout κρατιέται μόνο για τα αποτελέσματα JSON, οπότε το log του solver πάει στο stderr
+                with contextlib.redirect_stdout(sys.stderr):
+                    record["result"] = solve(problem, instance, tee=args.tee, **options)
+                solve_metrics.annotate(status=record["result"].get("status"))
+            except Exception as e:
+                record["error"] = str(e)
+                solve_metrics.annotate(error=str(e))
+                failures += 1
+        print(json.dumps(record, default=json_default), flush=True)
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
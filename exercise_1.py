@@ -1,6 +1,8 @@
-import pandas as pd
 import pyomo.environ as pe
-import pyomo.opt as po
+
+from gap import solve_gap
+from solution_arrays import var_series
+from solver_backends import solve_model
 
 pinakas = [
     [0, 7, 3, 0, 0, 18, 13, 6, 0, 9],
@@ -37,38 +39,103 @@ c = {
 
 max_hours = 40
 
-model = pe.ConcreteModel()
+# True: οι μεταβλητές x φτιάχνονται μόνο για τα ζεύγη (εργάτης, εργασία) που υπάρχουν στο c,
+# αντί για όλο το πλέγμα με κόστος 1000 στα ζεύγη που λείπουν
+sparse = False
+
+# 'pyomo': επίλυση του μοντέλου (x συνεχείς στο [0,1], δηλαδή η χαλάρωση LP) με glpk,
+# 'lagrangian': λαγκρανζιανή χαλάρωση του gap.py για το ακέραιο GAP (x δυαδικές): εφικτή ακέραια
+# λύση, κάτω φράγμα και gap του ακέραιου προβλήματος, όχι της χαλάρωσης LP
+engine = 'pyomo'
+
+
+# Εργασίες χωρίς κανέναν διαθέσιμο εργάτη κάνουν το πρόβλημα αδύνατο
+def check_eligibility(workers, tasks, c):
+    covered = {t for (w, t) in c if w in workers}
+    missing = sorted(t for t in tasks if t not in covered)
+    if missing:
+        raise ValueError(f"Tasks without an eligible worker: {missing}")
+
+
+def build_model(workers, tasks, c, max_hours, sparse=False):
+    model = pe.ConcreteModel()
+
+    model.workers = pe.Set(initialize = workers)
+    model.tasks = pe.Set(initialize = tasks)
+    model.max_hours = pe.Param(initialize = max_hours)
+
+    if sparse:
+        check_eligibility(workers, tasks, c)
+
+        # Μόνο τα ζεύγη του c, με indexed Sets για τους εργάτες κάθε εργασίας και τις εργασίες κάθε εργάτη
+        arcs = sorted((w, t) for (w, t) in c if w in workers and t in tasks)
+        task_workers = {t: [] for t in tasks}
+        worker_tasks = {w: [] for w in workers}
+        for (w, t) in arcs:
+            task_workers[t].append(w)
+            worker_tasks[w].append(t)
+
+        model.arcs = pe.Set(within = model.workers * model.tasks, initialize = arcs)
+        model.task_workers = pe.Set(model.tasks, initialize = task_workers)
+        model.worker_tasks = pe.Set(model.workers, initialize = worker_tasks)
+
+        model.c = pe.Param(model.arcs, initialize = c)
+        model.x = pe.Var(model.arcs, domain = pe.Reals, bounds = (0,1))
+
+        expr = sum(model.c[w, t] * model.x[w, t] for (w, t) in model.arcs)
+        model.objective = pe.Objective(sense = pe.minimize, expr = expr)
+
+        model.tasks_done = pe.ConstraintList()
+        for t in model.tasks:
+            lhs = sum(model.x[w, t] for w in model.task_workers[t])
+            rhs = 1
+            model.tasks_done.add(lhs == rhs)
+
+        model.hour_limit = pe.ConstraintList()
+        for w in model.workers:
+            lhs = sum(model.c[w, t] * model.x[w, t] for t in model.worker_tasks[w])
+            rhs = model.max_hours
+            model.hour_limit.add(lhs <= rhs)
+
+        return model
+
+    model.c = pe.Param(model.workers, model.tasks, initialize = c, default = 1000)
+
+    model.x = pe.Var(model.workers, model.tasks, domain = pe.Reals, bounds = (0,1))
 
-model.workers = pe.Set(initialize = workers)
-model.tasks = pe.Set(initialize = tasks)
+    expr = sum(model.c[w, t] * model.x[w, t]
+                for w in model.workers for t in model.tasks)
+    model.objective = pe.Objective(sense = pe.minimize, expr = expr)
 
-model.c = pe.Param(model.workers, model.tasks, initialize = c, default = 1000)
-model.max_hours = pe.Param(initialize = max_hours)
+    model.tasks_done = pe.ConstraintList()
+    for t in model.tasks:
+        lhs = sum(model.x[w, t] for w in model.workers)
+        rhs = 1
+        model.tasks_done.add(lhs == rhs)
 
-model.x = pe.Var(model.workers, model.tasks, domain = pe.Reals, bounds = (0,1))
+    model.hour_limit = pe.ConstraintList()
+    for w in model.workers:
+        lhs = sum(model.c[w, t] * model.x[w, t] for t in model.tasks)
+        rhs = model.max_hours
+        model.hour_limit.add(lhs <= rhs)
 
-expr = sum(model.c[w, t] * model.x[w, t]
-            for w in model.workers for t in model.tasks)
-model.objective = pe.Objective(sense = pe.minimize, expr = expr)
+    return model
 
-model.tasks_done = pe.ConstraintList()
-for t in model.tasks:
-    lhs = sum(model.x[w, t] for w in model.workers)
-    rhs = 1
-    model.tasks_done.add(lhs == rhs)
 
-model.hour_limit = pe.ConstraintList()
-for w in model.workers:
-    lhs = sum(model.c[w, t] * model.x[w, t] for t in model.tasks)
-    rhs = model.max_hours
-    model.hour_limit.add(lhs <= rhs)
+if __name__ == "__main__":
+    model = build_model(workers, tasks, c, max_hours, sparse = sparse)
 
-solver = po.SolverFactory('glpk')
-results = solver.solve(model, tee = True)
+    if engine == 'pyomo':
+        solve_model(model, 'glpk', tee = True)
+    else:
+        result = solve_gap(workers, tasks, c, max_hours)
+        for key in model.x:
+            model.x[key].set_value(1 if result['assignment'][key[1]] == key[0] else 0)
+        print(f"Integer GAP (binary x, not the LP relaxation of the pyomo engine): cost {result['total_cost']}, "
+              f"Lagrangian lower bound {result['lower_bound']:.4f}, gap {result['gap']:.2%}")
 
-df = pd.DataFrame(index = pd.MultiIndex.from_tuples(model.x, names = ['w', 't']))
-df['x'] = [pe.value(model.x[key]) for key in df.index]
-df['c'] = [model.c[key] for key in df.index]
-print((df['c'] * df['x']).unstack('t'))
-print((df['c'] * df['x']).groupby('w').sum().to_frame())
-print(df['x'].groupby('t').sum().to_frame().T)
+    df = var_series(model.x, names = ['w', 't']).to_frame('x')
+    df['c'] = [model.c[key] for key in df.index]
+    print((df['c'] * df['x']).unstack('t'))
+    print((df['c'] * df['x']).groupby('w').sum().to_frame())
+    print(df['x'].groupby('t').sum().to_frame().T)
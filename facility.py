@@ -0,0 +1,111 @@
+import numpy as np
+import pyomo.environ as pe
+
+from solution_arrays import selected_indices, var_array, var_values
+from solve_metrics import phase
+from solver_backends import solve_model
+
+
+# Έλεγχος για ορθότητα δεδομένων και μετατροπή σε πίνακες NumPy
+def _prepare(facility_costs, transport_costs):
+    facility_costs = np.asarray(facility_costs, dtype=float)
+    transport_costs = np.asarray(transport_costs, dtype=float)
+    if facility_costs.ndim != 1:
+        raise ValueError("The facility costs must be a vector.")
+    if transport_costs.ndim != 2 or transport_costs.shape[0] != len(facility_costs):
+        raise ValueError("The transport cost table is not configured correctly.")
+    return facility_costs, transport_costs
+
+
+# Δημιουργία μοντέλου Pyomo για το Facility Location Problem
+def build_facility_model(facility_costs, transport_costs):
+    facility_costs, transport_costs = _prepare(facility_costs, transport_costs)
+    f_costs = facility_costs.tolist()
+    t_costs = transport_costs.tolist()
+    model = pe.ConcreteModel()
+
+    # Σετ εγκαταστάσεων και πελατών
+    model.facilities = pe.Set(initialize=range(transport_costs.shape[0]))
+    model.clients = pe.Set(initialize=range(transport_costs.shape[1]))
+
+    # Μεταβλητές απόφασης
+    model.y = pe.Var(model.facilities, domain=pe.Binary)  # Εγκατάσταση (1 αν ανοίξει η εγκατάσταση)
+    model.x = pe.Var(model.facilities, model.clients, domain=pe.Binary)  # Αντιστοίχιση πελατών σε εγκαταστάσεις
+
+    # Συνάρτηση στόχου: Ελαχιστοποίηση κόστους
+    def objective_rule(model):
+        facility_cost = sum(model.y[f] * f_costs[f] for f in model.facilities)
+        transport_cost = sum(model.x[f, c] * t_costs[f][c] for f in model.facilities for c in model.clients)
+        return facility_cost + transport_cost
+
+    model.obj = pe.Objective(rule=objective_rule, sense=pe.minimize)
+
+    # Περιορισμός: Κάθε πελάτης εξυπηρετείται από μία εγκατάσταση
+    def client_constraint_rule(model, c):
+        return sum(model.x[f, c] for f in model.facilities) == 1
+
+    model.client_constraints = pe.Constraint(model.clients, rule=client_constraint_rule)
+
+    # Περιορισμός: Ένας πελάτης μπορεί να εξυπηρετηθεί μόνο από ανοιχτή εγκατάσταση
+    def facility_constraint_rule(model, f, c):
+        return model.x[f, c] <= model.y[f]
+
+    model.facility_constraints = pe.Constraint(model.facilities, model.clients, rule=facility_constraint_rule)
+
+    return model
+
+
+# Ανάγνωση αποτελεσμάτων από λυμένο μοντέλο (δείκτες με αρίθμηση από το 0). Με τα κόστη
+# το συνολικό κόστος υπολογίζεται από τη λύση, χωρίς αποτίμηση της συνάρτησης στόχου.
+def extract_facility_location(model, facility_costs=None, transport_costs=None):
+    opened_facilities = selected_indices(model.y)
+    # x ως πίνακας εγκαταστάσεις x πελάτες· ανά πελάτη με τη σειρά των πελατών
+    clients, facilities = np.nonzero(var_array(model.x).T == 1)
+    client_assignments = list(zip(clients.tolist(), facilities.tolist()))
+    if facility_costs is None or transport_costs is None:
+        total_cost = pe.value(model.obj)
+    else:
+        facility_costs, transport_costs = _prepare(facility_costs, transport_costs)
+        total_cost = float(facility_costs[opened_facilities].sum() + transport_costs[facilities, clients].sum())
+    return {
+        "total_cost": total_cost,
+        "opened_facilities": opened_facilities,
+        "client_assignments": client_assignments,
+    }
+
+
+# Επίλυση του Facility Location Problem χωρίς GUI
+# engine="search": τοπική αναζήτηση με λαγκρανζιανό φράγμα (facility_search) για μεγάλα instances
+# engine="benders": Benders decomposition (facility_benders) με απόδειξη βελτιστότητας, με cuts
+# ανά πελάτη ("disaggregated") ή ένα συνολικό cut ανά γύρο ("aggregated")
+# engine="matrix": το ίδιο μοντέλο σε μορφή πινάκων (matrix_models), χωρίς αντικείμενα Pyomo
+# time_limit: στα pyomo/matrix ισχύει στους in-memory solvers· αν τελειώσει ο χρόνος, επιστρέφεται
+# η καλύτερη λύση που βρέθηκε με status "feasible"
+def solve_facility_location(facility_costs, transport_costs, solver="glpk", tee=False, engine="pyomo",
+                            time_limit=None, cuts="disaggregated"):
+    limit = {} if time_limit is None else {"time_limit": time_limit}
+    if engine == "search":
+        from facility_search import solve_facility_search
+
+        return solve_facility_search(facility_costs, transport_costs, **limit)
+    if engine == "benders":
+        from facility_benders import solve_facility_benders
+
+        return solve_facility_benders(facility_costs, transport_costs, solver, tee, cuts=cuts, **limit)
+    if engine == "matrix":
+        from matrix_models import solve_facility_matrix
+
+        return solve_facility_matrix(facility_costs, transport_costs, solver, tee, time_limit)
+    if engine != "pyomo":
+        raise ValueError(f"Unknown engine: {engine}")
+
+    with phase("build"):
+        model = build_facility_model(facility_costs, transport_costs)
+    status = solve_model(model, solver, tee, time_limit=time_limit)
+    # Στο time_limit οι in-memory solvers φορτώνουν την καλύτερη εφικτή λύση, αν βρέθηκε
+    if status == "maxTimeLimit" and not np.isnan(var_values(model.y)).any():
+        status = "feasible"
+    if status not in ("optimal", "feasible"):
+        return {"status": status, "total_cost": None, "opened_facilities": [], "client_assignments": []}
+    with phase("format"):
+        return {"status": status, **extract_facility_location(model, facility_costs, transport_costs)}
@@ -0,0 +1,181 @@
+import time
+
+import numpy as np
+import pyomo.environ as pe
+from pyomo.core.expr.numeric_expr import LinearExpression
+from pyomo.solvers.plugins.solvers.persistent_solver import PersistentSolver
+
+from facility import _prepare
+from facility_search import assign_clients, local_search
+from solution_arrays import var_values
+from solver_backends import create_solver, solve_model
+
+# Ανοχή για την παραβίαση των cuts και για το gap
+EPS = 1e-6
+
+# Μέγιστο πλήθος γύρων με τη χαλάρωση LP του master πριν περάσουμε στις δυαδικές y
+LP_ROUNDS = 50
+
+
+# Master πρόβλημα του Benders: μόνο οι αποφάσεις ανοίγματος y και μια εκτίμηση theta για το
+# κόστος μεταφοράς, ανά πελάτη (disaggregated) ή συνολικά (aggregated). Τα optimality cuts
+# μπαίνουν στη λίστα benders_cuts.
+def build_master_model(facility_costs, num_clients, cuts="disaggregated"):
+    if cuts not in ("disaggregated", "aggregated"):
+        raise ValueError(f"Unknown cut type: {cuts}")
+    f_costs = facility_costs.tolist()
+    model = pe.ConcreteModel()
+
+    # Σετ εγκαταστάσεων και εκτιμήσεων κόστους
+    model.facilities = pe.Set(initialize=range(len(f_costs)))
+    model.parts = pe.Set(initialize=range(num_clients if cuts == "disaggregated" else 1))
+
+    # Μεταβλητές απόφασης
+    model.y = pe.Var(model.facilities, domain=pe.Binary)  # Εγκατάσταση (1 αν ανοίξει η εγκατάσταση)
+    model.theta = pe.Var(model.parts, domain=pe.NonNegativeReals)  # Εκτίμηση κόστους μεταφοράς
+
+    # Συνάρτηση στόχου: κόστος εγκαταστάσεων και εκτίμηση του κόστους μεταφοράς
+    model.obj = pe.Objective(
+        expr=sum(f_costs[f] * model.y[f] for f in model.facilities) + sum(model.theta[p] for p in model.parts),
+        sense=pe.minimize,
+    )
+
+    # Περιορισμός: Ανοίγει τουλάχιστον μία εγκατάσταση
+    model.open_constraint = pe.Constraint(expr=sum(model.y[f] for f in model.facilities) >= 1)
+
+    model.benders_cuts = pe.ConstraintList()
+    return model
+
+
+# Υποπροβλήματα σε κλειστή μορφή για όλους τους πελάτες μαζί. Για δεδομένα (και κλασματικά) y,
+# ο πελάτης c παίρνει τις φθηνότερες εγκαταστάσεις μέχρι να καλυφθεί· d_c είναι το κόστος της
+# εγκατάστασης όπου η κάλυψη φτάνει το 1. Το dual του υποπροβλήματος δίνει το cut
+#   theta_c >= d_c - sum_f max(0, d_c - t_fc) y_f,
+# που είναι ακριβές στο τρέχον y. order: οι εγκαταστάσεις ανά πελάτη σε αύξον κόστος.
+# Επιστρέφει (d, κόστος υποπροβλημάτων).
+def solve_subproblems(transport_costs, order, y):
+    columns = np.arange(transport_costs.shape[1])
+    covered = np.cumsum(y[order], axis=0)
+    critical = np.argmax(covered >= 1 - EPS, axis=0)
+    d = transport_costs[order[critical, columns], columns]
+    return d, d - (y[:, None] * np.maximum(d - transport_costs, 0)).sum(axis=0)
+
+
+# Προσθήκη των παραβιασμένων cuts στο master (όλων, αν theta είναι None). Στα disaggregated cuts
+# κάθε πελάτης έχει όρους μόνο για τις εγκαταστάσεις που είναι φθηνότερες από το d_c του.
+def _add_cuts(model, transport_costs, d, value, theta, cuts):
+    coefficients = np.maximum(d - transport_costs, 0)
+    added = []
+    if cuts == "aggregated":
+        if theta is None or value.sum() > theta.sum() + EPS * max(1.0, value.sum()):
+            totals = coefficients.sum(axis=1)
+            facilities = np.nonzero(totals)[0].tolist()
+            expr = LinearExpression(
+                constant=float(d.sum()), linear_coefs=(-totals[facilities]).tolist(),
+                linear_vars=[model.y[f] for f in facilities],
+            )
+            added.append(model.benders_cuts.add(model.theta[0] >= expr))
+        return added
+
+    violated = np.arange(len(d)) if theta is None else np.nonzero(value > theta + EPS * np.maximum(1.0, value))[0]
+    for c in violated.tolist():
+        facilities = np.nonzero(coefficients[:, c])[0].tolist()
+        expr = LinearExpression(
+            constant=float(d[c]), linear_coefs=(-coefficients[facilities, c]).tolist(),
+            linear_vars=[model.y[f] for f in facilities],
+        )
+        added.append(model.benders_cuts.add(model.theta[c] >= expr))
+    return added
+
+
+# Επίλυση με Benders decomposition: πρώτα γύροι με τη χαλάρωση LP του master (φθηνά cuts), μετά
+# με δυαδικές y μέχρι το master (κάτω φράγμα) να φτάσει το καλύτερο κόστος (άνω φράγμα).
+# Η τοπική αναζήτηση του facility_search δίνει αρχική λύση και τα πρώτα cuts.
+# Κάθε επίλυση του master έχει ως όριο τον χρόνο που απομένει· στο time_limit το status είναι
+# "maxTimeLimit" με την καλύτερη λύση μέχρι τότε.
+# Το αποτέλεσμα έχει τη μορφή του solve_facility_location, με επιπλέον lower_bound, gap και rounds.
+def solve_facility_benders(facility_costs, transport_costs, solver="glpk", tee=False, cuts="disaggregated",
+                           time_limit=600.0, gap_tolerance=1e-6, max_rounds=1000):
+    facility_costs, transport_costs = _prepare(facility_costs, transport_costs)
+    start = time.perf_counter()
+    deadline = start + time_limit
+    num_facilities, num_clients = transport_costs.shape
+    order = np.argsort(transport_costs, axis=0, kind="stable")
+
+    model = build_master_model(facility_costs, num_clients, cuts)
+    opt = create_solver(solver)
+    persistent = isinstance(opt, PersistentSolver)
+
+    # Αρχική λύση και cuts από την τοπική αναζήτηση
+    opened = local_search(facility_costs, transport_costs, deadline=start + time_limit / 10)
+    y = np.zeros(num_facilities)
+    y[opened] = 1
+    d, value = solve_subproblems(transport_costs, order, y)
+    upper_bound = float(facility_costs[opened].sum() + value.sum())
+    _add_cuts(model, transport_costs, d, value, None, cuts)
+
+    # Φάση 1: χαλάρωση LP του master
+    for f in model.facilities:
+        model.y[f].domain = pe.UnitInterval
+    if persistent:
+        opt.set_instance(model)
+    lower_bound = -np.inf
+    rounds = 0
+    status = "optimal"
+    for phase in ("lp", "mip"):
+        if phase == "mip":
+            for f in model.facilities:
+                model.y[f].domain = pe.Binary
+                if persistent:
+                    opt.update_var(model.y[f])
+        for _ in range(LP_ROUNDS if phase == "lp" else max_rounds):
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0 or rounds >= max_rounds:
+                status = "maxTimeLimit" if remaining <= 0 else "maxIterations"
+                break
+            rounds += 1
+            status = solve_model(model, tee=tee, time_limit=remaining, opt=opt)
+            if status != "optimal":
+                break
+            bound = pe.value(model.obj)
+            y = var_values(model.y)
+            theta = var_values(model.theta)
+            d, value = solve_subproblems(transport_costs, order, y)
+
+            if phase == "mip":
+                lower_bound = max(lower_bound, bound)
+                opened_now = np.nonzero(y > 0.5)[0]
+                cost = float(facility_costs[opened_now].sum() + value.sum())
+                if cost < upper_bound - EPS:
+                    upper_bound, opened = cost, opened_now.tolist()
+                if upper_bound - lower_bound <= gap_tolerance * max(1.0, abs(upper_bound)):
+                    break
+
+            added = _add_cuts(model, transport_costs, d, value, theta, cuts)
+            if not added:
+                if phase == "mip":
+                    lower_bound = upper_bound
+                break
+            if persistent:
+                for cut in added:
+                    opt.add_constraint(cut)
+        if status != "optimal":
+            break
+
+    assigned, best, _ = assign_clients(transport_costs, opened)
+    total_cost = float(facility_costs[opened].sum() + best.sum())
+    gap = max(0.0, (total_cost - lower_bound) / max(1.0, abs(total_cost))) if np.isfinite(lower_bound) else None
+    if gap is not None and gap <= gap_tolerance:
+        status = "optimal"
+    elif status != "maxTimeLimit":
+        status = "feasible"
+    return {
+        "status": status,
+        "total_cost": total_cost,
+        "opened_facilities": sorted(int(f) for f in opened),
+        "client_assignments": list(enumerate(assigned.tolist())),
+        "lower_bound": float(lower_bound) if np.isfinite(lower_bound) else None,
+        "gap": gap,
+        "rounds": rounds,
+        "elapsed": time.perf_counter() - start,
+    }
@@ -0,0 +1,199 @@
+import time
+
+import numpy as np
+
+from facility import _prepare
+
+# Ανοχή για τις συγκρίσεις κόστους
+EPS = 1e-9
+
+# Γραμμές (εγκαταστάσεις) του πίνακα κόστους μεταφοράς που επεξεργάζονται μαζί, ώστε οι
+# ενδιάμεσοι πίνακες να μένουν μικροί και για χιλιάδες πελάτες
+CHUNK_ROWS = 64
+
+
+def _chunks(n):
+    for start in range(0, n, CHUNK_ROWS):
+        yield slice(start, min(start + CHUNK_ROWS, n))
+
+
+# Ανάθεση κάθε πελάτη στη φθηνότερη ανοιχτή εγκατάσταση: (εγκατάσταση, κόστος, δεύτερο φθηνότερο κόστος)
+def assign_clients(transport_costs, opened):
+    opened = np.asarray(opened, dtype=int)
+    rows = transport_costs[opened]
+    columns = np.arange(transport_costs.shape[1])
+    if len(opened) == 1:
+        return np.full(len(columns), opened[0]), rows[0].copy(), np.full(len(columns), np.inf)
+    two = np.argpartition(rows, 1, axis=0)[:2]
+    values = np.take_along_axis(rows, two, axis=0)
+    first = np.argmin(values, axis=0)
+    best = values[first, columns]
+    second = values[1 - first, columns]
+    return opened[two[first, columns]], best, second
+
+
+# Καλύτερη κίνηση από το σύνολο ανοιχτών εγκαταστάσεων: άνοιγμα (add), κλείσιμο (drop) ή
+# ανταλλαγή (swap). Το κέρδος του swap υπολογίζεται για όλα τα ζεύγη με ένα πέρασμα του πίνακα:
+# για κάθε υποψήφια f_in, οι πελάτες της f_out πάνε στη φθηνότερη από f_in και τη δεύτερη επιλογή τους.
+# Επιστρέφει (μεταβολή κόστους, f_in ή None, f_out ή None).
+def _best_move(facility_costs, transport_costs, opened, assigned, best, second):
+    num_facilities = len(facility_costs)
+    is_open = np.zeros(num_facilities, dtype=bool)
+    is_open[opened] = True
+    closed = np.nonzero(~is_open)[0]
+    moves = [(0.0, None, None)]
+
+    # Drop: οι πελάτες της f πάνε στη δεύτερη επιλογή τους
+    position = np.full(num_facilities, -1)
+    position[opened] = np.arange(len(opened))
+    if len(opened) > 1:
+        loss = np.bincount(position[assigned], weights=second - best, minlength=len(opened))
+        delta = loss - facility_costs[opened]
+        k = int(np.argmin(delta))
+        moves.append((delta[k], None, opened[k]))
+
+    # Πελάτες ταξινομημένοι ανά εγκατάσταση, για αθροίσματα ανά f_out με reduceat
+    order = np.argsort(position[assigned], kind="stable")
+    groups, starts = np.unique(position[assigned][order], return_index=True)
+
+    for rows in _chunks(len(closed)):
+        candidates = closed[rows]
+        costs = transport_costs[candidates]
+        with_best = np.minimum(costs, best)
+
+        # Add: κέρδος από τους πελάτες που έρχονται πιο κοντά
+        base = (with_best - best).sum(axis=1)
+        add = base + facility_costs[candidates]
+        k = int(np.argmin(add))
+        moves.append((add[k], candidates[k], None))
+
+        # Swap: διόρθωση για τους πελάτες της f_out
+        correction = np.zeros((len(candidates), len(opened)))
+        change = np.minimum(costs, second) - with_best
+        correction[:, groups] = np.add.reduceat(change[:, order], starts, axis=1)
+        swap = (
+            facility_costs[candidates][:, None] - facility_costs[opened][None, :]
+            + base[:, None] + correction
+        )
+        i, j = np.unravel_index(np.argmin(swap), swap.shape)
+        moves.append((swap[i, j], candidates[i], opened[j]))
+
+    return min(moves, key=lambda move: move[0])
+
+
+# Τοπική αναζήτηση: ξεκινά από τη μία εγκατάσταση με το μικρότερο συνολικό κόστος και εφαρμόζει
+# κάθε φορά την καλύτερη κίνηση add/drop/swap, μέχρι να μην υπάρχει βελτίωση ή να λήξει ο χρόνος
+def local_search(facility_costs, transport_costs, opened=None, deadline=None):
+    if opened is None:
+        totals = np.concatenate([transport_costs[rows].sum(axis=1) for rows in _chunks(len(facility_costs))])
+        opened = [int(np.argmin(facility_costs + totals))]
+    opened = sorted(int(f) for f in opened)
+    while deadline is None or time.perf_counter() < deadline:
+        assigned, best, second = assign_clients(transport_costs, opened)
+        cost = facility_costs[opened].sum() + best.sum()
+        delta, f_in, f_out = _best_move(facility_costs, transport_costs, np.array(opened), assigned, best, second)
+        if delta >= -EPS * max(1.0, abs(cost)):
+            break
+        if f_out is not None:
+            opened.remove(f_out)
+        if f_in is not None:
+            opened.append(int(f_in))
+        opened.sort()
+    return opened
+
+
+# Λαγκρανζιανό κάτω φράγμα: οι περιορισμοί ανάθεσης (κάθε πελάτης σε μία εγκατάσταση) περνούν στον
+# στόχο με πολλαπλασιαστές u. Για δεδομένα u το πρόβλημα χωρίζεται ανά εγκατάσταση:
+#   L(u) = sum(u) + sum_f min(0, fixed_f + sum_c min(0, t_fc - u_c)).
+# Τα u ενημερώνονται με βήματα subgradient (Polyak) προς το καλύτερο γνωστό κόστος. Οι εγκαταστάσεις
+# που ανοίγει κάθε L(u) αξιολογούνται και ως εφικτή λύση. Επιστρέφει dict με lower_bound, multipliers
+# (για συνέχιση) και την καλύτερη εφικτή λύση που βρέθηκε (opened, total_cost).
+def lagrangian_bound(facility_costs, transport_costs, upper_bound=np.inf, opened=None, max_iterations=100,
+                     deadline=None, gap_tolerance=1e-4, multipliers=None):
+    num_facilities, num_clients = transport_costs.shape
+    if multipliers is None:
+        multipliers = transport_costs.min(axis=0)
+    best_bound = -np.inf
+    step_scale = 2.0
+    stalled = 0
+
+    for _ in range(max_iterations):
+        reduced = np.concatenate([
+            facility_costs[rows] + np.minimum(transport_costs[rows] - multipliers, 0).sum(axis=1)
+            for rows in _chunks(num_facilities)
+        ])
+        chosen = np.nonzero(reduced < 0)[0]
+        bound = multipliers.sum() + reduced[chosen].sum()
+        if bound > best_bound + EPS:
+            best_bound = bound
+            stalled = 0
+        else:
+            stalled += 1
+            if stalled >= 10:
+                step_scale /= 2
+                stalled = 0
+
+        # Εφικτή λύση από τις εγκαταστάσεις που άνοιξαν
+        if len(chosen):
+            nearest = np.min([transport_costs[chosen[rows]].min(axis=0) for rows in _chunks(len(chosen))], axis=0)
+            cost = facility_costs[chosen].sum() + nearest.sum()
+            if cost < upper_bound:
+                upper_bound, opened = float(cost), chosen.tolist()
+
+        if upper_bound - best_bound <= gap_tolerance * max(1.0, abs(upper_bound)):
+            break
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+
+        # Subgradient: 1 - πλήθος εγκαταστάσεων που «παίρνουν» τον πελάτη c
+        covered = np.zeros(num_clients)
+        for rows in _chunks(len(chosen)):
+            covered += (transport_costs[chosen[rows]] < multipliers).sum(axis=0)
+        subgradient = 1 - covered
+        norm = subgradient @ subgradient
+        if norm == 0 or step_scale < 1e-6:
+            break
+        target = upper_bound if np.isfinite(upper_bound) else bound + abs(bound) * 0.1 + 1.0
+        multipliers = multipliers + step_scale * (target - bound) / norm * subgradient
+
+    return {"lower_bound": float(best_bound), "multipliers": multipliers, "opened": opened, "total_cost": upper_bound}
+
+
+# Επίλυση μεγάλων Facility Location Problems χωρίς MIP: το λαγκρανζιανό φράγμα δίνει και αρχική λύση,
+# η τοπική αναζήτηση τη βελτιώνει και μετά το φράγμα συνεχίζεται με το νέο κόστος για πιστοποίηση
+# του gap. Το αποτέλεσμα έχει τη μορφή του solve_facility_location, με επιπλέον lower_bound και gap.
+# Status "optimal" όταν gap <= gap_tolerance.
+def solve_facility_search(facility_costs, transport_costs, time_limit=30.0, bound_iterations=100,
+                          gap_tolerance=1e-4):
+    facility_costs, transport_costs = _prepare(facility_costs, transport_costs)
+    start = time.perf_counter()
+    deadline = start + time_limit
+
+    first = lagrangian_bound(
+        facility_costs, transport_costs, max_iterations=bound_iterations // 2,
+        deadline=start + time_limit / 4, gap_tolerance=gap_tolerance,
+    )
+    opened = local_search(facility_costs, transport_costs, first["opened"], deadline=start + 3 * time_limit / 4)
+    assigned, best, _ = assign_clients(transport_costs, opened)
+    total_cost = float(facility_costs[opened].sum() + best.sum())
+
+    second = lagrangian_bound(
+        facility_costs, transport_costs, total_cost, opened, max_iterations=bound_iterations - bound_iterations // 2,
+        deadline=deadline, gap_tolerance=gap_tolerance, multipliers=first["multipliers"],
+    )
+    lower_bound = max(first["lower_bound"], second["lower_bound"])
+    if second["total_cost"] < total_cost - EPS:
+        opened = sorted(second["opened"])
+        assigned, best, _ = assign_clients(transport_costs, opened)
+        total_cost = float(facility_costs[opened].sum() + best.sum())
+
+    gap = max(0.0, (total_cost - lower_bound) / max(1.0, abs(total_cost)))
+    return {
+        "status": "optimal" if gap <= gap_tolerance else "feasible",
+        "total_cost": total_cost,
+        "opened_facilities": opened,
+        "client_assignments": list(enumerate(assigned.tolist())),
+        "lower_bound": lower_bound,
+        "gap": gap,
+        "elapsed": time.perf_counter() - start,
+    }
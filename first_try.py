@@ -1,7 +1,10 @@
 import pyomo.environ as pe
 import pyomo.opt as po
+from knapsack import knapsack_engine
 
 solver = po.SolverFactory('gurobi') # GNU Linear Programming Kit
+# 'pyomo' για επίλυση με τον solver, 'auto' / 'dp' / 'bb' για απευθείας επίλυση χωρίς solver
+engine = 'pyomo'
 
 model = pe.ConcreteModel()# Create the model
 
@@ -20,7 +23,12 @@ model.obj = pe.Objective(sense = pe.maximize, expr = obj_expr)
 con_expr = 2 * model.x1 + 3 * model.x2 + 4 * model.x3 + 5 * model.x4 + 9 * model.x5 <= 20
 model.con = pe.Constraint(expr = con_expr)
 
-result = solver.solve(model, tee=True)
+if engine == 'pyomo':
+    result = solver.solve(model, tee=True)
+else:
+    selected, _, _ = knapsack_engine([3, 4, 5, 8, 9], [2, 3, 4, 5, 9], 20, method=engine)
+    for var, chosen in zip([model.x1, model.x2, model.x3, model.x4, model.x5], selected):
+        var.set_value(int(chosen))
 
 print(pe.value(model.x1))
 print(pe.value(model.x2))
@@ -1,5 +1,9 @@
 import pyomo.environ as pe
 import pyomo.opt as po
+from knapsack import knapsack_engine
+
+# 'pyomo' για επίλυση με τον solver, 'auto' / 'dp' / 'bb' για απευθείας επίλυση χωρίς solver
+engine = 'pyomo'
 
 # Δημιουργία του AbstractModel
 model = pe.AbstractModel()
@@ -38,8 +42,15 @@ data = {
 
 # Δημιουργία και επίλυση του μοντέλου
 instance = model.create_instance(data)  # Δημιουργία ενός Concrete instance από το AbstractModel
-solver = po.SolverFactory('gurobi')
-result = solver.solve(instance, tee=True)
+if engine == 'pyomo':
+    solver = po.SolverFactory('gurobi')
+    result = solver.solve(instance, tee=True)
+else:
+    values = [instance.coeff[i] for i in instance.I]
+    weights = [instance.weights[i] for i in instance.I]
+    selected, _, _ = knapsack_engine(values, weights, pe.value(instance.capacity), method=engine)
+    for i, chosen in zip(instance.I, selected):
+        instance.x[i].set_value(int(chosen))
 
 # Εκτύπωση των αποτελεσμάτων
 for i in instance.I:
@@ -0,0 +1,192 @@
+import time
+
+import numpy as np
+
+# Ανοχή για τους ελέγχους χωρητικότητας
+EPS = 1e-9
+
+
+# Μετατροπή των δεδομένων του exercise_1 (dict κόστους ανά (εργάτης, εργασία)) σε πίνακες.
+# Τα ζεύγη που λείπουν παίρνουν κόστος inf. Αν δεν δοθούν ώρες, οι ώρες είναι ίσες με το κόστος.
+def gap_arrays(workers, tasks, c, hours=None):
+    workers = sorted(workers)
+    tasks = sorted(tasks)
+    worker_index = {w: i for i, w in enumerate(workers)}
+    task_index = {t: j for j, t in enumerate(tasks)}
+    cost = np.full((len(workers), len(tasks)), np.inf)
+    for (w, t), value in c.items():
+        if w in worker_index and t in task_index:
+            cost[worker_index[w], task_index[t]] = value
+    if hours is None:
+        hour_matrix = cost.copy()
+    else:
+        hour_matrix = np.full(cost.shape, np.inf)
+        for (w, t), value in hours.items():
+            if w in worker_index and t in task_index:
+                hour_matrix[worker_index[w], task_index[t]] = value
+    return workers, tasks, cost, hour_matrix
+
+
+def _loads(assign, hours, num_workers):
+    return np.bincount(assign, weights=hours[assign, np.arange(len(assign))], minlength=num_workers)
+
+
+# Επισκευή της χαλαρής λύσης σε εφικτή. Από κάθε υπερφορτωμένο εργάτη αφαιρούνται οι εργασίες που
+# χάνουν λιγότερο αν φύγουν, και ξαναμπαίνουν με σειρά regret (διαφορά καλύτερης και δεύτερης
+# επιλογής) στον εργάτη με τη μικρότερη τιμή desirability που έχει χώρο. Ως desirability
+# χρησιμοποιείται το λαγκρανζιανό κόστος c + lambda * h. Επιστρέφει None αν δεν βρεθεί εφικτή.
+def _repair(choice, desirability, hours, capacity, eligible):
+    assign = choice.copy()
+    num_tasks = len(assign)
+    load = _loads(assign, hours, len(capacity))
+
+    # Κόστος μετακίνησης κάθε εργασίας: δεύτερη καλύτερη τιμή μείον την τρέχουσα
+    current = desirability[assign, np.arange(num_tasks)]
+    second = desirability.copy()
+    second[assign, np.arange(num_tasks)] = np.inf
+    move_cost = second.min(axis=0) - current
+
+    unassigned = []
+    for w in np.nonzero(load > capacity + EPS)[0]:
+        tasks_w = np.nonzero(assign == w)[0]
+        for t in tasks_w[np.argsort(move_cost[tasks_w] / np.maximum(hours[w, tasks_w], EPS))]:
+            if load[w] <= capacity[w] + EPS:
+                break
+            load[w] -= hours[w, t]
+            assign[t] = -1
+            unassigned.append(t)
+    if not unassigned:
+        return assign
+
+    columns = np.array(unassigned)
+    options = np.sort(desirability[:, columns], axis=0)
+    regret = options[1] - options[0] if len(capacity) > 1 else np.zeros(len(columns))
+    for t in columns[np.argsort(-regret)]:
+        fits = eligible[:, t] & (load + hours[:, t] <= capacity + EPS)
+        if not fits.any():
+            return None
+        v = int(np.argmin(np.where(fits, desirability[:, t], np.inf)))
+        assign[t] = v
+        load[v] += hours[v, t]
+    return assign
+
+
+# Τοπική αναζήτηση με μετακινήσεις (shift): κάθε εργασία πάει στον φθηνότερο εργάτη που έχει χώρο
+def _local_search(assign, cost, hours, capacity, eligible, max_passes=50):
+    assign = assign.copy()
+    columns = np.arange(len(assign))
+    load = _loads(assign, hours, len(capacity))
+    for _ in range(max_passes):
+        room = capacity - load
+        fits = eligible & (hours <= room[:, None] + EPS)
+        fits[assign, columns] = False
+        gain = np.where(fits, cost[assign, columns] - cost, -np.inf)
+        best_v = np.argmax(gain, axis=0)
+        best_gain = gain[best_v, columns]
+        improving = np.nonzero(best_gain > EPS)[0]
+        if len(improving) == 0:
+            break
+
+        # Οι μετακινήσεις εφαρμόζονται με φθίνον κέρδος, ξαναελέγχοντας τη χωρητικότητα
+        moved = False
+        for t in improving[np.argsort(-best_gain[improving])]:
+            u, v = assign[t], best_v[t]
+            if load[v] + hours[v, t] <= capacity[v] + EPS:
+                assign[t] = v
+                load[u] -= hours[u, t]
+                load[v] += hours[v, t]
+                moved = True
+        if not moved:
+            break
+    return assign
+
+
+# Λαγκρανζιανή χαλάρωση του γενικευμένου προβλήματος ανάθεσης: οι περιορισμοί ωρών ανά εργάτη
+# περνούν στον στόχο με πολλαπλασιαστές lambda >= 0, οπότε κάθε εργασία λύνεται χωριστά
+# (argmin ανά στήλη). Οι πολλαπλασιαστές ενημερώνονται με βήματα subgradient (Polyak) και
+# η χαλαρή λύση επισκευάζεται σε εφικτή με _repair και _local_search.
+# Επιστρέφει εφικτή ανάθεση (εργασία -> δείκτης εργάτη), κάτω φράγμα και gap.
+def solve_gap_lagrangian(cost, hours, capacity, max_iterations=300, time_limit=None,
+                         gap_tolerance=1e-4, repair_every=5):
+    start = time.perf_counter()
+    cost = np.asarray(cost, dtype=float)
+    hours = np.asarray(hours, dtype=float)
+    num_workers, num_tasks = cost.shape
+    capacity = np.broadcast_to(np.asarray(capacity, dtype=float), (num_workers,)).copy()
+    columns = np.arange(num_tasks)
+
+    eligible = np.isfinite(cost) & np.isfinite(hours) & (hours <= capacity[:, None] + EPS)
+    missing = np.nonzero(~eligible.any(axis=0))[0]
+    if len(missing):
+        raise ValueError(f"Tasks without an eligible worker: {missing.tolist()}")
+    safe_cost = np.where(eligible, cost, 0.0)
+    safe_hours = np.where(eligible, hours, 0.0)
+
+    multipliers = np.zeros(num_workers)
+    best_bound = -np.inf
+    best_cost = np.inf
+    best_assign = None
+    step_scale = 2.0
+    stalled = 0
+    iterations = 0
+
+    for iterations in range(1, max_iterations + 1):
+        # Χαλαρό πρόβλημα: κάθε εργασία στον εργάτη με το μικρότερο c + lambda * h
+        reduced = np.where(eligible, safe_cost + multipliers[:, None] * safe_hours, np.inf)
+        choice = np.argmin(reduced, axis=0)
+        bound = reduced[choice, columns].sum() - multipliers @ capacity
+
+        if bound > best_bound + EPS:
+            best_bound = bound
+            stalled = 0
+        else:
+            stalled += 1
+            if stalled >= 20:
+                step_scale /= 2
+                stalled = 0
+
+        # Επισκευή σε εφικτή λύση και τοπική αναζήτηση
+        subgradient = _loads(choice, safe_hours, num_workers) - capacity
+        if iterations % repair_every == 1 or (subgradient <= EPS).all():
+            assign = _repair(choice, reduced, safe_hours, capacity, eligible)
+            if assign is not None:
+                assign = _local_search(assign, safe_cost, safe_hours, capacity, eligible)
+                total = safe_cost[assign, columns].sum()
+                if total < best_cost:
+                    best_cost = total
+                    best_assign = assign
+
+        if best_assign is not None and best_cost - best_bound <= gap_tolerance * max(1.0, abs(best_cost)):
+            break
+        if time_limit is not None and time.perf_counter() - start > time_limit:
+            break
+
+        # Βήμα subgradient με προβολή στο lambda >= 0
+        direction = np.where((multipliers <= 0) & (subgradient < 0), 0.0, subgradient)
+        norm = direction @ direction
+        if norm <= EPS or step_scale < 1e-6:
+            break
+        target = best_cost if np.isfinite(best_cost) else bound + abs(bound) * 0.1 + 1.0
+        step = step_scale * (target - bound) / norm
+        multipliers = np.maximum(0.0, multipliers + step * direction)
+
+    if best_assign is None:
+        raise ValueError("No feasible assignment was found.")
+    gap = (best_cost - best_bound) / max(1.0, abs(best_cost))
+    return {
+        "assignment": best_assign,
+        "total_cost": float(best_cost),
+        "lower_bound": float(best_bound),
+        "gap": float(max(gap, 0.0)),
+        "iterations": iterations,
+        "elapsed": time.perf_counter() - start,
+    }
+
+
+# Επίλυση με τα δεδομένα του exercise_1: επιστρέφει και την ανάθεση ως dict εργασία -> εργάτης.
+# Φράγμα και gap αφορούν το ακέραιο GAP, όχι το μοντέλο του exercise_1 με συνεχείς x.
+def solve_gap(workers, tasks, c, max_hours, hours=None, **options):
+    workers, tasks, cost, hour_matrix = gap_arrays(workers, tasks, c, hours)
+    result = solve_gap_lagrangian(cost, hour_matrix, max_hours, **options)
+    result["assignment"] = {t: workers[w] for t, w in zip(tasks, result["assignment"].tolist())}
+    return result
@@ -1,7 +1,10 @@
 import pyomo.environ as pe
 import pyomo.opt as po
+from knapsack import knapsack_engine
 
 solver = po.SolverFactory('glpk') # GNU Linear Programming Kit
+# 'pyomo' για επίλυση με τον solver, 'auto' / 'dp' / 'bb' για απευθείας επίλυση χωρίς solver
+engine = 'pyomo'
 
 model = pe.ConcreteModel()
 
@@ -25,7 +28,14 @@ con_lhs_expr = sum(model.a[i] * model.x[i] for i in model.N)
 con_rhs_expr = model.b
 model.con = pe.Constraint(expr = (con_lhs_expr <= con_rhs_expr))
 
-result = solver.solve(model)
+if engine == 'pyomo':
+    result = solver.solve(model)
+else:
+    values = [model.c[i] for i in model.N]
+    weights = [model.a[i] for i in model.N]
+    selected, _, _ = knapsack_engine(values, weights, pe.value(model.b), method=engine)
+    for i, chosen in zip(model.N, selected):
+        model.x[i].set_value(int(chosen))
 
 for i in model.N:
     print(pe.value(model.x[i]))
@@ -0,0 +1,229 @@
+import json
+import os
+import queue
+import re
+import signal
+import subprocess
+import sys
+import threading
+import time
+from tkinter import *
+from tkinter import filedialog, messagebox
+
+import problems
+import solution_cache
+from instances import json_default
+
+# Η επίλυση τρέχει ως ξεχωριστή διεργασία του cli.py, ώστε να μπορεί να τερματιστεί μαζί με τον solver
+CLI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cli.py")
+
+# Κάθε πόσα ms ελέγχεται η ουρά με το log του solver
+POLL_MS = 100
+
+# Γραμμές του log με νέα εφικτή λύση (GLPK, CBC)
+INCUMBENT_PATTERNS = [
+    re.compile(r"mip =\s*([-+]?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)"),
+    re.compile(r"Integer solution of\s*([-+]?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)"),
+]
+
+
+# Πλαίσιο με το log του solver, τον χρόνο/την τρέχουσα λύση και κουμπί Cancel
+def solver_panel(root, row, columnspan=2):
+    frame = Frame(root)
+    frame.grid(row=row, column=0, columnspan=columnspan, sticky="nsew")
+
+    log = Text(frame, height=12, width=80, state=DISABLED)
+    scrollbar = Scrollbar(frame, command=log.yview)
+    log.configure(yscrollcommand=scrollbar.set)
+    log.grid(row=0, column=0, columnspan=2, sticky="nsew")
+    scrollbar.grid(row=0, column=2, sticky="ns")
+
+    status = Label(frame, text="Idle", anchor="w")
+    status.grid(row=1, column=0, sticky="w")
+    cancel = Button(frame, text="Cancel", state=DISABLED)
+    cancel.grid(row=1, column=1, sticky="e")
+
+    panel = {"root": root, "log": log, "status": status, "cancel": cancel, "process": None}
+    cancel.configure(command=lambda: cancel_solve(panel))
+    return panel
+
+
+def _append_log(panel, text):
+    log = panel["log"]
+    log.configure(state=NORMAL)
+    log.insert(END, text)
+    log.see(END)
+    log.configure(state=DISABLED)
+
+
+# Κουμπί δίπλα σε πεδίο κειμένου για δεδομένα από αρχείο CSV, NPY ή Parquet. Επιστρέφει dict με
+# τη διαδρομή ("path", None όταν δεν έχει επιλεγεί αρχείο): το αρχείο δεν διαβάζεται από το GUI
+# αλλά από τη διεργασία της επίλυσης, οπότε μεγάλοι πίνακες δεν περνούν από το πεδίο κειμένου.
+def file_input(root, row, column=2):
+    source = {"path": None}
+    frame = Frame(root)
+    frame.grid(row=row, column=column, sticky="nw")
+    name = Label(frame, text="", anchor="w")
+
+    def choose():
+        path = filedialog.askopenfilename(
+            filetypes=[("Arrays", "*.csv *.npy *.parquet"), ("All files", "*")]
+        )
+        source["path"] = path or None
+        name.configure(text=os.path.basename(path) if path else "")
+
+    def clear():
+        source["path"] = None
+        name.configure(text="")
+
+    Button(frame, text="Load file...", command=choose).grid(row=0, column=0, sticky="w")
+    Button(frame, text="Clear", command=clear).grid(row=0, column=1, sticky="w")
+    name.grid(row=1, column=0, columnspan=2, sticky="w")
+    return source
+
+
+# Ανάγνωση γραμμών από το stdout/stderr της διεργασίας σε ξεχωριστό thread (None = τέλος)
+def _reader(stream, kind, messages):
+    for line in iter(stream.readline, ""):
+        messages.put((kind, line))
+    stream.close()
+    messages.put((kind, None))
+
+
+def _writer(stream, text):
+    try:
+        stream.write(text)
+        stream.close()
+    except OSError:
+        pass  # η διεργασία τερματίστηκε πριν διαβάσει την είσοδο
+
+
+# Επίλυση στο παρασκήνιο: το mainloop συνεχίζει, το log εμφανίζεται στο panel
+# και το on_result(result) καλείται στο thread του Tk όταν τελειώσει η επίλυση
+def run_in_background(panel, problem, instance, options, on_result):
+    if panel["process"] is not None:
+        messagebox.showwarning("Busy", "A solve is already running.")
+        return
+
+    cached = solution_cache.lookup(problem, instance, **options)
+    if cached is not None:
+        panel["status"].configure(text="Solution returned from the cache")
+        on_result(cached)
+        return
+
+    command = [sys.executable, "-u", CLI, "--tee", "-"]
+    for name, value in options.items():
+        command += [f"--{name}", str(value)]
+    # Χωρίς επιλογή solver: ο solver με τις περισσότερες νίκες στο portfolio (αρχικά το GLPK),
+    # μόνο για engines που χρησιμοποιούν solver
+    if "solver" not in options and problems.uses_solver(problem, options):
+        command += ["--solver", "auto"]
+
+    # Νέα ομάδα διεργασιών, ώστε το Cancel να τερματίζει και τον solver
+    if os.name == "posix":
+        group = {"start_new_session": True}
+    else:
+        group = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    process = subprocess.Popen(
+        command,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",
+        **group,
+    )
+
+    messages = queue.Queue()
+    line = json.dumps(dict(instance, problem=problem), default=json_default) + "\n"
+    threading.Thread(target=_writer, args=(process.stdin, line), daemon=True).start()
+    threading.Thread(target=_reader, args=(process.stdout, "result", messages), daemon=True).start()
+    threading.Thread(target=_reader, args=(process.stderr, "log", messages), daemon=True).start()
+
+    panel.update(
+        process=process,
+        messages=messages,
+        open_streams=2,
+        output=[],
+        start=time.perf_counter(),
+        incumbent=None,
+        cancelled=False,
+        request=(problem, instance, options),
+        on_result=on_result,
+    )
+    log = panel["log"]
+    log.configure(state=NORMAL)
+    log.delete("1.0", END)
+    log.configure(state=DISABLED)
+    panel["cancel"].configure(state=NORMAL)
+    panel["root"].after(POLL_MS, _poll, panel)
+
+
+# Μεταφορά των μηνυμάτων από την ουρά στο GUI (καλείται με root.after)
+def _poll(panel):
+    messages = panel["messages"]
+    while True:
+        try:
+            kind, line = messages.get_nowait()
+        except queue.Empty:
+            break
+        if line is None:
+            panel["open_streams"] -= 1
+        elif kind == "log":
+            _append_log(panel, line)
+            for pattern in INCUMBENT_PATTERNS:
+                match = pattern.search(line)
+                if match:
+                    panel["incumbent"] = float(match.group(1))
+        else:
+            panel["output"].append(line)
+
+    elapsed = time.perf_counter() - panel["start"]
+    status = f"Running... {elapsed:.1f} s"
+    if panel["incumbent"] is not None:
+        status += f" | Incumbent: {panel['incumbent']:g}"
+    panel["status"].configure(text=status)
+
+    if panel["open_streams"] > 0 or panel["process"].poll() is None:
+        panel["root"].after(POLL_MS, _poll, panel)
+    else:
+        _finish(panel, elapsed)
+
+
+def _finish(panel, elapsed):
+    process = panel["process"]
+    panel["process"] = None
+    panel["cancel"].configure(state=DISABLED)
+
+    if panel["cancelled"]:
+        panel["status"].configure(text=f"Cancelled after {elapsed:.1f} s")
+        return
+    panel["status"].configure(text=f"Finished in {elapsed:.1f} s")
+
+    try:
+        output = "".join(panel["output"]).strip()
+        if not output:
+            raise RuntimeError(f"The solver process exited with code {process.returncode}.")
+        record = json.loads(output.splitlines()[-1])
+        if "error" in record:
+            raise RuntimeError(record["error"])
+        problem, instance, options = panel["request"]
+        solution_cache.store(problem, instance, record["result"], **options)
+        panel["on_result"](record["result"])
+    except Exception as e:
+        messagebox.showerror("Error", f"An error occurred: {e}")
+
+
+# Τερματισμός της επίλυσης: σκοτώνεται όλη η ομάδα διεργασιών (cli.py και solver)
+def cancel_solve(panel):
+    process = panel["process"]
+    if process is None or process.poll() is not None:
+        return
+    panel["cancelled"] = True
+    try:
+        if os.name == "posix":
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            subprocess.call(["taskkill", "/F", "/T", "/PID", str(process.pid)])
+    except ProcessLookupError:
+        pass
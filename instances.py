@@ -0,0 +1,188 @@
+import io
+import itertools
+import json
+import os
+
+import numpy as np
+
+# Το πεδίο που γεμίζει ένα αρχείο με έναν μόνο πίνακα (CSV/NPY) για κάθε πρόβλημα
+MATRIX_FIELDS = {
+    "assignment": "costs",
+    "scheduling": "durations",
+    "facility": "transport_costs",
+    "vrp": "costs",
+}
+
+ARRAY_EXTENSIONS = (".csv", ".npy", ".parquet")
+
+# Αριθμοί ανά κομμάτι στη φόρτωση CSV/Parquet: πέρα από τον τελικό πίνακα η μνήμη μένει
+# περίπου σταθερή (8 MB), όσο μεγάλο κι αν είναι το αρχείο
+CHUNK_VALUES = 1 << 20
+
+# Αρχεία MPS / CPLEX LP: διαβάζονται ως sparse_mip
+MIP_EXTENSIONS = (".mps", ".lp")
+
+
+# Μετατροπή κειμένου με αριθμούς χωρισμένους με κενά σε λίστα
+def parse_vector(text):
+    return list(map(float, text.split()))
+
+
+# Μετατροπή κειμένου (μία γραμμή ανά σειρά, αριθμοί χωρισμένοι με κενά) σε πίνακα NumPy
+def parse_matrix(text):
+    if not text.strip():
+        return np.empty((0, 0))
+    try:
+        return np.loadtxt(io.StringIO(text), ndmin=2)
+    except ValueError as e:
+        raise ValueError(f"The matrix is not rectangular or contains non-numbers: {e}") from None
+
+
+# Έλεγχος διαστάσεων (None: οποιοδήποτε μέγεθος σε αυτή τη διάσταση), π.χ. check_shape(costs.shape, (n, n), "costs")
+def check_shape(shape, expected, name="array"):
+    shape, expected = tuple(shape), tuple(expected)
+    if len(shape) != len(expected) or any(e is not None and s != e for s, e in zip(shape, expected)):
+        wanted = ", ".join("any" if e is None else str(e) for e in expected)
+        raise ValueError(f"{name} must have shape ({wanted}), got ({', '.join(map(str, shape))}).")
+
+
+# Πίνακας με μία γραμμή ή στήλη γίνεται διάνυσμα, όπως στο np.loadtxt(..., ndmin=1)
+def _squeeze_shape(rows, columns):
+    return (rows * columns,) if rows == 1 or columns == 1 else (rows, columns)
+
+
+# Οι γραμμές δεδομένων ενός CSV (χωρίς κενές γραμμές και σχόλια #)
+def _csv_lines(f):
+    return (line for line in f if line.strip() and not line.lstrip().startswith("#"))
+
+
+def _csv_shape(path):
+    rows = 0
+    columns = 0
+    with open(path, encoding="utf-8") as f:
+        for line in _csv_lines(f):
+            if rows == 0:
+                columns = line.count(",") + 1
+            rows += 1
+    return rows, columns
+
+
+def _parquet_file(path):
+    import pyarrow.parquet as pq
+
+    return pq.ParquetFile(path)
+
+
+# Διαστάσεις του πίνακα ενός αρχείου CSV, NPY ή Parquet χωρίς να φορτωθούν τα δεδομένα: από την
+# κεφαλίδα του NPY, τα metadata του Parquet ή μετρώντας τις γραμμές του CSV
+def array_shape(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".npy":
+        return np.load(path, mmap_mode="r").shape
+    if extension == ".csv":
+        return _squeeze_shape(*_csv_shape(path))
+    if extension == ".parquet":
+        metadata = _parquet_file(path).metadata
+        return _squeeze_shape(metadata.num_rows, metadata.num_columns)
+    raise ValueError(f"Unsupported array file: {path}")
+
+
+# CSV σε κομμάτια γραμμών, κατευθείαν στον τελικό πίνακα (χωρίς λίστες Python για όλο το αρχείο)
+def _load_csv(path):
+    rows, columns = _csv_shape(path)
+    array = np.empty((rows, columns))
+    chunk_rows = max(1, CHUNK_VALUES // max(columns, 1))
+    with open(path, encoding="utf-8") as f:
+        lines = _csv_lines(f)
+        for start in range(0, rows, chunk_rows):
+            try:
+                chunk = np.loadtxt(itertools.islice(lines, chunk_rows), delimiter=",", ndmin=2)
+            except ValueError as e:
+                raise ValueError(f"{path}: {e}") from None
+            if chunk.shape[1] != columns:
+                raise ValueError(f"{path}: expected {columns} columns, found {chunk.shape[1]} near data row {start + 1}.")
+            array[start:start + len(chunk)] = chunk
+    return array.reshape(_squeeze_shape(rows, columns))
+
+
+# Parquet ανά ομάδες γραμμών: κάθε στήλη του αρχείου είναι μία στήλη του πίνακα
+def _load_parquet(path):
+    parquet = _parquet_file(path)
+    rows, columns = parquet.metadata.num_rows, parquet.metadata.num_columns
+    array = np.empty((rows, columns))
+    start = 0
+    for batch in parquet.iter_batches(batch_size=max(1, CHUNK_VALUES // max(columns, 1))):
+        stop = start + batch.num_rows
+        for j, column in enumerate(batch.columns):
+            array[start:stop, j] = column.to_numpy(zero_copy_only=False)
+        start = stop
+    return array.reshape(_squeeze_shape(rows, columns))
+
+
+# Φόρτωση πίνακα από αρχείο CSV, NPY ή Parquet. Το NPY γίνεται memory-mapped (τα δεδομένα
+# διαβάζονται από τον δίσκο όταν χρειαστούν), τα CSV/Parquet διαβάζονται σε κομμάτια.
+# shape: αναμενόμενες διαστάσεις, όπως στο check_shape.
+def load_array(path, shape=None):
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".npy":
+        array = np.load(path, mmap_mode="r")
+    elif extension == ".csv":
+        array = _load_csv(path)
+    elif extension == ".parquet":
+        array = _load_parquet(path)
+    else:
+        raise ValueError(f"Unsupported array file: {path}")
+    if shape is not None:
+        check_shape(array.shape, shape, path)
+    return array
+
+
+# Τιμή πεδίου instance από το GUI: το αρχείο που επιλέχθηκε (ελέγχονται μόνο οι διαστάσεις του
+# και η επίλυση το φορτώνει απευθείας) ή ο πίνακας από το πεδίο κειμένου
+def input_array(text, path, shape, name, parse=parse_matrix):
+    if path:
+        check_shape(array_shape(path), shape, name)
+        return os.path.abspath(path)
+    array = np.asarray(parse(text), dtype=float)
+    check_shape(array.shape, shape, name)
+    return array
+
+
+# Instance από dict (όπως σε αρχείο JSON). Πεδία με τιμή όνομα αρχείου .csv/.npy/.parquet φορτώνονται
+# σχετικά με το base_dir. Επιστρέφει (problem, instance).
+def instance_from_dict(data, problem=None, base_dir="."):
+    data = dict(data)
+    problem = data.pop("problem", problem)
+    if problem is None:
+        raise ValueError("The instance does not specify its problem type.")
+    for key, value in data.items():
+        if isinstance(value, str) and os.path.splitext(value)[1].lower() in ARRAY_EXTENSIONS:
+            data[key] = load_array(os.path.join(base_dir, value))
+    return problem, data
+
+
+# Φόρτωση instance από αρχείο JSON, CSV, NPY, Parquet, MPS ή LP. Για CSV/NPY/Parquet πρέπει να δοθεί το problem.
+def load_instance(path, problem=None):
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".json":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return instance_from_dict(data, problem, os.path.dirname(path))
+    if extension in MIP_EXTENSIONS:
+        from mip_readers import read_mip_file
+
+        return "sparse_mip", read_mip_file(path)
+    if extension in ARRAY_EXTENSIONS:
+        if problem not in MATRIX_FIELDS:
+            raise ValueError(f"A {extension} instance needs one of the problems: {', '.join(MATRIX_FIELDS)}")
+        return problem, {MATRIX_FIELDS[problem]: load_array(path)}
+    raise ValueError(f"Unsupported instance file: {path}")
+
+
+# Μετατροπή τύπων NumPy για json.dumps
+def json_default(obj):
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
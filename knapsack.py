@@ -0,0 +1,366 @@
+import time
+
+import numpy as np
+import pyomo.environ as pe
+
+from model_templates import get_template, solve_template
+from solution_arrays import selected_indices
+from solve_metrics import phase
+from solver_backends import solve_model
+
+# Μέγιστο πλήθος κελιών (αντικείμενα x (χωρητικότητα + 1)) για τον πίνακα του δυναμικού προγραμματισμού
+DP_CELL_LIMIT = 10**8
+
+# Εκτιμώμενο κόστος (σε δευτερόλεπτα) ανά κελί DP και ανά κόμβο branch-and-bound
+DP_CELL_COST = 2e-9
+BB_NODE_COST = 2e-6
+
+# Όριο κόμβων του branch-and-bound στο engine="auto" (περίπου 0.5 s): σε δύσκολα instances
+# (π.χ. αξίες συσχετισμένες με τα βάρη) ο αριθμός των κόμβων αυξάνεται εκθετικά, οπότε μετά το
+# όριο η επίλυση συνεχίζεται με το μοντέλο MIP
+AUTO_MAX_NODES = 100_000
+
+
+# Έλεγχος και μετατροπή των δεδομένων σε πίνακες NumPy
+def _prepare(values, weights, capacity):
+    values = np.asarray(values, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    if values.ndim != 1 or values.shape != weights.shape:
+        raise ValueError("The number of values and weights must be the same.")
+    if (weights < 0).any():
+        raise ValueError("The weights must be non-negative.")
+    if capacity < 0:
+        raise ValueError("The knapsack capacity must be non-negative.")
+    return values, weights, float(capacity)
+
+
+# Ακέραια βάρη για το DP: είτε τα βάρη είναι ήδη ακέραια είτε κλιμακώνονται με το scale.
+# Τα κλιμακωμένα βάρη στρογγυλοποιούνται προς τα πάνω, ώστε κάθε λύση να είναι εφικτή. Το exact
+# είναι False όταν η στρογγυλοποίηση άλλαξε κάποιο βάρος: τότε η λύση του DP δεν είναι απαραίτητα βέλτιστη.
+def _integer_weights(weights, capacity, scale=None):
+    if scale is None:
+        if not np.all(weights == np.floor(weights)):
+            return None
+        return weights.astype(np.int64), int(np.floor(capacity)), True
+    scaled = weights * scale
+    scaled_weights = np.ceil(scaled - 1e-9).astype(np.int64)
+    exact = bool(np.all(np.abs(scaled - scaled_weights) <= 1e-9))
+    return scaled_weights, int(np.floor(capacity * scale + 1e-9)), exact
+
+
+# Δυναμικός προγραμματισμός O(n*C), διανυσματικά πάνω στον άξονα της χωρητικότητας.
+# Με scale που στρογγυλοποιεί βάρη η λύση είναι εφικτή αλλά όχι εγγυημένα βέλτιστη (optimal=False).
+def knapsack_dp(values, weights, capacity, scale=None):
+    values, weights, capacity = _prepare(values, weights, capacity)
+    integer = _integer_weights(weights, capacity, scale)
+    if integer is None:
+        raise ValueError("The DP engine requires integer weights or a scale factor.")
+    int_weights, int_capacity, exact = integer
+
+    # Μόνο αντικείμενα με θετική αξία που χωράνε στο σακίδιο
+    items = np.nonzero((values > 0) & (int_weights <= int_capacity))[0]
+
+    # best[c] = μέγιστη αξία με συνολικό βάρος <= c
+    best = np.zeros(int_capacity + 1)
+    take = np.zeros((len(items), int_capacity + 1), dtype=bool)
+    for k, i in enumerate(items):
+        w = int_weights[i]
+        candidate = best[:int_capacity + 1 - w] + values[i]
+        improved = candidate > best[w:]
+        take[k, w:] = improved
+        best[w:] = np.where(improved, candidate, best[w:])
+
+    # Ανακατασκευή της λύσης από το τέλος προς την αρχή
+    selected = np.zeros(len(values), dtype=bool)
+    c = int_capacity
+    for k in range(len(items) - 1, -1, -1):
+        if take[k, c]:
+            selected[items[k]] = True
+            c -= int_weights[items[k]]
+
+    return selected, float(values[selected].sum()), exact
+
+
+# Branch-and-bound (Horowitz-Sahni) με το κλασματικό φράγμα του Dantzig.
+# Με max_nodes η αναζήτηση σταματά νωρίτερα και επιστρέφεται η καλύτερη λύση που βρέθηκε.
+def knapsack_bb(values, weights, capacity, max_nodes=None):
+    values, weights, capacity = _prepare(values, weights, capacity)
+    selected = np.zeros(len(values), dtype=bool)
+
+    # Αντικείμενα με μηδενικό βάρος και θετική αξία μπαίνουν πάντα
+    selected[(weights == 0) & (values > 0)] = True
+
+    # Ταξινόμηση κατά φθίνουσα αναλογία αξίας/βάρους
+    items = np.nonzero((weights > 0) & (values > 0) & (weights <= capacity))[0]
+    order = items[np.argsort(-(values[items] / weights[items]), kind="stable")]
+    p = values[order]
+    w = weights[order]
+    m = len(order)
+    P = np.concatenate(([0.0], np.cumsum(p)))
+    W = np.concatenate(([0.0], np.cumsum(w)))
+    eps = 1e-9 * max(1.0, P[-1])
+
+    # Μεγαλύτερο s >= j ώστε τα αντικείμενα j..s-1 να χωράνε μαζί στο room
+    def fill(j, room):
+        s = int(np.searchsorted(W, W[j] + room, side="right")) - 1
+        while s > j and W[s] - W[j] > room:
+            s -= 1
+        return s
+
+    # Φράγμα Dantzig: άπληστη γέμιση και κλασματικό κομμάτι του πρώτου αντικειμένου που δεν χωράει
+    def bound(j, room):
+        s = fill(j, room)
+        value = P[s] - P[j]
+        if s < m:
+            value += (room - (W[s] - W[j])) * p[s] / w[s]
+        return value
+
+    x = np.zeros(m, dtype=bool)
+    stack = []
+    best_value = 0.0
+    best_x = x.copy()
+    value = 0.0
+    room = capacity
+    j = 0
+    nodes = 0
+    optimal = True
+
+    while True:
+        # Προς τα εμπρός: άπληστη γέμιση μέχρι φύλλο ή κλάδεμα
+        pruned = False
+        while j < m:
+            nodes += 1
+            if max_nodes is not None and nodes > max_nodes:
+                optimal = False
+                break
+            if value + bound(j, room) <= best_value + eps:
+                pruned = True
+                break
+            s = fill(j, room)
+            if s > j:
+                x[j:s] = True
+                stack.extend(range(j, s))
+                value += P[s] - P[j]
+                room -= W[s] - W[j]
+                j = s
+            if j < m:
+                # Το αντικείμενο j δεν χωράει
+                j += 1
+        if not optimal:
+            break
+        if not pruned and value > best_value + eps:
+            best_value = value
+            best_x = x.copy()
+
+        # Οπισθοδρόμηση: αφαίρεση του τελευταίου επιλεγμένου αντικειμένου
+        if not stack:
+            break
+        i = stack.pop()
+        x[i] = False
+        value -= p[i]
+        room += w[i]
+        j = i + 1
+
+    selected[order[best_x]] = True
+    return selected, float(values[selected].sum()), optimal
+
+
+# Επιλογή μεθόδου με βάση το εκτιμώμενο κόστος: DP όταν τα βάρη είναι ακέραια (ή γίνονται
+# ακέραια με το scale χωρίς στρογγυλοποίηση) και ο πίνακας είναι μικρός, αλλιώς branch-and-bound
+def choose_method(values, weights, capacity, scale=None):
+    values, weights, capacity = _prepare(values, weights, capacity)
+    integer = _integer_weights(weights, capacity, scale)
+    if integer is None or not integer[2]:
+        return "bb"
+    n = len(values)
+    cells = n * (integer[1] + 1)
+    if cells > DP_CELL_LIMIT:
+        return "bb"
+    dp_cost = cells * DP_CELL_COST
+    bb_cost = n * np.log2(n + 1) * BB_NODE_COST
+    return "dp" if dp_cost <= bb_cost else "bb"
+
+
+# Επίλυση του knapsack χωρίς εξωτερικό solver: method = "auto", "dp" ή "bb"
+def knapsack_engine(values, weights, capacity, method="auto", scale=None, max_nodes=None):
+    if method == "auto":
+        method = choose_method(values, weights, capacity, scale)
+    if method == "dp":
+        return knapsack_dp(values, weights, capacity, scale)
+    if method == "bb":
+        return knapsack_bb(values, weights, capacity, max_nodes)
+    raise ValueError(f"Unknown knapsack method: {method}")
+
+
+# DP πάνω σε ένα κομμάτι του batch: ο πίνακας best έχει σχήμα (instances, χωρητικότητα + 1)
+def _batch_dp(values, weights, capacities):
+    num_instances, num_items = values.shape
+    max_capacity = int(capacities.max()) if num_instances else 0
+    rows = np.arange(num_instances)[:, None]
+    cols = np.arange(max_capacity + 1)[None, :]
+
+    best = np.zeros((num_instances, max_capacity + 1))
+    take = np.zeros((num_items, num_instances, max_capacity + 1), dtype=bool)
+    for i in range(num_items):
+        value = values[:, i][:, None]
+        source = cols - weights[:, i][:, None]
+        candidate = best[rows, np.maximum(source, 0)] + value
+        improved = (source >= 0) & (value > 0) & (candidate > best)
+        take[i] = improved
+        best = np.where(improved, candidate, best)
+
+    # Ανακατασκευή όλων των λύσεων μαζί, από το τελευταίο αντικείμενο προς το πρώτο
+    instances = np.arange(num_instances)
+    c = capacities.copy()
+    selected = np.zeros((num_instances, num_items), dtype=bool)
+    for i in range(num_items - 1, -1, -1):
+        chosen = take[i, instances, c]
+        selected[:, i] = chosen
+        c = c - np.where(chosen, weights[:, i], 0)
+
+    return selected, (values * selected).sum(axis=1)
+
+
+# Επίλυση πολλών μικρών knapsack μαζί. values και weights έχουν σχήμα (instances, αντικείμενα)
+# και capacities σχήμα (instances,). Instances με λιγότερα αντικείμενα συμπληρώνονται με μηδενικά.
+def knapsack_batch(values, weights, capacities, scale=None, chunk_size=4096):
+    start = time.perf_counter()
+    values = np.asarray(values, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    capacities = np.asarray(capacities, dtype=float)
+    if values.ndim != 2 or values.shape != weights.shape:
+        raise ValueError("Values and weights must be arrays of the same shape (instances, items).")
+    if capacities.shape != (values.shape[0],):
+        raise ValueError("There must be exactly one capacity per instance.")
+    if (weights < 0).any() or (capacities < 0).any():
+        raise ValueError("Weights and capacities must be non-negative.")
+
+    if scale is None:
+        if not np.all(weights == np.floor(weights)):
+            raise ValueError("The batch engine requires integer weights or a scale factor.")
+        int_weights = weights.astype(np.int64)
+        int_capacities = np.floor(capacities).astype(np.int64)
+        exact = True
+    else:
+        scaled = weights * scale
+        int_weights = np.ceil(scaled - 1e-9).astype(np.int64)
+        int_capacities = np.floor(capacities * scale + 1e-9).astype(np.int64)
+        exact = bool(np.all(np.abs(scaled - int_weights) <= 1e-9))
+
+    # Επίλυση ανά κομμάτια, ώστε ο πίνακας take να μένει σε περιορισμένη μνήμη
+    num_instances = values.shape[0]
+    selected = np.zeros(values.shape, dtype=bool)
+    objective = np.zeros(num_instances)
+    for lo in range(0, num_instances, chunk_size):
+        hi = min(lo + chunk_size, num_instances)
+        selected[lo:hi], objective[lo:hi] = _batch_dp(values[lo:hi], int_weights[lo:hi], int_capacities[lo:hi])
+
+    elapsed = time.perf_counter() - start
+    return {
+        "selected": selected,
+        "objective": objective,
+        # False όταν το scale στρογγυλοποίησε βάρη: οι λύσεις είναι εφικτές αλλά όχι εγγυημένα βέλτιστες
+        "optimal": exact,
+        "elapsed": elapsed,
+        "instances_per_second": num_instances / elapsed if elapsed > 0 else float("inf"),
+    }
+
+
+# Δημιουργία μοντέλου Pyomo για το Knapsack Problem.
+# mutable=True: αξίες, βάρη και χωρητικότητα μπαίνουν σε mutable Params για επαναλαμβανόμενες επιλύσεις
+def build_knapsack_model(values, weights, capacity, mutable=False):
+    values = np.asarray(values, dtype=float).tolist()
+    weights = np.asarray(weights, dtype=float).tolist()
+    model = pe.ConcreteModel()
+
+    # Σετ αντικειμένων
+    model.item_set = pe.Set(initialize=range(len(values)))
+
+    # Μεταβλητές απόφασης (binary): Αν το αντικείμενο i μπει στο σακίδιο
+    model.x = pe.Var(model.item_set, domain=pe.Binary)
+
+    if mutable:
+        model.item_value = pe.Param(model.item_set, mutable=True, initialize=lambda model, i: values[i])
+        model.item_weight = pe.Param(model.item_set, mutable=True, initialize=lambda model, i: weights[i])
+        model.capacity = pe.Param(mutable=True, initialize=float(capacity))
+
+    # Συνάρτηση στόχου: Μέγιστη συνολική αξία
+    def objective_rule(model):
+        if mutable:
+            return sum(model.x[i] * model.item_value[i] for i in model.item_set)
+        return sum(model.x[i] * values[i] for i in model.item_set)
+
+    model.obj = pe.Objective(rule=objective_rule, sense=pe.maximize)
+
+    # Περιορισμός: Το συνολικό βάρος να μην υπερβαίνει τη χωρητικότητα
+    def weight_constraint_rule(model):
+        if mutable:
+            return sum(model.x[i] * model.item_weight[i] for i in model.item_set) <= model.capacity
+        return sum(model.x[i] * weights[i] for i in model.item_set) <= float(capacity)
+
+    model.weight_constraint = pe.Constraint(rule=weight_constraint_rule)
+
+    return model
+
+
+# Νέα δεδομένα σε μοντέλο που χτίστηκε με mutable=True (ίδιο πλήθος αντικειμένων)
+def set_knapsack_data(model, values, weights, capacity):
+    for param, value in zip(model.item_value.values(), np.asarray(values, dtype=float).tolist()):
+        param.set_value(value)
+    for param, weight in zip(model.item_weight.values(), np.asarray(weights, dtype=float).tolist()):
+        param.set_value(weight)
+    model.capacity.set_value(float(capacity))
+
+
+# Ανάγνωση αποτελεσμάτων από λυμένο μοντέλο
+def extract_knapsack(model):
+    selected = selected_indices(model.x)
+    return {"total_value": pe.value(model.obj), "selected": selected}
+
+
+# Επίλυση του Knapsack Problem χωρίς GUI.
+# engine="auto", "dp" ή "bb": απευθείας επίλυση, engine="pyomo": μοντέλο MIP με εξωτερικό solver
+# reuse_model=True: ένα μοντέλο ανά πλήθος αντικειμένων και solver, όπου αλλάζουν μόνο τα Params
+# scale: κλιμάκωση των βαρών για το DP, max_nodes: όριο κόμβων του branch-and-bound. Στο "auto"
+# το branch-and-bound έχει όριο AUTO_MAX_NODES και, αν δεν προλάβει να αποδείξει τη βέλτιστη
+# λύση, το instance λύνεται με το μοντέλο MIP (με τον solver).
+def solve_knapsack(values, weights, capacity, engine="pyomo", solver="glpk", tee=False, reuse_model=False,
+                   scale=None, max_nodes=None):
+    values, weights, capacity = _prepare(values, weights, capacity)
+
+    incumbent = None
+    if engine != "pyomo":
+        method = choose_method(values, weights, capacity, scale) if engine == "auto" else engine
+        if engine == "auto" and max_nodes is None:
+            max_nodes = AUTO_MAX_NODES
+        selected, total_value, optimal = knapsack_engine(values, weights, capacity, method, scale, max_nodes)
+        incumbent = {"total_value": total_value, "selected": np.nonzero(selected)[0].tolist()}
+        # Μη βέλτιστη λύση: από το όριο κόμβων του branch-and-bound ή από DP με στρογγυλοποιημένα βάρη
+        if optimal:
+            return {"status": "optimal", **incumbent}
+        if engine != "auto" or method != "bb":
+            return {"status": "maxIterations" if method == "bb" else "feasible", **incumbent}
+
+    if reuse_model:
+        key = ("knapsack", len(values), solver)
+        with phase("build"):
+            template, created = get_template(key, lambda: build_knapsack_model(values, weights, capacity, mutable=True), solver)
+            model = template["model"]
+            if not created:
+                set_knapsack_data(model, values, weights, capacity)
+        status = solve_template(template, tee, changed=[model.weight_constraint])
+    else:
+        with phase("build"):
+            model = build_knapsack_model(values, weights, capacity)
+        status = solve_model(model, solver, tee)
+    if status != "optimal":
+        # Αν ο solver δεν βρει τη βέλτιστη λύση, μένει η λύση του branch-and-bound (αν υπάρχει)
+        if incumbent is not None:
+            return {"status": "feasible", **incumbent}
+        return {"status": status, "total_value": None, "selected": []}
+    with phase("format"):
+        solution = extract_knapsack(model)
+    # Ο MIP solver σταματά μέσα στην ανοχή του gap: κρατιέται η καλύτερη από τις δύο λύσεις
+    if incumbent is not None and incumbent["total_value"] > solution["total_value"]:
+        solution = incumbent
+    return {"status": status, **solution}
@@ -0,0 +1,334 @@
+import numpy as np
+import pyomo.environ as pe
+
+from facility import _prepare
+from mip import build_sparse_mip_model, solve_csr_highs
+from solution_arrays import round_integral, var_values
+from solve_metrics import phase
+from solver_backends import solve_model
+
+# Γραμμές/στήλες ανά κομμάτι κατά την εγγραφή αρχείων MPS/LP: το κείμενο φτιάχνεται ανά κομμάτι
+# και γράφεται αμέσως, ώστε να μην υπάρχει ποτέ ολόκληρο στη μνήμη
+WRITE_CHUNK = 1 << 16
+
+# Μοντέλα σε μορφή πινάκων, χωρίς αντικείμενα Pyomo: ένα dict με
+#   cost, col_lower, col_upper, integer   ανά στήλη (float64, float64, float64, bool)
+#   row_lower, row_upper                  ανά γραμμή (float64)
+#   indptr, indices, data                 πίνακας περιορισμών CSR (int32/int64, int32, float64)
+#   maximize, offset
+# Μνήμη: 12 bytes ανά μη μηδενικό (data + indices), 25 bytes ανά στήλη και 20 ανά γραμμή
+# (8 για το indptr όταν τα μη μηδενικά ξεπερνούν τα 2^31). Το μοντέλο Pyomo του ίδιου
+# προβλήματος θέλει γύρω στο 1 KB ανά μεταβλητή και ανά περιορισμό. Ο HiGHS κρατά δικό του
+# αντίγραφο (περίπου άλλα τόσα).
+
+
+def _index_dtype(size):
+    return np.int32 if size < 2**31 else np.int64
+
+
+# Μοντέλο πινάκων για το Assignment Problem (n x n): στήλη w * n + t για την ανάθεση της
+# εργασίας t στον εργάτη w, πρώτα οι γραμμές των εργατών και μετά οι γραμμές των εργασιών
+# (όπως στο build_assignment_model)
+def assignment_matrix(costs):
+    costs = np.asarray(costs, dtype=float)
+    if costs.ndim != 2 or costs.shape[0] != costs.shape[1]:
+        raise ValueError("The Assignment Problem requires an equal number of workers and jobs.")
+    n = costs.shape[0]
+    size = n * n
+    dtype = _index_dtype(2 * size + 1)
+
+    # Γραμμή εργάτη w: στήλες w * n .. w * n + n - 1, γραμμή εργασίας t: στήλες t, n + t, 2n + t, ...
+    workers = np.arange(size, dtype=np.int32)
+    tasks = (np.arange(n, dtype=np.int32)[None, :] * n + np.arange(n, dtype=np.int32)[:, None]).ravel()
+    return {
+        "cost": costs.ravel(),
+        "col_lower": np.zeros(size),
+        "col_upper": np.ones(size),
+        "integer": np.ones(size, dtype=bool),
+        "row_lower": np.ones(2 * n),
+        "row_upper": np.ones(2 * n),
+        "indptr": np.arange(2 * n + 1, dtype=dtype) * n,
+        "indices": np.concatenate([workers, tasks]),
+        "data": np.ones(2 * size),
+        "maximize": False,
+        "offset": 0.0,
+    }
+
+
+# Μοντέλο πινάκων για το Facility Location Problem: στήλες y_f (0 .. F-1) και x_fc (F + f * C + c),
+# πρώτα οι γραμμές των πελατών (sum_f x_fc = 1) και μετά x_fc - y_f <= 0 για κάθε f, c
+# (όπως στο build_facility_model)
+def facility_matrix(facility_costs, transport_costs):
+    facility_costs, transport_costs = _prepare(facility_costs, transport_costs)
+    num_facilities, num_clients = transport_costs.shape
+    pairs = num_facilities * num_clients
+    dtype = _index_dtype(3 * pairs + 1)
+
+    facilities = np.arange(num_facilities, dtype=np.int32)
+    clients = (num_facilities + facilities[None, :] * num_clients
+               + np.arange(num_clients, dtype=np.int32)[:, None]).ravel()
+    links = np.empty((pairs, 2), dtype=np.int32)
+    links[:, 0] = np.repeat(facilities, num_clients)
+    links[:, 1] = np.arange(num_facilities, num_facilities + pairs, dtype=np.int32)
+    link_data = np.empty((pairs, 2))
+    link_data[:, 0] = -1.0
+    link_data[:, 1] = 1.0
+    return {
+        "cost": np.concatenate([facility_costs, transport_costs.ravel()]),
+        "col_lower": np.zeros(num_facilities + pairs),
+        "col_upper": np.ones(num_facilities + pairs),
+        "integer": np.ones(num_facilities + pairs, dtype=bool),
+        "row_lower": np.concatenate([np.ones(num_clients), np.full(pairs, -np.inf)]),
+        "row_upper": np.concatenate([np.ones(num_clients), np.zeros(pairs)]),
+        "indptr": np.concatenate([
+            np.arange(num_clients, dtype=dtype) * num_facilities,
+            pairs + np.arange(pairs + 1, dtype=dtype) * 2,
+        ]),
+        "indices": np.concatenate([clients, links.ravel()]),
+        "data": np.concatenate([np.ones(pairs), link_data.ravel()]),
+        "maximize": False,
+        "offset": 0.0,
+    }
+
+
+# Sense/rhs/ranges του build_sparse_mip_model από τα όρια των γραμμών
+def _row_senses(model):
+    lower, upper = model["row_lower"], model["row_upper"]
+    senses = np.where(lower == upper, "==", np.where(np.isinf(upper), ">=", np.where(np.isinf(lower), "<=", ">=")))
+    rhs = np.where(np.isinf(lower), upper, lower)
+    ranges = np.where(np.isfinite(lower) & np.isfinite(upper) & (lower != upper), upper - lower, np.nan)
+    return senses, rhs, ranges if not np.isnan(ranges).all() else None
+
+
+# Επίλυση μοντέλου πινάκων. Με solver="highs" οι πίνακες περνούν απευθείας στη μνήμη του
+# HiGHS. Οι άλλοι solvers χρειάζονται μοντέλο Pyomo, που χτίζεται από τους πίνακες με το
+# build_sparse_mip_model (με όλη τη μνήμη του Pyomo). Επιστρέφει (status, objective, values).
+def solve_matrix_model(model, solver="highs", tee=False, time_limit=None):
+    arrays = {name: model[name] for name in (
+        "cost", "col_lower", "col_upper", "row_lower", "row_upper", "indptr", "indices", "data", "integer",
+        "maximize", "offset",
+    )}
+    if solver == "highs":
+        return solve_csr_highs(**arrays, tee=tee, time_limit=time_limit)
+
+    senses, rhs, ranges = _row_senses(model)
+    rows = np.repeat(np.arange(len(rhs)), np.diff(model["indptr"]))
+    with phase("build"):
+        pyomo_model = build_sparse_mip_model(
+            model["cost"], (rows, model["indices"], model["data"]), senses, rhs,
+            np.where(model["integer"], "integer", "continuous"), model["col_lower"], model["col_upper"], ranges,
+            model["maximize"], model["offset"],
+        )
+    status = solve_model(pyomo_model, solver, tee, time_limit=time_limit)
+    values = var_values(pyomo_model.vars)
+    # Στο time_limit οι in-memory solvers φορτώνουν την καλύτερη εφικτή λύση, αν βρέθηκε
+    if status == "maxTimeLimit" and not np.isnan(values).all():
+        status = "feasible"
+    if status not in ("optimal", "feasible"):
+        return status, None, None
+    # Στήλες που δεν εμφανίζονται πουθενά: η τιμή μέσα στα όρια που είναι πιο κοντά στο 0
+    missing = np.isnan(values)
+    values[missing] = np.clip(0.0, model["col_lower"][missing], model["col_upper"][missing])
+    return status, pe.value(pyomo_model.obj), values
+
+
+# Επίλυση του Assignment Problem με το μοντέλο πινάκων· το αποτέλεσμα όπως στο solve_assignment
+def solve_assignment_matrix(costs, solver="highs", tee=False, time_limit=None):
+    with phase("build"):
+        model = assignment_matrix(costs)
+    status, _, values = solve_matrix_model(model, solver, tee, time_limit)
+    if status not in ("optimal", "feasible"):
+        return {"status": status, "total_cost": None, "assignments": []}
+    with phase("format"):
+        return {"status": status, **extract_assignment_matrix(model, values)}
+
+
+# Ανάγνωση της λύσης του assignment_matrix (δείκτες με αρίθμηση από το 0)
+def extract_assignment_matrix(model, values):
+    n = int(round(np.sqrt(len(values))))
+    rows, cols = np.nonzero(round_integral(values).reshape(n, n) == 1)
+    return {
+        "total_cost": float(model["cost"].reshape(n, n)[rows, cols].sum()),
+        "assignments": list(zip(rows.tolist(), cols.tolist())),
+    }
+
+
+# Επίλυση του Facility Location Problem με το μοντέλο πινάκων· αποτέλεσμα όπως στο solve_facility_location
+def solve_facility_matrix(facility_costs, transport_costs, solver="highs", tee=False, time_limit=None):
+    with phase("build"):
+        model = facility_matrix(facility_costs, transport_costs)
+    status, _, values = solve_matrix_model(model, solver, tee, time_limit)
+    if status not in ("optimal", "feasible"):
+        return {"status": status, "total_cost": None, "opened_facilities": [], "client_assignments": []}
+    with phase("format"):
+        return {"status": status, **extract_facility_matrix(model, values, len(np.asarray(facility_costs)))}
+
+
+# Ανάγνωση της λύσης του facility_matrix (δείκτες με αρίθμηση από το 0)
+def extract_facility_matrix(model, values, num_facilities):
+    values = round_integral(values)
+    opened = np.nonzero(values[:num_facilities] == 1)[0]
+    x = values[num_facilities:].reshape(num_facilities, -1)
+    clients, facilities = np.nonzero(x.T == 1)
+    return {
+        "total_cost": float(model["cost"] @ values + model["offset"]),
+        "opened_facilities": opened.tolist(),
+        "client_assignments": list(zip(clients.tolist(), facilities.tolist())),
+    }
+
+
+def _number(value):
+    return repr(float(value))
+
+
+# Εγγραφή μοντέλου πινάκων σε αρχείο MPS (free μορφή, στήλες x0, x1, ... και γραμμές c0, c1, ...).
+# Οι στήλες γράφονται με τη σειρά τους (ο πίνακας ταξινομείται ανά στήλη χωρίς να γίνει πυκνός)
+# και το κείμενο φτιάχνεται ανά κομμάτι, οπότε το αρχείο δεν υπάρχει ποτέ ολόκληρο στη μνήμη.
+def write_mps(model, path):
+    lower, upper = model["row_lower"], model["row_upper"]
+    num_rows = len(lower)
+    kinds = np.where(lower == upper, "E", np.where(np.isinf(upper), "G", np.where(np.isinf(lower), "L", "G")))
+    kinds[np.isinf(lower) & np.isinf(upper)] = "N"
+    rhs = np.where(kinds == "L", upper, lower)
+
+    # Θέσεις ανά στήλη: πρώτα ο συντελεστής της συνάρτησης στόχου (θέσεις < num_cols, ένας για
+    # κάθε στήλη) και μετά τα μη μηδενικά της με τη σειρά των γραμμών (σταθερή ταξινόμηση).
+    # Προσωρινή μνήμη: περίπου 12 bytes ανά μη μηδενικό.
+    num_cols = len(model["cost"])
+    columns = np.concatenate([np.arange(num_cols, dtype=np.int32), model["indices"]])
+    order = np.argsort(columns, kind="stable")
+
+    with open(path, "w", encoding="ascii") as f:
+        f.write("NAME MATRIX\n")
+        if model["maximize"]:
+            f.write("OBJSENSE\n    MAX\n")
+        f.write("ROWS\n N obj\n")
+        for start in range(0, num_rows, WRITE_CHUNK):
+            f.writelines(f" {kind} c{start + i}\n" for i, kind in enumerate(kinds[start:start + WRITE_CHUNK].tolist()))
+
+        f.write("COLUMNS\n")
+        integer = model["integer"]
+        in_integer = False
+        markers = 0
+        for start in range(0, len(order), WRITE_CHUNK):
+            chunk = order[start:start + WRITE_CHUNK]
+            entries = chunk - num_cols
+            objective = entries < 0
+            entries[objective] = 0
+            rows = np.searchsorted(model["indptr"], entries, side="right") - 1
+            rows[objective] = -1
+            values = np.where(objective, model["cost"][np.minimum(chunk, num_cols - 1)], model["data"][entries])
+            lines = []
+            for column, row, value in zip(columns[chunk].tolist(), rows.tolist(), values.tolist()):
+                if row < 0 and bool(integer[column]) != in_integer:
+                    in_integer = not in_integer
+                    lines.append(f"    MARKER{markers} 'MARKER' '{'INTORG' if in_integer else 'INTEND'}'\n")
+                    markers += 1
+                lines.append(f"    x{column} {'obj' if row < 0 else f'c{row}'} {_number(value)}\n")
+            f.writelines(lines)
+        if in_integer:
+            f.write(f"    MARKER{markers} 'MARKER' 'INTEND'\n")
+
+        f.write("RHS\n")
+        if model["offset"]:
+            f.write(f"    RHS obj {_number(-model['offset'])}\n")
+        nonzero = np.nonzero((rhs != 0) & (kinds != "N"))[0]
+        for start in range(0, len(nonzero), WRITE_CHUNK):
+            chunk = nonzero[start:start + WRITE_CHUNK]
+            f.writelines(f"    RHS c{row} {_number(value)}\n" for row, value in zip(chunk.tolist(), rhs[chunk].tolist()))
+
+        ranged = np.nonzero(np.isfinite(lower) & np.isfinite(upper) & (lower != upper))[0]
+        if len(ranged):
+            f.write("RANGES\n")
+            f.writelines(f"    RNG c{row} {_number(upper[row] - lower[row])}\n" for row in ranged.tolist())
+
+        f.write("BOUNDS\n")
+        col_lower, col_upper = model["col_lower"], model["col_upper"]
+        bounded = np.nonzero(integer | (col_lower != 0) | (col_upper != np.inf))[0]
+        for start in range(0, len(bounded), WRITE_CHUNK):
+            f.writelines(_mps_bounds(model, bounded[start:start + WRITE_CHUNK]))
+        f.write("ENDATA\n")
+
+
+# Γραμμές BOUNDS για τις στήλες columns (όσες δεν έχουν τα προεπιλεγμένα όρια [0, inf))
+def _mps_bounds(model, columns):
+    lines = []
+    bounds = zip(columns.tolist(), model["col_lower"][columns].tolist(), model["col_upper"][columns].tolist(),
+                 model["integer"][columns].tolist())
+    for column, lo, up, integer in bounds:
+        if integer and lo == 0 and up == 1:
+            lines.append(f" BV BND x{column}\n")
+        elif lo == up:
+            lines.append(f" FX BND x{column} {_number(lo)}\n")
+        else:
+            if lo == -np.inf:
+                lines.append(f" MI BND x{column}\n")
+            elif lo != 0:
+                lines.append(f" LO BND x{column} {_number(lo)}\n")
+            if up != np.inf:
+                lines.append(f" UP BND x{column} {_number(up)}\n")
+            elif integer:
+                lines.append(f" PL BND x{column}\n")
+    return lines
+
+
+# Όροι μιας γραμμικής έκφρασης σε μορφή CPLEX LP, έως 8 όροι ανά γραμμή κειμένου
+def _lp_expression(columns, values):
+    terms = [f"{'-' if value < 0 else '+'} {_number(abs(value))} x{column}" for column, value in zip(columns, values)]
+    return "\n   ".join(" ".join(terms[i:i + 8]) for i in range(0, len(terms), 8)) or "0 x0"
+
+
+# Εγγραφή μοντέλου πινάκων σε αρχείο CPLEX LP, γραμμή-γραμμή όπως στο write_mps. Γραμμές με δύο
+# διαφορετικά πεπερασμένα όρια (ranges) δεν υπάρχουν στη μορφή LP: γι' αυτές υπάρχει το write_mps.
+def write_lp(model, path):
+    lower, upper = model["row_lower"], model["row_upper"]
+    if (np.isfinite(lower) & np.isfinite(upper) & (lower != upper)).any():
+        raise ValueError("Ranged rows cannot be written in the LP format; use write_mps.")
+    indptr, indices, data = model["indptr"], model["indices"], model["data"]
+
+    with open(path, "w", encoding="ascii") as f:
+        f.write("Maximize\n" if model["maximize"] else "Minimize\n")
+        nonzero = np.nonzero(model["cost"])[0]
+        f.write(f" obj: {_lp_expression(nonzero.tolist(), model['cost'][nonzero].tolist())}")
+        if model["offset"]:
+            f.write(f" {'-' if model['offset'] < 0 else '+'} {_number(abs(model['offset']))}")
+        f.write("\nSubject To\n")
+        for first in range(0, len(lower), WRITE_CHUNK):
+            last = min(first + WRITE_CHUNK, len(lower))
+            begin, end = int(indptr[first]), int(indptr[last])
+            columns, values = indices[begin:end].tolist(), data[begin:end].tolist()
+            offsets = (indptr[first:last + 1] - begin).tolist()
+            lines = []
+            for row in range(first, last):
+                lo, up = float(lower[row]), float(upper[row])
+                if lo == -np.inf and up == np.inf:
+                    continue  # γραμμή χωρίς όρια
+                sense, rhs = ("=", lo) if lo == up else (">=", lo) if up == np.inf else ("<=", up)
+                a, b = offsets[row - first], offsets[row - first + 1]
+                lines.append(f" c{row}: {_lp_expression(columns[a:b], values[a:b])} {sense} {_number(rhs)}\n")
+            f.writelines(lines)
+
+        f.write("Bounds\n")
+        col_lower, col_upper, integer = model["col_lower"], model["col_upper"], model["integer"]
+        binary = integer & (col_lower == 0) & (col_upper == 1)
+        bounded = np.nonzero(~binary & ((col_lower != 0) | (col_upper != np.inf)))[0]
+        for start in range(0, len(bounded), WRITE_CHUNK):
+            chunk = bounded[start:start + WRITE_CHUNK]
+            lines = []
+            for column, lo, up in zip(chunk.tolist(), col_lower[chunk].tolist(), col_upper[chunk].tolist()):
+                if lo == up:
+                    lines.append(f" x{column} = {_number(lo)}\n")
+                elif lo == -np.inf and up == np.inf:
+                    lines.append(f" x{column} free\n")
+                else:
+                    left = "-inf" if lo == -np.inf else _number(lo)
+                    right = "" if up == np.inf else f" <= {_number(up)}"
+                    lines.append(f" {left} <= x{column}{right}\n")
+            f.writelines(lines)
+        for title, mask in (("Binaries", binary), ("Generals", integer & ~binary)):
+            columns = np.nonzero(mask)[0]
+            if len(columns):
+                f.write(f"{title}\n")
+                for start in range(0, len(columns), WRITE_CHUNK):
+                    f.writelines(f" x{column}\n" for column in columns[start:start + WRITE_CHUNK].tolist())
+        f.write("End\n")
@@ -0,0 +1,316 @@
+import numpy as np
+import pyomo.environ as pe
+from pyomo.core.expr.numeric_expr import LinearExpression
+
+from solution_arrays import var_values
+from solve_metrics import annotate, phase
+from solver_backends import solve_model
+
+
+# Ανάγνωση περιορισμών από κείμενο: μία γραμμή ανά περιορισμό, μορφή "coefficients,sense,rhs"
+def parse_constraints(text):
+    constraints = []
+    for line in text.split("\n"):
+        if line.strip():
+            parts = line.split(",")
+            lhs = list(map(float, parts[0].split()))
+            sense = parts[1].strip()
+            rhs = float(parts[2].strip())
+            constraints.append((lhs, sense, rhs))
+    return constraints
+
+
+# Δημιουργία του μοντέλου Pyomo από συντελεστές στόχου, περιορισμούς (lhs, sense, rhs) και τύπους μεταβλητών
+def build_mip_model(objective, constraints, var_types):
+    model = pe.ConcreteModel()
+
+    # Δημιουργία μεταβλητών
+    model.vars = pe.Var(range(len(var_types)), domain=pe.Reals)
+    for i, var_type in enumerate(var_types):
+        if var_type == 'binary':
+            model.vars[i].domain = pe.Binary
+        elif var_type == 'integer':
+            model.vars[i].domain = pe.Integers
+
+    # Προσθήκη συνάρτησης στόχου
+    model.obj = pe.Objective(
+        expr=sum(objective[i] * model.vars[i] for i in range(len(objective))),
+        sense=pe.minimize,
+    )
+
+    # Προσθήκη περιορισμών
+    model.constraints = pe.ConstraintList()
+    for lhs, sense, rhs in constraints:
+        if sense == '<=':
+            model.constraints.add(sum(lhs[i] * model.vars[i] for i in range(len(lhs))) <= rhs)
+        elif sense == '>=':
+            model.constraints.add(sum(lhs[i] * model.vars[i] for i in range(len(lhs))) >= rhs)
+        elif sense == '==':
+            model.constraints.add(sum(lhs[i] * model.vars[i] for i in range(len(lhs))) == rhs)
+        else:
+            raise ValueError(f"Unknown constraint sense: {sense}")
+
+    return model
+
+
+# Πίνακας περιορισμών σε μορφή CSR (indptr, indices, data) από πίνακα scipy.sparse (CSR/CSC/COO)
+# ή από τριάδες COO (rows, columns, values), με έλεγχο διαστάσεων num_rows x num_cols.
+# Δεν δημιουργείται ποτέ πυκνή γραμμή.
+def _csr(matrix, num_rows, num_cols):
+    shape = getattr(matrix, "shape", None)
+    if shape is not None and tuple(shape) != (num_rows, num_cols):
+        raise ValueError(f"The matrix must have shape ({num_rows}, {num_cols}), got {tuple(shape)}.")
+    if hasattr(matrix, "indptr") and getattr(matrix, "format", None) == "csr":
+        return np.asarray(matrix.indptr), np.asarray(matrix.indices), np.asarray(matrix.data, dtype=float)
+    if hasattr(matrix, "tocoo"):
+        matrix = matrix.tocoo()
+        rows, columns, values = matrix.row, matrix.col, matrix.data
+    else:
+        rows, columns, values = matrix
+    rows = np.asarray(rows, dtype=np.int64)
+    columns = np.asarray(columns, dtype=np.int64)
+    values = np.asarray(values, dtype=float)
+    if not len(rows) == len(columns) == len(values):
+        raise ValueError("The matrix triplets must have the same length.")
+    if len(rows) and (rows.min() < 0 or rows.max() >= num_rows):
+        raise ValueError("A matrix row index is out of range.")
+    if len(columns) and (columns.min() < 0 or columns.max() >= num_cols):
+        raise ValueError("A matrix column index is out of range.")
+    order = np.lexsort((columns, rows))
+    indptr = np.concatenate([[0], np.cumsum(np.bincount(rows, minlength=num_rows))])
+    return indptr, columns[order], values[order]
+
+
+# Όρια γραμμών από sense/rhs και, όπως στο MPS, προαιρετικά ranges (NaN όπου δεν υπάρχει range)
+def _row_bounds(senses, rhs, ranges):
+    rhs = np.asarray(rhs, dtype=float)
+    senses = np.asarray(senses)
+    lower = np.where(senses == ">=", rhs, -np.inf)
+    upper = np.where(senses == "<=", rhs, np.inf)
+    equal = senses == "=="
+    lower[equal] = upper[equal] = rhs[equal]
+    unknown = ~np.isin(senses, ("<=", ">=", "=="))
+    if unknown.any():
+        raise ValueError(f"Unknown constraint sense: {senses[unknown][0]}")
+    if ranges is not None:
+        ranges = np.asarray(ranges, dtype=float)
+        has = ~np.isnan(ranges)
+        size = np.abs(ranges)
+        lower = np.where(has & (senses == "<="), rhs - size, lower)
+        upper = np.where(has & (senses == ">="), rhs + size, upper)
+        upper = np.where(has & equal & (ranges > 0), rhs + size, upper)
+        lower = np.where(has & equal & (ranges < 0), rhs - size, lower)
+    return lower, upper
+
+
+# Δημιουργία μοντέλου Pyomo σε μορφή πίνακα: min/max c'x + offset με row_lower <= Ax <= row_upper.
+# Κάθε γραμμή γίνεται ένα LinearExpression μόνο από τα μη μηδενικά της. lower/upper: όρια
+# μεταβλητών (προεπιλογή ελεύθερες, όπως στο build_mip_model), var_types όπως στο build_mip_model.
+def build_sparse_mip_model(objective, matrix, senses, rhs, var_types, lower=None, upper=None, ranges=None,
+                           maximize=False, offset=0.0):
+    objective = np.asarray(objective, dtype=float)
+    num_vars = len(objective)
+    if len(var_types) != num_vars:
+        raise ValueError("The objective and the variable types must have the same length.")
+    row_lower, row_upper = _row_bounds(senses, rhs, ranges)
+    indptr, indices, data = _csr(matrix, len(row_lower), num_vars)
+
+    var_lower = np.full(num_vars, -np.inf) if lower is None else np.asarray(lower, dtype=float)
+    var_upper = np.full(num_vars, np.inf) if upper is None else np.asarray(upper, dtype=float)
+    domains = {"binary": pe.Binary, "integer": pe.Integers}
+    model = pe.ConcreteModel()
+
+    # Δημιουργία μεταβλητών με τα όριά τους
+    model.vars = pe.Var(
+        range(num_vars),
+        domain=lambda model, i: domains.get(var_types[i], pe.Reals),
+        bounds=lambda model, i: (
+            None if np.isinf(var_lower[i]) else float(var_lower[i]),
+            None if np.isinf(var_upper[i]) else float(var_upper[i]),
+        ),
+    )
+    variables = list(model.vars.values())
+
+    # Συνάρτηση στόχου από τους μη μηδενικούς συντελεστές
+    nonzero = np.nonzero(objective)[0].tolist()
+    model.obj = pe.Objective(
+        expr=LinearExpression(
+            constant=float(offset), linear_coefs=objective[nonzero].tolist(),
+            linear_vars=[variables[i] for i in nonzero],
+        ),
+        sense=pe.maximize if maximize else pe.minimize,
+    )
+
+    # Περιορισμοί: μία γραμμή του CSR ανά περιορισμό
+    indptr = indptr.tolist()
+    indices = indices.tolist()
+    data = data.tolist()
+    bounds = [
+        (None if np.isinf(lo) else lo, None if np.isinf(up) else up)
+        for lo, up in zip(row_lower.tolist(), row_upper.tolist())
+    ]
+
+    def constraint_rule(model, r):
+        lo, up = bounds[r]
+        start, end = indptr[r], indptr[r + 1]
+        if start == end:
+            if (lo is not None and lo > 0) or (up is not None and up < 0):
+                raise ValueError(f"Constraint {r} has no coefficients and cannot be satisfied.")
+            return pe.Constraint.Skip
+        expr = LinearExpression(
+            constant=0.0, linear_coefs=data[start:end], linear_vars=[variables[i] for i in indices[start:end]]
+        )
+        if lo == up:
+            return expr == lo
+        return (lo, expr, up)
+
+    model.constraints = pe.Constraint(range(len(bounds)), rule=constraint_rule)
+
+    return model
+
+
+# Ανάγνωση αποτελεσμάτων από λυμένο μοντέλο
+def extract_mip(model):
+    return {
+        "objective": pe.value(model.obj),
+        "values": [None if np.isnan(value) else value for value in var_values(model.vars).tolist()],
+    }
+
+
+# Επίλυση ενός γενικού MIP χωρίς GUI
+def solve_mip(objective, constraints, var_types, solver="glpk", tee=False):
+    with phase("build"):
+        model = build_mip_model(objective, constraints, var_types)
+    status = solve_model(model, solver, tee)
+    if status != "optimal":
+        return {"status": status, "objective": None, "values": []}
+    with phase("format"):
+        return {"status": status, **extract_mip(model)}
+
+
+# Termination conditions του HiGHS με τα ονόματα που επιστρέφουν οι solvers του Pyomo
+HIGHS_STATUS = {
+    "kOptimal": "optimal", "kInfeasible": "infeasible", "kUnbounded": "unbounded",
+    "kUnboundedOrInfeasible": "infeasibleOrUnbounded", "kTimeLimit": "maxTimeLimit",
+    "kIterationLimit": "maxIterations", "kSolutionLimit": "maxIterations", "kModelEmpty": "optimal",
+}
+
+
+# Ο πίνακας CSR περνά απευθείας στη μνήμη του HiGHS (highspy), χωρίς μοντέλο Pyomo.
+# Επιστρέφει (status, objective, values).
+def _solve_sparse_highs(objective, matrix, senses, rhs, var_types, lower, upper, ranges, maximize, offset, tee):
+    objective = np.asarray(objective, dtype=float)
+    num_vars = len(objective)
+    row_lower, row_upper = _row_bounds(senses, rhs, ranges)
+    indptr, indices, data = _csr(matrix, len(row_lower), num_vars)
+    integer = np.isin(np.asarray(var_types), ("binary", "integer"))
+    var_lower = np.full(num_vars, -np.inf) if lower is None else np.asarray(lower, dtype=float).copy()
+    var_upper = np.full(num_vars, np.inf) if upper is None else np.asarray(upper, dtype=float).copy()
+    binary = np.asarray(var_types) == "binary"
+    var_lower[binary] = np.maximum(var_lower[binary], 0.0)
+    var_upper[binary] = np.minimum(var_upper[binary], 1.0)
+    status, value, values = solve_csr_highs(
+        objective, var_lower, var_upper, row_lower, row_upper, indptr, indices, data, integer, maximize, offset, tee
+    )
+    return status, value, [] if values is None else values.tolist()
+
+
+# Έλεγχος των πινάκων πριν περάσουν στον HiGHS, που δεν ελέγχει δείκτες εκτός ορίων
+# (και τερματίζει όλη τη διεργασία αντί να δώσει σφάλμα)
+def _check_csr(num_cols, num_rows, col_lower, col_upper, row_upper, indptr, indices, data, integer):
+    if not len(col_lower) == len(col_upper) == len(integer) == num_cols:
+        raise ValueError("The column costs, bounds and integrality must have the same length.")
+    if len(row_upper) != num_rows:
+        raise ValueError("The row lower and upper bounds must have the same length.")
+    indptr = np.asarray(indptr)
+    if len(indptr) != num_rows + 1 or indptr[0] != 0 or np.any(np.diff(indptr) < 0):
+        raise ValueError("The matrix row pointers do not match the number of rows.")
+    if not indptr[-1] == len(indices) == len(data):
+        raise ValueError("The matrix indices and values must match the row pointers.")
+    indices = np.asarray(indices)
+    if len(indices) and (indices.min() < 0 or indices.max() >= num_cols):
+        raise ValueError("A matrix column index is out of range.")
+
+
+# Επίλυση με τον HiGHS ενός προβλήματος που δίνεται μόνο με πίνακες: κόστη και όρια στηλών,
+# όρια γραμμών, πίνακας CSR (indptr, indices, data) και integer (True για ακέραιες στήλες).
+# Οι πίνακες περνούν απευθείας στη μνήμη του solver. Επιστρέφει (status, objective, values),
+# με values πίνακα NumPy (None αν δεν βρέθηκε λύση). Αν τελειώσει ο χρόνος με εφικτή λύση,
+# το status είναι "feasible" και επιστρέφεται η καλύτερη λύση που βρέθηκε.
+def solve_csr_highs(cost, col_lower, col_upper, row_lower, row_upper, indptr, indices, data, integer,
+                    maximize=False, offset=0.0, tee=False, time_limit=None):
+    _check_csr(len(cost), len(row_lower), col_lower, col_upper, row_upper, indptr, indices, data, integer)
+    import highspy
+
+    lp = highspy.HighsLp()
+    lp.num_col_ = len(cost)
+    lp.num_row_ = len(row_lower)
+    lp.col_cost_ = cost
+    lp.col_lower_ = col_lower
+    lp.col_upper_ = col_upper
+    lp.row_lower_ = row_lower
+    lp.row_upper_ = row_upper
+    lp.offset_ = float(offset)
+    lp.sense_ = highspy.ObjSense.kMaximize if maximize else highspy.ObjSense.kMinimize
+    lp.a_matrix_.format_ = highspy.MatrixFormat.kRowwise
+    lp.a_matrix_.num_col_ = len(cost)
+    lp.a_matrix_.num_row_ = len(row_lower)
+    lp.a_matrix_.start_ = np.asarray(indptr, dtype=np.int32)
+    lp.a_matrix_.index_ = np.asarray(indices, dtype=np.int32)
+    lp.a_matrix_.value_ = np.asarray(data, dtype=float)
+
+    h = highspy.Highs()
+    h.setOptionValue("output_flag", bool(tee))
+    if time_limit is not None:
+        h.setOptionValue("time_limit", float(time_limit))
+    with phase("write"):
+        h.passModel(lp)
+        # Οι ακέραιες στήλες ως πίνακας (το lp.integrality_ θέλει λίστα με ένα αντικείμενο ανά στήλη)
+        columns = np.nonzero(integer)[0].astype(np.int32)
+        if len(columns):
+            h.changeColsIntegrality(len(columns), columns, np.full(len(columns), highspy.HighsVarType.kInteger.value, dtype=np.uint8))
+    with phase("solve"):
+        h.run()
+    status = HIGHS_STATUS.get(h.getModelStatus().name, "error")
+    info = h.getInfo()
+    # primal_solution_status 2: υπάρχει εφικτή λύση
+    if status == "maxTimeLimit" and info.primal_solution_status == 2:
+        status = "feasible"
+    annotate(termination=status, solves=1, variables=len(cost), constraints=len(row_lower), nonzeros=len(data),
+             gap=info.mip_gap if integer.any() and status in ("optimal", "feasible") else None)
+    if status not in ("optimal", "feasible"):
+        return status, None, None
+    with phase("load"):
+        values = np.asarray(h.getSolution().col_value)
+    return status, info.objective_function_value, values
+
+
+# Επίλυση ενός MIP σε μορφή πίνακα (βλ. build_sparse_mip_model), π.χ. από read_mps / read_lp.
+# Με solver="highs" ο πίνακας περνά απευθείας στον HiGHS, χωρίς μοντέλο Pyomo.
+# Με names το αποτέλεσμα έχει και τα ονόματα των μεταβλητών.
+def solve_sparse_mip(objective, matrix, senses, rhs, var_types, lower=None, upper=None, ranges=None,
+                     maximize=False, offset=0.0, names=None, solver="glpk", tee=False):
+    if solver == "highs":
+        status, value, values = _solve_sparse_highs(
+            objective, matrix, senses, rhs, var_types, lower, upper, ranges, maximize, offset, tee
+        )
+        solution = {"status": status, "objective": value, "values": values}
+        if names is not None and status in ("optimal", "feasible"):
+            solution["names"] = list(names)
+        return solution
+
+    with phase("build"):
+        model = build_sparse_mip_model(objective, matrix, senses, rhs, var_types, lower, upper, ranges, maximize, offset)
+    status = solve_model(model, solver, tee)
+    if status != "optimal":
+        return {"status": status, "objective": None, "values": []}
+    # Μεταβλητές που δεν εμφανίζονται πουθενά δεν παίρνουν τιμή από τον solver: η πιο κοντινή στο 0
+    for var in model.vars.values():
+        if var.value is None:
+            var.set_value(min(max(0.0, var.lb if var.lb is not None else -np.inf),
+                              var.ub if var.ub is not None else np.inf), skip_validation=True)
+    with phase("format"):
+        solution = {"status": status, **extract_mip(model)}
+    if names is not None:
+        solution["names"] = list(names)
+    return solution
@@ -0,0 +1,383 @@
+import re
+from array import array
+
+import numpy as np
+
+# Τύποι γραμμών MPS -> sense του build_sparse_mip_model (N: συνάρτηση στόχου)
+MPS_SENSES = {"L": "<=", "G": ">=", "E": "=="}
+
+# Λέξεις-κλειδιά ενοτήτων αρχείου CPLEX LP (πεζά, χωρίς κενά)
+LP_SECTIONS = {
+    "minimize": "min", "minimum": "min", "min": "min",
+    "maximize": "max", "maximum": "max", "max": "max",
+    "subjectto": "rows", "suchthat": "rows", "st": "rows", "s.t.": "rows",
+    "bounds": "bounds", "bound": "bounds",
+    "general": "general", "generals": "general", "gen": "general",
+    "integer": "general", "integers": "general",
+    "binary": "binary", "binaries": "binary", "bin": "binary",
+    "end": "end",
+}
+
+# Tokens αρχείου CPLEX LP: αριθμοί, τελεστές σύγκρισης, πρόσημα, ':' και ονόματα
+LP_TOKEN = re.compile(
+    r"\s*(?:(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)"
+    r"|(?P<sense><=|>=|=<|=>|<|>|=)"
+    r"|(?P<sign>[+-])"
+    r"|(?P<colon>:)"
+    r"|(?P<name>[^\s+\-<>=:*^][^\s+\-<>=:*^]*))"
+)
+
+LP_SENSE = {"<=": "<=", "=<": "<=", "<": "<=", ">=": ">=", "=>": ">=", ">": ">=", "=": "=="}
+
+
+# Μεταβλητές και τριάδες COO που μαζεύονται καθώς διαβάζεται ένα αρχείο. Οι συντελεστές
+# κρατούνται σε array (όχι λίστες αντικειμένων Python) και οι γραμμές δεν γίνονται ποτέ πυκνές.
+def _new_problem():
+    return {
+        "names": {}, "objective": array("d"), "lower": array("d"), "upper": array("d"), "types": [],
+        "rows": array("q"), "columns": array("q"), "values": array("d"),
+        "senses": [], "rhs": array("d"), "ranges": array("d"),
+        "maximize": False, "offset": 0.0,
+    }
+
+
+def _variable(problem, name):
+    index = problem["names"].get(name)
+    if index is None:
+        index = problem["names"][name] = len(problem["names"])
+        problem["objective"].append(0.0)
+        problem["lower"].append(0.0)
+        problem["upper"].append(np.inf)
+        problem["types"].append("continuous")
+    return index
+
+
+def _add_row(problem, terms, sense, rhs):
+    row = len(problem["senses"])
+    for index, value in terms:
+        problem["rows"].append(row)
+        problem["columns"].append(index)
+        problem["values"].append(value)
+    problem["senses"].append(sense)
+    problem["rhs"].append(rhs)
+    problem["ranges"].append(np.nan)
+    return row
+
+
+# Τα ορίσματα του solve_sparse_mip από τα δεδομένα που διαβάστηκαν
+def _arguments(problem):
+    ranges = np.frombuffer(problem["ranges"], dtype=float)
+    return {
+        "objective": np.frombuffer(problem["objective"], dtype=float),
+        "matrix": (
+            np.frombuffer(problem["rows"], dtype=np.int64),
+            np.frombuffer(problem["columns"], dtype=np.int64),
+            np.frombuffer(problem["values"], dtype=float),
+        ),
+        "senses": problem["senses"],
+        "rhs": np.frombuffer(problem["rhs"], dtype=float),
+        "var_types": problem["types"],
+        "lower": np.frombuffer(problem["lower"], dtype=float),
+        "upper": np.frombuffer(problem["upper"], dtype=float),
+        "ranges": ranges if not np.isnan(ranges).all() else None,
+        "maximize": problem["maximize"],
+        "offset": problem["offset"],
+        "names": list(problem["names"]),
+    }
+
+
+# Ανάγνωση αρχείου MPS (fixed ή free μορφή, ονόματα χωρίς κενά), γραμμή-γραμμή.
+# Επιστρέφει τα ορίσματα του solve_sparse_mip, μαζί με τα ονόματα των μεταβλητών (names).
+def read_mps(path):
+    problem = _new_problem()
+    rows = {}
+    objective_row = None
+    section = None
+    integer = False
+
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip() or line.startswith("*"):
+                continue
+            fields = line.split()
+            if not line[0].isspace():
+                section = fields[0].upper()
+                if section == "OBJSENSE" and len(fields) > 1:
+                    problem["maximize"] = fields[1].upper() in ("MAX", "MAXIMIZE")
+                if section == "ENDATA":
+                    break
+                continue
+
+            if section == "OBJSENSE":
+                problem["maximize"] = fields[0].upper() in ("MAX", "MAXIMIZE")
+            elif section == "ROWS":
+                kind, name = fields[0].upper(), fields[1]
+                if kind == "N":
+                    if objective_row is None:
+                        objective_row = name
+                    rows[name] = None
+                elif kind in MPS_SENSES:
+                    rows[name] = _add_row(problem, (), MPS_SENSES[kind], 0.0)
+                else:
+                    raise ValueError(f"Line {number}: unknown row type {kind}.")
+            elif section == "COLUMNS":
+                if len(fields) >= 3 and fields[1].strip("'").upper() == "MARKER":
+                    integer = fields[2].strip("'").upper() == "INTORG"
+                    continue
+                index = _variable(problem, fields[0])
+                if integer:
+                    problem["types"][index] = "integer"
+                for name, value in zip(fields[1::2], fields[2::2]):
+                    if name not in rows:
+                        raise ValueError(f"Line {number}: unknown row {name}.")
+                    if name == objective_row:
+                        problem["objective"][index] += float(value)
+                    elif rows[name] is not None:
+                        problem["rows"].append(rows[name])
+                        problem["columns"].append(index)
+                        problem["values"].append(float(value))
+            elif section in ("RHS", "RANGES"):
+                # Το όνομα του διανύσματος RHS/RANGES είναι προαιρετικό
+                pairs = fields[1:] if len(fields) % 2 else fields
+                for name, value in zip(pairs[0::2], pairs[1::2]):
+                    if name not in rows:
+                        raise ValueError(f"Line {number}: unknown row {name}.")
+                    if name == objective_row and section == "RHS":
+                        problem["offset"] = -float(value)
+                    elif rows[name] is not None:
+                        problem["rhs" if section == "RHS" else "ranges"][rows[name]] = float(value)
+            elif section == "BOUNDS":
+                kind = fields[0].upper()
+                if kind in ("FR", "MI", "PL", "BV"):
+                    name, value = fields[-1], None
+                else:
+                    name, value = fields[-2], float(fields[-1])
+                index = _variable(problem, name)
+                if kind in ("UP", "UI"):
+                    problem["upper"][index] = value
+                    if value < 0 and problem["lower"][index] == 0:
+                        problem["lower"][index] = -np.inf
+                elif kind in ("LO", "LI"):
+                    problem["lower"][index] = value
+                elif kind == "FX":
+                    problem["lower"][index] = problem["upper"][index] = value
+                elif kind == "FR":
+                    problem["lower"][index], problem["upper"][index] = -np.inf, np.inf
+                elif kind == "MI":
+                    problem["lower"][index] = -np.inf
+                elif kind == "PL":
+                    problem["upper"][index] = np.inf
+                elif kind == "BV":
+                    problem["lower"][index], problem["upper"][index] = 0.0, 1.0
+                    problem["types"][index] = "binary"
+                else:
+                    raise ValueError(f"Line {number}: unknown bound type {kind}.")
+                if kind in ("UI", "LI"):
+                    problem["types"][index] = "integer"
+            elif section != "NAME":
+                raise ValueError(f"Line {number}: unexpected data in section {section}.")
+
+    return _arguments(problem)
+
+
+# Tokens μιας γραμμής αρχείου LP ως (είδος, κείμενο), χωρίς τα σχόλια (από '\' και μετά)
+def _lp_tokens(line, number):
+    line = line.split("\\", 1)[0]
+    position = 0
+    tokens = []
+    while position < len(line):
+        match = LP_TOKEN.match(line, position)
+        if match is None or match.end() == position:
+            if line[position:].strip():
+                raise ValueError(f"Line {number}: cannot read {line[position:].strip()!r}.")
+            break
+        position = match.end()
+        tokens.append((match.lastgroup, match.group(match.lastgroup)))
+    return tokens
+
+
+# Γραμμική έκφραση από tokens: [(μεταβλητή, συντελεστής)] και σταθερός όρος
+def _lp_terms(problem, tokens, number):
+    terms = []
+    constant = 0.0
+    sign, coefficient = 1.0, None
+    for kind, text in tokens:
+        if kind == "sign":
+            if coefficient is not None:
+                constant += sign * coefficient
+                sign, coefficient = 1.0, None
+            sign = -sign if text == "-" else sign
+        elif kind == "number":
+            coefficient = float(text)
+        elif kind == "name":
+            terms.append((_variable(problem, text), sign * (1.0 if coefficient is None else coefficient)))
+            sign, coefficient = 1.0, None
+        else:
+            raise ValueError(f"Line {number}: unexpected {text!r}.")
+    if coefficient is not None:
+        constant += sign * coefficient
+    return terms, constant
+
+
+# Χωρίζει το "όνομα:" από την αρχή μιας έκφρασης
+def _lp_label(tokens):
+    if len(tokens) >= 2 and tokens[0][0] == "name" and tokens[1][0] == "colon":
+        return tokens[2:]
+    return tokens
+
+
+def _lp_bound_value(kind, text):
+    if kind == "number":
+        return float(text)
+    if kind == "name" and text.lower() in ("inf", "infinity"):
+        return np.inf
+    return None
+
+
+# Μία γραμμή της ενότητας Bounds: "x free", "x >= l", "l <= x", "l <= x <= u", "x = v"
+def _lp_bound(problem, tokens, number):
+    merged = []
+    for kind, text in tokens:
+        if merged and merged[-1][0] == "sign" and kind in ("number", "name"):
+            value = _lp_bound_value(kind, text)
+            if value is not None:
+                merged[-1] = ("value", -value if merged[-1][1] == "-" else value)
+                continue
+        value = _lp_bound_value(kind, text)
+        merged.append(("value", value) if value is not None else (kind, text))
+
+    if len(merged) == 2 and merged[0][0] == "name" and merged[1] == ("name", "free"):
+        index = _variable(problem, merged[0][1])
+        problem["lower"][index], problem["upper"][index] = -np.inf, np.inf
+        return
+    if len(merged) == 3 and merged[0][0] == "name" and merged[1][0] == "sense" and merged[2][0] == "value":
+        merged = [("value", merged[2][1]), (merged[1][0], {"<=": ">=", ">=": "<=", "==": "=="}[LP_SENSE[merged[1][1]]]),
+                  merged[0]]
+    if len(merged) in (3, 5) and merged[0][0] == "value" and merged[1][0] == "sense" and merged[2][0] == "name":
+        index = _variable(problem, merged[2][1])
+        sides = [(LP_SENSE.get(merged[1][1], merged[1][1]), merged[0][1])]
+        if len(merged) == 5 and merged[3][0] == "sense" and merged[4][0] == "value":
+            sides.append(({"<=": ">=", ">=": "<=", "==": "=="}[LP_SENSE[merged[3][1]]], merged[4][1]))
+        elif len(merged) == 5:
+            raise ValueError(f"Line {number}: cannot read the bound.")
+        # value <= x: κάτω όριο, value >= x: άνω όριο, value = x: σταθερή τιμή
+        for sense, value in sides:
+            if sense in ("<=", "=="):
+                problem["lower"][index] = value
+            if sense in (">=", "=="):
+                problem["upper"][index] = value
+        return
+    raise ValueError(f"Line {number}: cannot read the bound.")
+
+
+# Περιορισμός με όρια και από τις δύο πλευρές (lower <= έκφραση <= upper ή upper >= έκφραση >= lower):
+# γραμμή "<=" με range, όπως στο MPS
+def _lp_ranged_row(problem, tokens, at, number):
+    senses = [LP_SENSE[tokens[i][1]] for i in at]
+    if senses[0] != senses[1] or senses[0] == "==":
+        raise ValueError(f"Line {number}: a ranged constraint needs two '<=' or two '>=' operators.")
+    left, first = _lp_terms(problem, tokens[:at[0]], number)
+    terms, constant = _lp_terms(problem, tokens[at[0] + 1:at[1]], number)
+    right, second = _lp_terms(problem, tokens[at[1] + 1:], number)
+    if left or right:
+        raise ValueError(f"Line {number}: variables outside the middle of a ranged constraint are not supported.")
+    lower, upper = (first, second) if senses[0] == "<=" else (second, first)
+    if lower > upper:
+        raise ValueError(f"Line {number}: the lower limit of the ranged constraint is above its upper limit.")
+    row = _add_row(problem, terms, "<=", upper - constant)
+    problem["ranges"][row] = upper - lower
+
+
+# Ανάγνωση αρχείου CPLEX LP γραμμή-γραμμή. Κάθε περιορισμός κρατιέται μόνο μέχρι να διαβαστεί
+# το δεξί του μέλος. Επιστρέφει τα ορίσματα του solve_sparse_mip, μαζί με τα names.
+def read_lp(path):
+    problem = _new_problem()
+    section = None
+    pending = []
+    senses = 0
+    needed = 1
+    objective = []
+
+    def finish_row(number):
+        tokens = _lp_label(pending)
+        at = [i for i, (kind, _) in enumerate(tokens) if kind == "sense"]
+        if len(at) == 2:
+            _lp_ranged_row(problem, tokens, at, number)
+        else:
+            terms, constant = _lp_terms(problem, tokens[:at[0]], number)
+            right, rhs = _lp_terms(problem, tokens[at[0] + 1:], number)
+            if right:
+                raise ValueError(f"Line {number}: variables on the right-hand side are not supported.")
+            _add_row(problem, terms, LP_SENSE[tokens[at[0]][1]], rhs - constant)
+        pending.clear()
+
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            key = line.split("\\", 1)[0].strip().lower()
+            compact = key.replace(" ", "")
+            if compact in LP_SECTIONS or (key and key.split()[0] in LP_SECTIONS and section is None):
+                if pending:
+                    raise ValueError(f"Line {number}: incomplete constraint before {line.strip()!r}.")
+                section = LP_SECTIONS.get(compact) or LP_SECTIONS[key.split()[0]]
+                if section in ("min", "max"):
+                    problem["maximize"] = section == "max"
+                    rest = line.split("\\", 1)[0].strip().split(None, 1)
+                    if compact not in LP_SECTIONS and len(rest) > 1:
+                        objective.extend(_lp_tokens(rest[1], number))
+                    section = "objective"
+                if section == "end":
+                    break
+                continue
+
+            tokens = _lp_tokens(line, number)
+            if not tokens:
+                continue
+            if section == "objective":
+                objective.extend(tokens)
+            elif section == "rows":
+                # Ένας περιορισμός τελειώνει με τον αριθμό μετά τον τελεστή σύγκρισης. Αν πριν από
+                # τον πρώτο τελεστή υπάρχει μόνο σταθερά, είναι περιορισμός με range και τελειώνει
+                # με τον αριθμό μετά τον δεύτερο.
+                for token in tokens:
+                    pending.append(token)
+                    if token[0] == "sense":
+                        senses += 1
+                        if senses == 1:
+                            left = _lp_label(pending[:-1])
+                            needed = 1 if any(kind == "name" for kind, _ in left) else 2
+                            if needed == 2 and not any(kind == "number" for kind, _ in left):
+                                raise ValueError(f"Line {number}: the constraint has no left-hand side.")
+                        elif senses > needed:
+                            raise ValueError(f"Line {number}: too many comparison operators in the constraint.")
+                    elif token[0] == "number" and senses == needed:
+                        finish_row(number)
+                        senses, needed = 0, 1
+            elif section == "bounds":
+                _lp_bound(problem, tokens, number)
+            elif section in ("general", "binary"):
+                for kind, name in tokens:
+                    index = _variable(problem, name)
+                    if section == "binary":
+                        problem["types"][index] = "binary"
+                        problem["lower"][index], problem["upper"][index] = 0.0, 1.0
+                    else:
+                        problem["types"][index] = "integer"
+            else:
+                raise ValueError(f"Line {number}: data outside of a section.")
+
+    if pending:
+        raise ValueError("The file ends inside a constraint.")
+    terms, constant = _lp_terms(problem, _lp_label(objective), 0)
+    for index, value in terms:
+        problem["objective"][index] += value
+    problem["offset"] = constant
+    return _arguments(problem)
+
+
+# Ανάγνωση αρχείου .mps ή .lp ανάλογα με την κατάληξη
+def read_mip_file(path):
+    if path.lower().endswith(".mps"):
+        return read_mps(path)
+    if path.lower().endswith(".lp"):
+        return read_lp(path)
+    raise ValueError(f"Unsupported MIP file: {path}")
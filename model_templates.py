@@ -0,0 +1,49 @@
+from collections import OrderedDict
+
+from pyomo.solvers.plugins.solvers.persistent_solver import PersistentSolver
+
+from solver_backends import create_solver, solve_model
+
+# Μέγιστο πλήθος προκατασκευασμένων μοντέλων που κρατιούνται στη μνήμη
+MAX_TEMPLATES = 16
+
+# Κλειδί (πρόβλημα, διαστάσεις, solver) -> {"model", "solver", "loaded"}
+_templates = OrderedDict()
+
+
+# Προκατασκευασμένο μοντέλο για το key. Το builder καλείται μόνο την πρώτη φορά·
+# μετά αλλάζουν μόνο οι τιμές των mutable Params.
+def get_template(key, builder, solver="glpk"):
+    template = _templates.get(key)
+    if template is not None:
+        _templates.move_to_end(key)
+        return template, False
+
+    template = {"model": builder(), "solver": create_solver(solver), "loaded": False}
+    _templates[key] = template
+    if len(_templates) > MAX_TEMPLATES:
+        _templates.popitem(last=False)
+    return template, True
+
+
+# Επίλυση ενός template μετά την ενημέρωση των Params. Οι persistent solvers (π.χ. gurobi_persistent)
+# κρατούν το μοντέλο στη μνήμη τους· επειδή δεν βλέπουν μόνοι τους αλλαγές σε Params, ξαναστέλνονται
+# ο στόχος και οι περιορισμοί του changed. Οι solvers appsi_* και τα in-memory backends ενημερώνουν
+# τα Params αυτόματα. Επιστρέφει το termination condition ως κείμενο.
+def solve_template(template, tee=False, changed=()):
+    model = template["model"]
+    solver = template["solver"]
+    if isinstance(solver, PersistentSolver):
+        if not template["loaded"]:
+            solver.set_instance(model)
+            template["loaded"] = True
+        else:
+            solver.set_objective(model.obj)
+            for constraint in changed:
+                solver.remove_constraint(constraint)
+                solver.add_constraint(constraint)
+    return solve_model(model, tee=tee, opt=solver)
+
+
+def clear_templates():
+    _templates.clear()
@@ -0,0 +1,238 @@
+import contextlib
+import inspect
+import json
+import multiprocessing
+import os
+import signal
+import time
+from multiprocessing.connection import wait
+
+import problems
+from solver_backends import create_solver, is_in_memory
+
+if os.name == "posix":
+    import fcntl
+else:
+    import msvcrt
+
+# Solvers που δοκιμάζονται όταν δεν δίνεται λίστα (μόνο όσοι είναι εγκατεστημένοι)
+CANDIDATES = ("highs", "glpk", "cbc", "scip", "gurobi", "cplex")
+
+# Καταστάσεις που τερματίζουν τον αγώνα: ο solver απέδειξε το αποτέλεσμα
+CONCLUSIVE = ("optimal", "infeasible", "unbounded", "infeasibleOrUnbounded")
+
+# Πεδίο αντικειμενικής τιμής ανά πρόβλημα και αν μεγιστοποιείται (None: από το πεδίο maximize)
+OBJECTIVES = {
+    "assignment": ("total_cost", False),
+    "knapsack": ("total_value", True),
+    "scheduling": ("makespan", False),
+    "facility": ("total_cost", False),
+    "vrp": ("total_cost", False),
+    "mip": ("objective", False),
+    "sparse_mip": ("objective", None),
+}
+
+
+# Φάκελος δεδομένων κατάστασης του χρήστη: %LOCALAPPDATA% στα Windows, αλλιώς $XDG_STATE_HOME
+# (προεπιλογή ~/.local/state)
+def _state_dir():
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser(r"~\AppData\Local")
+    else:
+        base = os.environ.get("XDG_STATE_HOME") or os.path.expanduser("~/.local/state")
+    return os.path.join(base, "pyomo_practice")
+
+
+# Αρχείο με τις νίκες κάθε solver ανά πρόβλημα (και το .lock του), εκτός του φακέλου του κώδικα.
+# Η μεταβλητή περιβάλλοντος PORTFOLIO_STATS ορίζει άλλη διαδρομή.
+STATS_PATH = os.environ.get("PORTFOLIO_STATS") or os.path.join(_state_dir(), "portfolio_stats.json")
+
+# Χρόνος (s) που δίνεται σε κάθε διεργασία να τερματίσει μετά το SIGTERM
+STOP_GRACE = 1.0
+
+# Μέρος του time_limit που δίνεται στους solvers, ώστε να προλάβουν να στείλουν την καλύτερη
+# λύση τους (δημιουργία μοντέλου, φόρτωση λύσης) πριν από το deadline του αγώνα
+WORKER_TIME_SHARE = 0.8
+
+
+# Οι solvers της λίστας που είναι διαθέσιμοι σε αυτό το μηχάνημα
+def available_solvers(candidates=CANDIDATES):
+    found = []
+    for solver in candidates:
+        try:
+            if is_in_memory(solver):
+                ok = bool(create_solver(solver).available())
+            else:
+                ok = create_solver(solver).available(exception_flag=False)
+        except Exception:
+            ok = False
+        if ok:
+            found.append(solver)
+    return found
+
+
+# Διεργασία του αγώνα: δική της ομάδα διεργασιών, ώστε ο τερματισμός της να σταματά και τον solver
+def _worker(problem, instance, solver, options, connection):
+    if os.name == "posix":
+        os.setpgrp()
+    start = time.perf_counter()
+    try:
+        result = problems.solve(problem, instance, solver=solver, **options)
+        connection.send((result, None, time.perf_counter() - start))
+    except Exception as e:
+        connection.send((None, str(e), time.perf_counter() - start))
+    connection.close()
+
+
+def _stop(process):
+    if process.is_alive():
+        try:
+            if os.name == "posix":
+                os.killpg(process.pid, signal.SIGTERM)
+            else:
+                process.terminate()
+        except (ProcessLookupError, PermissionError):
+            process.terminate()
+        process.join(STOP_GRACE)
+    if process.is_alive():
+        try:
+            if os.name == "posix":
+                os.killpg(process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+        process.kill()
+    process.join()
+
+
+# Σύγκριση εφικτών λύσεων: μικρότερο κλειδί = καλύτερη λύση
+def _score(problem, instance, result):
+    field, maximize = OBJECTIVES.get(problem, ("objective", False))
+    if maximize is None:
+        maximize = bool(instance.get("maximize", False))
+    value = result.get(field)
+    if value is None:
+        return None
+    return -value if maximize else value
+
+
+# Ο ίδιος το instance σε κάθε solver, ο καθένας σε ξεχωριστή διεργασία. Επιστρέφει το πρώτο
+# αποδεδειγμένο αποτέλεσμα (π.χ. optimal) ή, στο time_limit, την καλύτερη εφικτή λύση που έχει
+# τελειώσει· οι υπόλοιπες διεργασίες τερματίζονται. Το αποτέλεσμα έχει τη μορφή του προβλήματος,
+# με επιπλέον solver (ο νικητής) και portfolio (status και χρόνος κάθε solver). Η νίκη
+# καταγράφεται στο stats_path (None: χωρίς καταγραφή).
+def solve_portfolio(problem, instance, solvers=None, time_limit=60.0, stats_path=STATS_PATH, **options):
+    solvers = list(solvers) if solvers else available_solvers()
+    if not solvers:
+        raise ValueError("No solver of the portfolio is available.")
+    options.pop("solver", None)
+    # Τα προβλήματα με όριο χρόνου σταματούν λίγο πριν από το deadline με την καλύτερη λύση τους
+    if time_limit is not None and "time_limit" in inspect.signature(problems.SOLVERS[problem]).parameters:
+        options.setdefault("time_limit", WORKER_TIME_SHARE * time_limit)
+
+    context = multiprocessing.get_context()
+    running = {}
+    for solver in solvers:
+        reader, writer = context.Pipe(duplex=False)
+        process = context.Process(target=_worker, args=(problem, instance, solver, options, writer), daemon=True)
+        process.start()
+        writer.close()
+        running[reader] = (solver, process)
+
+    start = time.perf_counter()
+    deadline = start + time_limit
+    report = []
+    winner = None
+    incumbent = None
+    try:
+        while running and winner is None:
+            ready = wait(list(running), timeout=max(0.0, deadline - time.perf_counter()))
+            if not ready:
+                break
+            for reader in ready:
+                solver, process = running.pop(reader)
+                try:
+                    result, error, elapsed = reader.recv()
+                except EOFError:
+                    result, error, elapsed = None, "The solver process exited without a result.", None
+                reader.close()
+                process.join()
+                if elapsed is None:
+                    elapsed = time.perf_counter() - start
+                if result is None:
+                    report.append({"solver": solver, "status": "error", "seconds": elapsed, "error": error})
+                    continue
+                status = result["status"]
+                report.append({"solver": solver, "status": status, "seconds": elapsed})
+                if status in CONCLUSIVE:
+                    winner = (solver, result, elapsed)
+                    break
+                score = _score(problem, instance, result)
+                if score is not None and (incumbent is None or score < incumbent[0]):
+                    incumbent = (score, solver, result, elapsed)
+    finally:
+        for reader, (solver, process) in running.items():
+            _stop(process)
+            reader.close()
+            report.append({"solver": solver, "status": "stopped", "seconds": time.perf_counter() - start})
+
+    if winner is None and incumbent is not None:
+        winner = incumbent[1:]
+    if winner is None:
+        status = "maxTimeLimit" if any(entry["status"] == "stopped" for entry in report) else "error"
+        return {"status": status, "solver": None, "portfolio": report}
+
+    solver, result, elapsed = winner
+    if stats_path is not None:
+        record_win(problem, solver, elapsed, stats_path)
+    return dict(result, solver=solver, portfolio=report)
+
+
+def load_stats(stats_path=STATS_PATH):
+    try:
+        with open(stats_path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+# Αποκλειστικό κλείδωμα αρχείου μεταξύ διεργασιών (flock στο POSIX, msvcrt στα Windows)
+@contextlib.contextmanager
+def _locked(path):
+    with open(path, "a+b") as lock:
+        if os.name == "posix":
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        else:
+            lock.seek(0)
+            msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if os.name == "posix":
+                fcntl.flock(lock, fcntl.LOCK_UN)
+            else:
+                lock.seek(0)
+                msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+# Καταγραφή νίκης: πρόβλημα -> solver -> {"wins", "seconds"} (συνολικός χρόνος των νικών).
+# Ανάγνωση, ενημέρωση και αντικατάσταση γίνονται με κλείδωμα (αρχείο .lock), ώστε ταυτόχρονοι
+# αγώνες να μη χάνουν νίκες.
+def record_win(problem, solver, seconds, stats_path=STATS_PATH):
+    os.makedirs(os.path.dirname(os.path.abspath(stats_path)), exist_ok=True)
+    with _locked(f"{stats_path}.lock"):
+        stats = load_stats(stats_path)
+        entry = stats.setdefault(problem, {}).setdefault(solver, {"wins": 0, "seconds": 0.0})
+        entry["wins"] += 1
+        entry["seconds"] += float(seconds)
+        temporary = f"{stats_path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(stats, f, indent=2, sort_keys=True)
+        os.replace(temporary, stats_path)
+
+
+# Ο solver με τις περισσότερες νίκες για το πρόβλημα (σε ισοπαλία ο ταχύτερος κατά μέσο όρο)
+def learned_solver(problem, default="glpk", stats_path=STATS_PATH):
+    wins = load_stats(stats_path).get(problem, {})
+    if not wins:
+        return default
+    return min(wins, key=lambda solver: (-wins[solver]["wins"], wins[solver]["seconds"] / wins[solver]["wins"]))
@@ -0,0 +1,61 @@
+import inspect
+
+import assignment
+import facility
+import knapsack
+import mip
+import scheduling
+import vrp
+from solve_metrics import annotate, metrics_enabled, solve_context
+
+# Συναρτήσεις επίλυσης χωρίς GUI ανά τύπο προβλήματος
+SOLVERS = {
+    "assignment": assignment.solve_assignment,
+    "knapsack": knapsack.solve_knapsack,
+    "scheduling": scheduling.solve_scheduling,
+    "facility": facility.solve_facility_location,
+    "vrp": vrp.solve_vrp,
+    "mip": mip.solve_mip,
+    "sparse_mip": mip.solve_sparse_mip,
+}
+
+# Engines που λύνουν το πρόβλημα χωρίς solver του Pyomo (η επιλογή solver δεν τα αφορά)
+SOLVERLESS_ENGINES = {
+    "assignment": {"hungarian"},
+    "knapsack": {"dp", "bb"},
+    "scheduling": {"heuristic"},
+    "facility": {"search"},
+    "vrp": {"lns"},
+}
+
+
+# Αν η επίλυση με αυτές τις επιλογές χρησιμοποιεί solver (το engine "auto" του knapsack μπορεί
+# να καταλήξει στο MIP, οπότε μετράει)
+def uses_solver(problem, options):
+    engine = _labels(problem, options).get("engine")
+    return engine not in SOLVERLESS_ENGINES.get(problem, ())
+
+
+# Engine και solver μιας κλήσης, με τις προεπιλογές της συνάρτησης για όσα δεν δίνονται
+def _labels(problem, options):
+    parameters = inspect.signature(SOLVERS[problem]).parameters
+    labels = {}
+    for name in ("engine", "solver"):
+        if name in options:
+            labels[name] = options[name]
+        elif name in parameters:
+            labels[name] = parameters[name].default
+    return labels
+
+
+# Επίλυση ενός instance: τα πεδία του instance περνούν ως ορίσματα στη συνάρτηση του προβλήματος.
+# Με ενεργό το solve_metrics η κλήση καταγράφεται (φάσεις, μέγεθος μοντέλου, termination).
+def solve(problem, instance, **options):
+    if problem not in SOLVERS:
+        raise ValueError(f"Unknown problem: {problem}")
+    if not metrics_enabled():
+        return SOLVERS[problem](**instance, **options)
+    with solve_context(problem, **_labels(problem, options)):
+        result = SOLVERS[problem](**instance, **options)
+        annotate(status=result.get("status"))
+    return result
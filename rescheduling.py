@@ -0,0 +1,183 @@
+import heapq
+import time
+
+import numpy as np
+
+from scheduling import EPS
+
+# Προεπιλεγμένος χρόνος (s) για τη βελτίωση του προγράμματος σε κάθε ενημέρωση
+TIME_BUDGET = 0.05
+
+
+# Online επαναπρογραμματισμός σε πανομοιότυπες μηχανές. Η κατάσταση είναι dict:
+#   num_machines, now (τρέχων χρόνος), next_id,
+#   tasks: id -> {"duration", "machine", "start"} και frozen: ids εργασιών που έχουν ξεκινήσει.
+# Σε κάθε ενημέρωση ξαναβελτιστοποιούνται μόνο οι εργασίες που δεν έχουν ξεκινήσει,
+# με αρχική λύση το προηγούμενο πρόγραμμα, και μόνο για time_budget δευτερόλεπτα.
+def create_schedule(durations, num_machines, time_budget=TIME_BUDGET):
+    num_machines = int(num_machines)
+    if num_machines < 1:
+        raise ValueError("At least one machine is required.")
+    state = {"num_machines": num_machines, "now": 0.0, "next_id": 0, "tasks": {}, "frozen": set()}
+    add_tasks(state, durations, time_budget=time_budget)
+    return state
+
+
+# Νέες εργασίες (λίστα διαρκειών): επιστρέφει τα ids τους
+def add_tasks(state, durations, now=None, time_budget=TIME_BUDGET):
+    ids = []
+    for d in durations:
+        d = float(d)
+        if d < 0:
+            raise ValueError("Durations must be non-negative.")
+        task = state["next_id"]
+        state["next_id"] += 1
+        state["tasks"][task] = {"duration": d, "machine": None, "start": None}
+        ids.append(task)
+    reoptimize(state, now, time_budget)
+    return ids
+
+
+# Αφαίρεση εργασιών που δεν έχουν ξεκινήσει
+def remove_tasks(state, task_ids, now=None, time_budget=TIME_BUDGET):
+    if now is not None:
+        _freeze(state, now)
+    for task in task_ids:
+        if task not in state["tasks"]:
+            raise KeyError(f"Unknown task: {task}")
+        if task in state["frozen"]:
+            raise ValueError(f"Task {task} has already started.")
+    for task in task_ids:
+        del state["tasks"][task]
+    reoptimize(state, None, time_budget)
+
+
+# Μετακίνηση του χρόνου: όσες εργασίες έχουν ξεκινήσει μέχρι το now παγώνουν
+def _freeze(state, now):
+    now = float(now)
+    if now < state["now"]:
+        raise ValueError("Time cannot move backwards.")
+    state["now"] = now
+    for task, entry in state["tasks"].items():
+        if entry["start"] is not None and entry["start"] < now - EPS:
+            state["frozen"].add(task)
+
+
+# LPT για τις εργασίες d, με τις μηχανές διαθέσιμες από τους χρόνους ready
+def _lpt(d, ready):
+    machines = np.empty(len(d), dtype=int)
+    heap = [(float(r), m) for m, r in enumerate(ready)]
+    heapq.heapify(heap)
+    for t in np.argsort(-d, kind="stable"):
+        load, m = heapq.heappop(heap)
+        machines[t] = m
+        heapq.heappush(heap, (load + d[t], m))
+    return machines
+
+
+# Τοπική αναζήτηση στην πιο φορτωμένη μηχανή: μετακίνηση μιας εργασίας στη λιγότερο φορτωμένη
+# ή ανταλλαγή με μικρότερη εργασία άλλης μηχανής, όσο μειώνεται το φορτίο της και υπάρχει χρόνος
+def _improve(d, machines, ready, deadline):
+    loads = ready + np.bincount(machines, weights=d, minlength=len(ready))
+    while time.perf_counter() < deadline:
+        top = int(np.argmax(loads))
+        on_top = np.nonzero(machines == top)[0]
+        if len(on_top) == 0:
+            break
+
+        # Μετακίνηση στη λιγότερο φορτωμένη άλλη μηχανή
+        others = loads.copy()
+        others[top] = np.inf
+        low = int(np.argmin(others))
+        moved = np.maximum(loads[top] - d[on_top], loads[low] + d[on_top])
+        k = int(np.argmin(moved))
+        best = (moved[k], on_top[k], None, low)
+
+        # Ανταλλαγή: εργασία t της top με εργασία u άλλης μηχανής
+        off_top = np.nonzero(machines != top)[0]
+        if len(off_top):
+            delta = d[on_top][:, None] - d[off_top][None, :]
+            swapped = np.where(
+                delta > EPS,
+                np.maximum(loads[top] - delta, loads[machines[off_top]][None, :] + delta),
+                np.inf,
+            )
+            i, j = np.unravel_index(np.argmin(swapped), swapped.shape)
+            if swapped[i, j] < best[0]:
+                best = (swapped[i, j], on_top[i], off_top[j], machines[off_top[j]])
+
+        value, t, u, m = best
+        if value >= loads[top] - EPS:
+            break
+        loads[top] -= d[t]
+        loads[m] += d[t]
+        machines[t] = m
+        if u is not None:
+            loads[m] -= d[u]
+            loads[top] += d[u]
+            machines[u] = top
+    return machines
+
+
+# Κάτω φράγμα για το makespan των εργασιών που δεν έχουν ξεκινήσει
+def _lower_bound(d, ready):
+    if len(d) == 0:
+        return float(ready.max(initial=0.0))
+    bound = max((ready.sum() + d.sum()) / len(ready), ready.min() + d.max(), ready.max())
+    if np.all(d == np.round(d)) and np.all(ready == np.round(ready)):
+        bound = np.ceil(bound - EPS)
+    return float(bound)
+
+
+# Επαναβελτιστοποίηση των εργασιών που δεν έχουν ξεκινήσει. Οι παγωμένες εργασίες κρατούν
+# μηχανή και χρόνο έναρξης· κάθε μηχανή είναι διαθέσιμη μετά το now και την τελευταία τους.
+def reoptimize(state, now=None, time_budget=TIME_BUDGET):
+    deadline = time.perf_counter() + (TIME_BUDGET if time_budget is None else time_budget)
+    if now is not None:
+        _freeze(state, now)
+    tasks, frozen = state["tasks"], state["frozen"]
+
+    ready = np.full(state["num_machines"], state["now"])
+    for task in frozen:
+        entry = tasks[task]
+        ready[entry["machine"]] = max(ready[entry["machine"]], entry["start"] + entry["duration"])
+
+    free = [task for task in tasks if task not in frozen]
+    d = np.array([tasks[task]["duration"] for task in free], dtype=float)
+
+    # Αρχική λύση: το προηγούμενο πρόγραμμα, με τις νέες εργασίες στη λιγότερο φορτωμένη μηχανή.
+    # Κρατείται η καλύτερη από αυτή και από ένα νέο LPT.
+    previous = np.array([-1 if tasks[task]["machine"] is None else tasks[task]["machine"] for task in free], dtype=int)
+    loads = ready + np.bincount(previous[previous >= 0], weights=d[previous >= 0], minlength=len(ready))
+    for t in np.nonzero(previous < 0)[0][np.argsort(-d[previous < 0], kind="stable")]:
+        previous[t] = int(np.argmin(loads))
+        loads[previous[t]] += d[t]
+    candidates = [previous, _lpt(d, ready)]
+    machines = min(
+        candidates,
+        key=lambda m: (ready + np.bincount(m, weights=d, minlength=len(ready))).max(initial=0.0),
+    )
+    machines = _improve(d, machines.copy(), ready, deadline)
+
+    # Χρόνοι έναρξης: από τη διαθεσιμότητα κάθε μηχανής, με φθίνουσα διάρκεια
+    clock = ready.copy()
+    for t in np.lexsort((np.arange(len(d)), -d, machines)):
+        entry = tasks[free[t]]
+        entry["machine"] = int(machines[t])
+        entry["start"] = float(clock[machines[t]])
+        clock[machines[t]] += d[t]
+
+    state["lower_bound"] = _lower_bound(d, ready)
+    return schedule_result(state)
+
+
+# Το πρόγραμμα στη μορφή του solve_scheduling (status "optimal" όταν φτάνει το κάτω φράγμα)
+def schedule_result(state):
+    tasks = state["tasks"]
+    schedule = [
+        {"task": task, "machine": entry["machine"], "start": entry["start"], "frozen": task in state["frozen"]}
+        for task, entry in sorted(tasks.items())
+    ]
+    makespan = max((entry["start"] + entry["duration"] for entry in tasks.values()), default=0.0)
+    status = "optimal" if makespan <= state.get("lower_bound", 0.0) + EPS else "feasible"
+    return {"status": status, "makespan": makespan, "schedule": schedule}
@@ -0,0 +1,218 @@
+import heapq
+
+import numpy as np
+import pyomo.environ as pe
+
+from solution_arrays import selected_indices
+from solve_metrics import phase
+from solver_backends import solve_model
+
+# Ανοχή για τις συγκρίσεις χρόνων
+EPS = 1e-9
+
+
+# Κάτω φράγμα του makespan: μέσο φορτίο, μεγαλύτερη εργασία και άθροισμα της m-οστής και της
+# (m+1)-οστής μεγαλύτερης εργασίας (δύο από τις m+1 μεγαλύτερες πέφτουν στην ίδια μηχανή)
+def makespan_lower_bound(durations, num_machines):
+    d = np.sort(np.asarray(durations, dtype=float))[::-1]
+    if len(d) == 0:
+        return 0.0
+    bound = max(d.sum() / num_machines, d[0])
+    if len(d) > num_machines:
+        bound = max(bound, d[num_machines - 1] + d[num_machines])
+    # Με ακέραιες διάρκειες και ο makespan είναι ακέραιος
+    if np.all(d == np.round(d)):
+        bound = np.ceil(bound - EPS)
+    return float(bound)
+
+
+def machine_loads(durations, machines, num_machines):
+    return np.bincount(machines, weights=np.asarray(durations, dtype=float), minlength=num_machines)
+
+
+# LPT: οι εργασίες με φθίνουσα διάρκεια, καθεμία στη μηχανή με το μικρότερο φορτίο
+def lpt_schedule(durations, num_machines):
+    d = np.asarray(durations, dtype=float)
+    machines = np.empty(len(d), dtype=int)
+    heap = [(0.0, m) for m in range(num_machines)]
+    for t in np.argsort(-d, kind="stable"):
+        load, m = heapq.heappop(heap)
+        machines[t] = m
+        heapq.heappush(heap, (load + d[t], m))
+    return machines
+
+
+# First Fit Decreasing με χωρητικότητα capacity ανά μηχανή (None αν δεν χωράνε όλες οι εργασίες)
+def _first_fit_decreasing(d, order, num_machines, capacity):
+    loads = np.zeros(num_machines)
+    machines = np.empty(len(d), dtype=int)
+    for t in order:
+        fits = np.nonzero(loads + d[t] <= capacity + EPS)[0]
+        if len(fits) == 0:
+            return None
+        machines[t] = fits[0]
+        loads[fits[0]] += d[t]
+    return machines
+
+
+# MULTIFIT: δυαδική αναζήτηση στη χωρητικότητα για την οποία το FFD χωράει τις εργασίες σε m μηχανές
+def multifit_schedule(durations, num_machines, iterations=7):
+    d = np.asarray(durations, dtype=float)
+    if len(d) == 0:
+        return np.empty(0, dtype=int)
+    order = np.argsort(-d, kind="stable")
+    low = max(d.sum() / num_machines, d.max())
+    high = max(2 * d.sum() / num_machines, d.max())
+    best = _first_fit_decreasing(d, order, num_machines, high)
+    for _ in range(iterations):
+        middle = (low + high) / 2
+        machines = _first_fit_decreasing(d, order, num_machines, middle)
+        if machines is None:
+            low = middle
+        else:
+            high = middle
+            best = machines
+    return best
+
+
+# Η καλύτερη από τις λύσεις LPT και MULTIFIT (ανάθεση εργασία -> μηχανή)
+def warm_start_schedule(durations, num_machines):
+    candidates = [lpt_schedule(durations, num_machines)]
+    machines = multifit_schedule(durations, num_machines)
+    if machines is not None:
+        candidates.append(machines)
+    return min(candidates, key=lambda m: machine_loads(durations, m, num_machines).max(initial=0.0))
+
+
+# Χρόνοι έναρξης από την ανάθεση: σε κάθε μηχανή οι εργασίες εκτελούνται διαδοχικά
+# με φθίνουσα διάρκεια, χωρίς κενά
+def sequence_schedule(durations, machines):
+    d = np.asarray(durations, dtype=float)
+    machines = np.asarray(machines, dtype=int)
+    order = np.lexsort((np.arange(len(d)), -d, machines))
+    start = np.zeros(len(d))
+    finish = 0.0
+    previous = None
+    for t in order:
+        if machines[t] != previous:
+            previous = machines[t]
+            clock = 0.0
+        start[t] = clock
+        clock += d[t]
+        finish = max(finish, clock)
+    schedule = [{"task": t, "machine": int(machines[t]), "start": float(start[t])} for t in range(len(d))]
+    return {"makespan": finish, "schedule": schedule}
+
+
+# Αλλαγή αρίθμησης των μηχανών ώστε η ανάθεση να τηρεί το σπάσιμο συμμετρίας του μοντέλου:
+# με τις εργασίες σε φθίνουσα διάρκεια, η εργασία στη θέση r πάει σε μηχανή με δείκτη <= r
+def _relabel(machines, order):
+    labels = {}
+    relabeled = np.empty(len(machines), dtype=int)
+    for t in order:
+        relabeled[t] = labels.setdefault(machines[t], len(labels))
+    return relabeled
+
+
+# Δημιουργία μοντέλου Pyomo για το Scheduling Problem (πανομοιότυπες παράλληλες μηχανές, P||Cmax).
+# Η σειρά εκτέλεσης δεν επηρεάζει το makespan, οπότε αρκούν η ανάθεση και το φορτίο κάθε μηχανής:
+# makespan >= φορτίο μηχανής. Οι χρόνοι έναρξης προκύπτουν μετά με sequence_schedule.
+def build_scheduling_model(durations, num_machines):
+    durations = [float(d) for d in durations]
+    order = [int(t) for t in np.argsort(-np.asarray(durations), kind="stable")]
+    position = {t: r for r, t in enumerate(order)}
+    model = pe.ConcreteModel()
+
+    # Σετ εργασιών και μηχανών
+    model.tasks = pe.Set(initialize=range(len(durations)))
+    model.machines = pe.Set(initialize=range(num_machines))
+    model.duration = pe.Param(model.tasks, initialize=dict(enumerate(durations)))
+
+    # Σπάσιμο συμμετρίας: οι μηχανές είναι ίδιες, οπότε η εργασία στη θέση r (φθίνουσα διάρκεια)
+    # μπορεί να πάει μόνο στις μηχανές 0..r
+    model.pairs = pe.Set(
+        dimen=2,
+        initialize=[(t, m) for t in order for m in range(min(position[t] + 1, num_machines))],
+    )
+
+    # Μεταβλητές απόφασης
+    model.machine_assignment = pe.Var(model.pairs, domain=pe.Binary)  # Ανάθεση μηχανής
+    model.machine_load = pe.Var(model.machines, domain=pe.NonNegativeReals)  # Φορτίο μηχανής
+
+    # Μεταβλητή για το makespan (συνολικό χρόνο ολοκλήρωσης), φραγμένη από κάτω
+    model.makespan = pe.Var(
+        domain=pe.NonNegativeReals, bounds=(makespan_lower_bound(durations, num_machines), None)
+    )
+
+    # Συνάρτηση στόχου: Ελαχιστοποίηση του makespan
+    model.obj = pe.Objective(expr=model.makespan, sense=pe.minimize)
+
+    # Περιορισμός: Κάθε εργασία πρέπει να εκτελείται από μία μηχανή
+    def task_assignment_rule(model, t):
+        return sum(model.machine_assignment[t, m] for m in range(min(position[t] + 1, num_machines))) == 1
+
+    model.task_constraints = pe.Constraint(model.tasks, rule=task_assignment_rule)
+
+    # Φορτίο κάθε μηχανής: άθροισμα διαρκειών των εργασιών της (μόνο εργασίες από τη θέση m και μετά)
+    def load_rule(model, m):
+        return model.machine_load[m] == sum(model.duration[t] * model.machine_assignment[t, m] for t in order[m:])
+
+    model.load_constraints = pe.Constraint(model.machines, rule=load_rule)
+
+    # Περιορισμός: Ο makespan είναι μεγαλύτερος ή ίσος από το φορτίο κάθε μηχανής
+    def makespan_rule(model, m):
+        return model.makespan >= model.machine_load[m]
+
+    model.makespan_constraints = pe.Constraint(model.machines, rule=makespan_rule)
+
+    return model
+
+
+# Αρχική λύση στις μεταβλητές του μοντέλου (για solvers με warm start)
+def apply_warm_start(model, machines):
+    durations = [pe.value(model.duration[t]) for t in model.tasks]
+    order = np.argsort(-np.asarray(durations), kind="stable")
+    machines = _relabel(machines, order)
+    for t, m in model.pairs:
+        model.machine_assignment[t, m].set_value(1 if machines[t] == m else 0)
+    loads = machine_loads(durations, machines, len(model.machines))
+    for m in model.machines:
+        model.machine_load[m].set_value(float(loads[m]))
+    model.makespan.set_value(max(float(loads.max(initial=0.0)), model.makespan.lb))
+
+
+# Ανάγνωση αποτελεσμάτων από λυμένο μοντέλο (δείκτες με αρίθμηση από το 0)
+def extract_schedule(model):
+    machines = np.zeros(len(model.tasks), dtype=int)
+    for t, m in selected_indices(model.machine_assignment):
+        machines[t] = m
+    durations = [pe.value(model.duration[t]) for t in model.tasks]
+    return sequence_schedule(durations, machines)
+
+
+# Επίλυση του Scheduling Problem χωρίς GUI: διάρκειες εργασιών και πλήθος μηχανών μέσα, dict έξω.
+# Η λύση LPT/MULTIFIT δίνεται ως αρχική λύση στον solver και, αν φτάνει το κάτω φράγμα,
+# επιστρέφεται κατευθείαν ως βέλτιστη. engine="heuristic" επιστρέφει πάντα αυτή τη λύση.
+def solve_scheduling(durations, num_machines, solver="glpk", tee=False, engine="pyomo"):
+    num_machines = int(num_machines)
+    if num_machines < 1:
+        raise ValueError("At least one machine is required.")
+    if engine not in ("pyomo", "heuristic"):
+        raise ValueError(f"Unknown engine: {engine}")
+
+    durations = [float(d) for d in durations]
+    machines = warm_start_schedule(durations, num_machines)
+    heuristic = sequence_schedule(durations, machines)
+    if heuristic["makespan"] <= makespan_lower_bound(durations, num_machines) + EPS:
+        return {"status": "optimal", **heuristic}
+    if engine == "heuristic":
+        return {"status": "feasible", **heuristic}
+
+    with phase("build"):
+        model = build_scheduling_model(durations, num_machines)
+        apply_warm_start(model, machines)
+    status = solve_model(model, solver, tee, warmstart=True)
+    if status != "optimal":
+        return {"status": status, "makespan": None, "schedule": []}
+    with phase("format"):
+        return {"status": status, **extract_schedule(model)}
@@ -0,0 +1,114 @@
+import itertools
+import math
+import operator
+
+import numpy as np
+
+# Ανοχή για τη στρογγυλοποίηση των τιμών ακέραιων (και δυαδικών) μεταβλητών: οι solvers
+# επιστρέφουν π.χ. 0.9999999 ή 1e-9 αντί για 1 και 0
+INTEGER_TOLERANCE = 1e-5
+
+_value = operator.attrgetter("value")
+
+
+# Τα VarData μιας (indexed) μεταβλητής με τη σειρά κατασκευής. Το λεξικό _data του Pyomo
+# διατρέχεται πολύ πιο γρήγορα από το var.values(), που ελέγχει κάθε δείκτη στο σετ. Αν λείπει
+# (ή δεν έχει όσα στοιχεία η μεταβλητή) χρησιμοποιείται το δημόσιο var.items().
+def _var_data(var):
+    if not var.is_indexed():
+        return {None: var}
+    data = getattr(var, "_data", None)
+    if isinstance(data, dict) and len(data) == len(var):
+        return data
+    return dict(var.items())
+
+
+# Όλες οι τιμές μιας μεταβλητής σε ένα πέρασμα, ως επίπεδος πίνακας με τη σειρά των δεικτών
+# (NaN όπου δεν υπάρχει τιμή). Στις ακέραιες μεταβλητές οι τιμές που απέχουν λιγότερο από tol
+# από ακέραιο στρογγυλοποιούνται (tol=None: χωρίς στρογγυλοποίηση).
+def var_values(var, tol=INTEGER_TOLERANCE):
+    data = _var_data(var)
+    try:
+        values = np.fromiter(map(_value, data.values()), dtype=float, count=len(data))
+    except TypeError:
+        values = np.array([math.nan if v.value is None else v.value for v in data.values()], dtype=float)
+    if tol is not None and data and next(iter(data.values())).is_integer():
+        values = round_integral(values, tol)
+    return values
+
+
+# Στρογγυλοποίηση στον πλησιέστερο ακέραιο των τιμών που απέχουν από αυτόν λιγότερο από tol
+def round_integral(values, tol=INTEGER_TOLERANCE):
+    values = np.asarray(values, dtype=float)
+    rounded = np.round(values)
+    # + 0.0: το -0.0 γίνεται 0.0
+    return np.where(np.abs(values - rounded) <= tol, rounded, values) + 0.0
+
+
+# Οι τιμές μιας indexed μεταβλητής ως πίνακας NumPy με διαστάσεις τα σετ των δεικτών της: το
+# στοιχείο [a, b] αντιστοιχεί στο k-οστό στοιχείο του πρώτου σετ και το l-οστό του δεύτερου.
+# index_sets: τα σετ ανά διάσταση, για μεταβλητές πάνω σε σετ ζευγαριών (π.χ. τόξα) αντί για
+# γινόμενο σετ. Δείκτες χωρίς μεταβλητή παίρνουν την τιμή fill.
+def var_array(var, index_sets=None, tol=INTEGER_TOLERANCE, fill=np.nan):
+    values = var_values(var, tol)
+    if not var.is_indexed():
+        return values.reshape(())
+    dense = _product_sets(var)
+    if index_sets is None:
+        if var.dim() > 1 and len(list(var.index_set().subsets())) != var.dim():
+            raise ValueError(f"Pass index_sets for {var.name}: its index is not a product of sets.")
+        index_sets = list(var.index_set().subsets()) if var.dim() > 1 else [var.index_set()]
+    shape = tuple(len(s) for s in index_sets)
+
+    # Μεταβλητή σε όλο το γινόμενο των ίδιων σετ: οι τιμές είναι ήδη με τη σειρά του πίνακα
+    if dense is not None and len(dense) == len(index_sets) and all(s is t for s, t in zip(dense, index_sets)):
+        return values.reshape(shape)
+
+    array = np.full(shape, fill, dtype=float)
+    if len(values) == 0:
+        return array
+    keys = _var_data(var).keys()
+    columns = [keys] if len(shape) == 1 else list(zip(*keys))
+    index = tuple(
+        np.fromiter(map({value: k for k, value in enumerate(s)}.__getitem__, column), dtype=np.intp, count=len(values))
+        for s, column in zip(index_sets, columns)
+    )
+    array[index] = values
+    return array
+
+
+# Τα σετ των δεικτών, αν η μεταβλητή ορίζεται σε όλο το γινόμενό τους και οι τιμές της είναι
+# με τη σειρά του γινομένου (αλλιώς None). Η σειρά ελέγχεται: μια μεταβλητή με dense=False
+# που γεμίζει π.χ. ανά στήλη έχει όλα τα στοιχεία, αλλά με άλλη σειρά.
+def _product_sets(var):
+    sets = list(var.index_set().subsets()) if var.dim() > 1 else [var.index_set()]
+    data = _var_data(var)
+    if len(sets) != var.dim() or len(data) != math.prod(len(s) for s in sets):
+        return None
+    expected = itertools.product(*sets) if var.dim() > 1 else iter(sets[0])
+    if not all(map(operator.eq, data.keys(), expected)):
+        return None
+    return sets
+
+
+# Οι τιμές μιας μεταβλητής ως pandas Series με δείκτη τους δείκτες της (MultiIndex αν είναι
+# πολλαπλοί), με ονόματα επιπέδων names
+def var_series(var, names=None, tol=INTEGER_TOLERANCE):
+    import pandas as pd
+
+    values = var_values(var, tol)
+    dense = _product_sets(var)
+    if var.dim() <= 1:
+        index = pd.Index(list(_var_data(var).keys()), name=names[0] if names else None)
+    elif dense is not None:
+        index = pd.MultiIndex.from_product([list(s) for s in dense], names=names)
+    else:
+        index = pd.MultiIndex.from_tuples(list(_var_data(var).keys()), names=names)
+    return pd.Series(values, index=index, name=var.local_name)
+
+
+# Οι δείκτες όπου η μεταβλητή (μετά τη στρογγυλοποίηση) έχει την τιμή value, π.χ. οι αναθέσεις
+# που επιλέχθηκαν σε δυαδική μεταβλητή, με τη σειρά των δεικτών
+def selected_indices(var, value=1, tol=INTEGER_TOLERANCE):
+    mask = var_values(var, tol) == value
+    return list(itertools.compress(_var_data(var).keys(), mask.tolist()))
@@ -0,0 +1,195 @@
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+import problems
+from instances import ARRAY_EXTENSIONS
+
+# Επιλογές που δεν επηρεάζουν τη λύση και δεν μπαίνουν στο κλειδί
+IGNORED_OPTIONS = ("tee",)
+
+# Κατάσταση της cache: LRU στη μνήμη (κλειδί -> pickled αποτέλεσμα) και προαιρετική βάση SQLite
+_memory = OrderedDict()
+_state = {"max_bytes": 64 * 1024**2, "bytes": 0, "db": None}
+_stats = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0, "bypassed": 0}
+
+
+# Ρύθμιση της cache: όριο μνήμης σε bytes και προαιρετικό αρχείο SQLite για μόνιμη αποθήκευση
+def configure_cache(max_bytes=None, path=None):
+    if max_bytes is not None:
+        _state["max_bytes"] = int(max_bytes)
+        _evict()
+    if path is not None:
+        if _state["db"] is not None:
+            _state["db"].close()
+        db = sqlite3.connect(path)
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS solutions (key TEXT PRIMARY KEY, value BLOB, created REAL)"
+        )
+        db.commit()
+        _state["db"] = db
+
+
+# Άδειασμα της μνήμης (και της βάσης, αν disk=True) και μηδενισμός των μετρητών
+def clear_cache(disk=False):
+    _memory.clear()
+    _state["bytes"] = 0
+    for name in _stats:
+        _stats[name] = 0
+    if disk and _state["db"] is not None:
+        _state["db"].execute("DELETE FROM solutions")
+        _state["db"].commit()
+
+
+# Μετρητές hit/miss/eviction και τρέχον μέγεθος της μνήμης
+def cache_stats():
+    return dict(_stats, entries=len(_memory), bytes=_state["bytes"], max_bytes=_state["max_bytes"])
+
+
+# Στοιχεία ανά κομμάτι στο hash μεγάλων πινάκων (χωρίς αντίγραφο όλου του πίνακα σε bytes)
+HASH_CHUNK = 1 << 20
+
+
+# SHA-256 των bytes ενός αρχείου, διαβασμένου σε κομμάτια
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(8 * HASH_CHUNK), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# Κανονική μορφή μιας τιμής για το hash: αριθμητικοί πίνακες (λίστες ή NumPy) ως float64 bytes,
+# ώστε η ίδια λίστα και ο ίδιος πίνακας να δίνουν το ίδιο κλειδί. Πεδία με όνομα αρχείου πίνακα
+# (που τα φορτώνει η επίλυση) αναγνωρίζονται από το περιεχόμενο του αρχείου, όχι από το όνομά του.
+def _update_hash(digest, value):
+    if isinstance(value, dict):
+        digest.update(b"{")
+        for key in sorted(value):
+            digest.update(json.dumps(str(key)).encode())
+            _update_hash(digest, value[key])
+        digest.update(b"}")
+        return
+    if isinstance(value, (list, tuple, np.ndarray)):
+        try:
+            array = np.asarray(value)
+        except ValueError:
+            array = None
+        if array is not None and array.dtype.kind in "biuf":
+            digest.update(f"array{array.shape}".encode())
+            flat = array.reshape(-1)
+            for start in range(0, flat.size, HASH_CHUNK):
+                digest.update(np.ascontiguousarray(flat[start:start + HASH_CHUNK], dtype=np.float64).tobytes())
+            return
+        digest.update(b"[")
+        for item in value:
+            _update_hash(digest, item)
+        digest.update(b"]")
+        return
+    if callable(value):
+        raise TypeError("Callables cannot be part of a cache key.")
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, str) and os.path.splitext(value)[1].lower() in ARRAY_EXTENSIONS and os.path.isfile(value):
+        value = ["file", os.path.splitext(value)[1].lower(), _file_digest(value)]
+    digest.update(json.dumps(value).encode())
+
+
+# Κλειδί της cache: hash του (τύπος προβλήματος, δεδομένα instance, επιλογές solver)
+def cache_key(problem, instance, **options):
+    digest = hashlib.sha256()
+    options = {name: value for name, value in options.items() if name not in IGNORED_OPTIONS}
+    _update_hash(digest, {"problem": problem, "instance": instance, "options": options})
+    return digest.hexdigest()
+
+
+# Αφαίρεση των λιγότερο πρόσφατα χρησιμοποιημένων εγγραφών μέχρι να χωράει η μνήμη στο όριο
+def _evict():
+    while _memory and _state["bytes"] > _state["max_bytes"]:
+        _, blob = _memory.popitem(last=False)
+        _state["bytes"] -= len(blob)
+        _stats["evictions"] += 1
+
+
+def _store(key, blob):
+    if key in _memory:
+        _state["bytes"] -= len(_memory.pop(key))
+    _memory[key] = blob
+    _state["bytes"] += len(blob)
+    _evict()
+
+
+# Αναζήτηση στη μνήμη και μετά στη βάση (με μεταφορά της εγγραφής στη μνήμη)
+def _get(key):
+    blob = _memory.get(key)
+    if blob is not None:
+        _memory.move_to_end(key)
+        _stats["hits"] += 1
+        return pickle.loads(blob)
+
+    db = _state["db"]
+    if db is not None:
+        row = db.execute("SELECT value FROM solutions WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            _stats["disk_hits"] += 1
+            _store(key, row[0])
+            return pickle.loads(row[0])
+
+    _stats["misses"] += 1
+    return None
+
+
+# Αποθήκευση μόνο βέλτιστων λύσεων
+def _put(key, result):
+    if result.get("status") != "optimal":
+        return
+    blob = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+    _store(key, blob)
+    db = _state["db"]
+    if db is not None:
+        db.execute(
+            "INSERT OR REPLACE INTO solutions (key, value, created) VALUES (?, ?, ?)",
+            (key, blob, time.time()),
+        )
+        db.commit()
+
+
+# Αποθηκευμένη λύση για τα ίδια δεδομένα και επιλογές, ή None
+def lookup(problem, instance, **options):
+    try:
+        key = cache_key(problem, instance, **options)
+    except TypeError:
+        _stats["bypassed"] += 1
+        return None
+    return _get(key)
+
+
+# Αποθήκευση λύσης που υπολογίστηκε εκτός cache (π.χ. σε άλλη διεργασία)
+def store(problem, instance, result, **options):
+    try:
+        key = cache_key(problem, instance, **options)
+    except TypeError:
+        return
+    _put(key, result)
+
+
+# Επίλυση μέσω της cache: ίδια δεδομένα και επιλογές επιστρέφουν την αποθηκευμένη λύση
+# χωρίς να ξαναχτιστεί το μοντέλο. Αποθηκεύονται μόνο βέλτιστες λύσεις.
+def cached_solve(problem, instance, **options):
+    try:
+        key = cache_key(problem, instance, **options)
+    except TypeError:
+        _stats["bypassed"] += 1
+        return problems.solve(problem, instance, **options)
+
+    result = _get(key)
+    if result is None:
+        result = problems.solve(problem, instance, **options)
+        _put(key, result)
+    return result
@@ -0,0 +1,227 @@
+import contextlib
+import contextvars
+import json
+import math
+import os
+import sys
+import time
+
+import pyomo.environ as pe
+from pyomo.core.expr.visitor import identify_variables
+
+# Φάσεις μιας επίλυσης με τη σειρά που εμφανίζονται στο log και στο snapshot
+PHASES = ("parse", "build", "write", "solve", "load", "format")
+
+# Κατάσταση της καταγραφής: αρχείο JSON lines ("-" για το stderr) και αρχείο Prometheus.
+# Η διεργασία που κάλεσε το configure_metrics είναι η μόνη που γράφει το snapshot.
+_state = {"enabled": False, "log_path": None, "prometheus_path": None, "pid": None}
+
+# Σύνολα για το snapshot: (problem, status) -> πλήθος, (problem, phase) -> δευτερόλεπτα,
+# problem -> συνολικός χρόνος και problem -> μέγεθος/gap του τελευταίου μοντέλου
+_totals = {"requests": {}, "phases": {}, "seconds": {}, "last": {}}
+
+# Η τρέχουσα επίλυση (dict) ή None όταν η καταγραφή είναι ανενεργή
+_current = contextvars.ContextVar("solve_context", default=None)
+
+# Κοινό context χωρίς καμία ενέργεια: με την καταγραφή ανενεργή δεν δημιουργείται τίποτα
+_DISABLED = contextlib.nullcontext()
+
+
+# Ενεργοποίηση της καταγραφής: log_path για μία γραμμή JSON ανά επίλυση, prometheus_path για
+# snapshot σε μορφή κειμένου Prometheus (ξαναγράφεται μετά από κάθε επίλυση). Χωρίς αρχεία
+# η καταγραφή απενεργοποιείται.
+def configure_metrics(log_path=None, prometheus_path=None):
+    _state["log_path"] = log_path
+    _state["prometheus_path"] = prometheus_path
+    _state["enabled"] = log_path is not None or prometheus_path is not None
+    _state["pid"] = os.getpid()
+
+
+def metrics_enabled():
+    return _state["enabled"]
+
+
+# Μηδενισμός των συνόλων του snapshot
+def reset_metrics():
+    for totals in _totals.values():
+        totals.clear()
+
+
+@contextlib.contextmanager
+def _solve_context(context):
+    token = _current.set(context)
+    start = time.perf_counter()
+    try:
+        yield context
+    except Exception as e:
+        context["error"] = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _current.reset(token)
+        context["seconds"] = time.perf_counter() - start
+        _emit(context)
+
+
+# Context για μία επίλυση: δίνει το dict της επίλυσης (None αν η καταγραφή είναι ανενεργή) και στο
+# τέλος γράφει το log και το snapshot. Μέσα σε άλλη επίλυση δίνει την εξωτερική, ώστε π.χ. το cli
+# να μετρά και την ανάγνωση του αρχείου πριν από το problems.solve.
+def solve_context(problem=None, **labels):
+    if not _state["enabled"]:
+        return _DISABLED
+    outer = _current.get()
+    if outer is not None:
+        annotate(problem=problem, **labels)
+        return contextlib.nullcontext(outer)
+    context = {
+        "problem": problem, **labels, "status": None, "termination": None, "gap": None,
+        "variables": None, "constraints": None, "nonzeros": None, "solves": 0, "phases": {},
+    }
+    return _solve_context(context)
+
+
+def current_context():
+    return _current.get()
+
+
+# Συμπλήρωση πεδίων της τρέχουσας επίλυσης (τα None αγνοούνται)
+def annotate(**fields):
+    context = _current.get()
+    if context is not None:
+        context.update((name, value) for name, value in fields.items() if value is not None)
+
+
+@contextlib.contextmanager
+def _phase(context, name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_phase(context, name, time.perf_counter() - start)
+
+
+# Χρονομέτρηση μιας φάσης της τρέχουσας επίλυσης· ο χρόνος προστίθεται αν η φάση επαναλαμβάνεται
+def phase(name):
+    context = _current.get()
+    if context is None:
+        return _DISABLED
+    return _phase(context, name)
+
+
+def add_phase(context, name, seconds):
+    if seconds is not None:
+        context["phases"][name] = context["phases"].get(name, 0.0) + seconds
+
+
+# Σχετικό gap μεταξύ της καλύτερης λύσης και του φράγματος (None αν λείπει κάποιο από τα δύο)
+def relative_gap(objective, bound):
+    if objective is None or bound is None:
+        return None
+    try:
+        objective, bound = float(objective), float(bound)
+    except (TypeError, ValueError):
+        return None
+    if not (math.isfinite(objective) and math.isfinite(bound)):
+        return None
+    return abs(objective - bound) / max(1.0, abs(objective))
+
+
+# Μέγεθος μοντέλου Pyomo: μεταβλητές, ενεργοί περιορισμοί και μη μηδενικοί συντελεστές
+def model_size(model):
+    variables = sum(1 for _ in model.component_data_objects(pe.Var, descend_into=True))
+    constraints = 0
+    nonzeros = 0
+    for constraint in model.component_data_objects(pe.Constraint, active=True, descend_into=True):
+        constraints += 1
+        nonzeros += sum(1 for _ in identify_variables(constraint.body, include_fixed=False))
+    return {"variables": variables, "constraints": constraints, "nonzeros": nonzeros}
+
+
+# Καταγραφή μιας κλήσης του solver από το solve_model: φάσεις write/solve/load από το timing,
+# termination condition, gap και μέγεθος του μοντέλου. Σε επαναλαμβανόμενες επιλύσεις (cuts)
+# οι χρόνοι αθροίζονται και το μέγεθος ξαναμετριέται μόνο όταν αλλάξει το μοντέλο.
+def record_solve(context, model, termination, timing, gap=None):
+    context["solves"] += 1
+    context["termination"] = termination
+    context["gap"] = gap
+    for name in ("write", "solve", "load"):
+        add_phase(context, name, timing.get(name))
+    key = (id(model), model.nconstraints())
+    if context.get("_model") != key:
+        context["_model"] = key
+        context.update(model_size(model))
+
+
+def _emit(context):
+    record = {name: value for name, value in context.items() if not name.startswith("_")}
+    record["timestamp"] = time.time()
+    record["phases"] = {name: context["phases"][name] for name in PHASES if name in context["phases"]}
+
+    problem = record["problem"] or "unknown"
+    status = record["status"] or ("error" if "error" in record else "unknown")
+    requests = _totals["requests"]
+    requests[problem, status] = requests.get((problem, status), 0) + 1
+    _totals["seconds"][problem] = _totals["seconds"].get(problem, 0.0) + record["seconds"]
+    for name, seconds in record["phases"].items():
+        _totals["phases"][problem, name] = _totals["phases"].get((problem, name), 0.0) + seconds
+    if record["variables"] is not None:
+        _totals["last"][problem] = {name: record[name] for name in ("variables", "constraints", "nonzeros", "gap")}
+
+    if _state["log_path"] is not None:
+        line = json.dumps(record, default=str) + "\n"
+        if _state["log_path"] == "-":
+            sys.stderr.write(line)
+            sys.stderr.flush()
+        else:
+            with open(_state["log_path"], "a", encoding="utf-8") as f:
+                f.write(line)
+    if _state["prometheus_path"] is not None and os.getpid() == _state["pid"]:
+        write_prometheus(_state["prometheus_path"])
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels):
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+# Τα σύνολα σε μορφή κειμένου Prometheus (exposition format 0.0.4)
+def prometheus_text():
+    lines = [
+        "# HELP solve_requests_total Solve calls by problem and result status.",
+        "# TYPE solve_requests_total counter",
+    ]
+    for (problem, status), count in sorted(_totals["requests"].items()):
+        lines.append(f"solve_requests_total{_labels(problem=problem, status=status)} {count}")
+    lines += [
+        "# HELP solve_seconds_total Wall time of the solve calls.",
+        "# TYPE solve_seconds_total counter",
+    ]
+    for problem, seconds in sorted(_totals["seconds"].items()):
+        lines.append(f"solve_seconds_total{_labels(problem=problem)} {seconds:.6f}")
+    lines += [
+        "# HELP solve_phase_seconds_total Wall time of the solve calls by phase.",
+        "# TYPE solve_phase_seconds_total counter",
+    ]
+    for (problem, name), seconds in sorted(_totals["phases"].items()):
+        lines.append(f"solve_phase_seconds_total{_labels(problem=problem, phase=name)} {seconds:.6f}")
+    for name, help_text in (
+        ("variables", "Variables of the last model solved."),
+        ("constraints", "Active constraints of the last model solved."),
+        ("nonzeros", "Constraint nonzeros of the last model solved."),
+        ("gap", "Relative MIP gap reported for the last model solved."),
+    ):
+        lines += [f"# HELP solve_model_{name} {help_text}", f"# TYPE solve_model_{name} gauge"]
+        for problem, last in sorted(_totals["last"].items()):
+            if last[name] is not None:
+                lines.append(f"solve_model_{name}{_labels(problem=problem)} {last[name]}")
+    return "\n".join(lines) + "\n"
+
+
+# Εγγραφή του snapshot με αντικατάσταση, ώστε όποιος το διαβάζει να μη βρίσκει μισό αρχείο
+def write_prometheus(path):
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "w", encoding="utf-8") as f:
+        f.write(prometheus_text())
+    os.replace(temporary, path)
@@ -0,0 +1,156 @@
+import argparse
+import time
+
+import numpy as np
+import pyomo.environ as pe
+import pyomo.opt as po
+from pyomo.contrib.appsi.base import LegacySolverInterface, Solver
+
+import solve_metrics
+
+
+def _appsi_highs():
+    from pyomo.contrib.appsi.solvers import Highs
+
+    return Highs()
+
+
+# Backends που κρατούν το μοντέλο στη μνήμη του solver (χωρίς αρχείο LP/NL και ξεχωριστή διεργασία):
+# όνομα solver -> συνάρτηση που δημιουργεί τον solver. Κάθε άλλο όνομα πάει στο po.SolverFactory.
+IN_MEMORY_BACKENDS = {"highs": _appsi_highs}
+
+
+# Προσθήκη in-memory backend: factory χωρίς ορίσματα που επιστρέφει solver του pyomo.contrib.appsi
+def register_backend(name, factory):
+    IN_MEMORY_BACKENDS[name] = factory
+
+
+def is_in_memory(solver):
+    return solver in IN_MEMORY_BACKENDS
+
+
+# Solver για ένα ή περισσότερα solve_model. Οι in-memory solvers είναι persistent: σε επόμενες
+# επιλύσεις στέλνουν μόνο τις αλλαγές του μοντέλου (π.χ. νέα cuts).
+def create_solver(solver="glpk"):
+    if solver in IN_MEMORY_BACKENDS:
+        return IN_MEMORY_BACKENDS[solver]()
+    return po.SolverFactory(solver)
+
+
+# Χρόνος επίλυσης που αναφέρει ο ίδιος ο solver (None αν δεν τον αναφέρει)
+def _reported_time(result):
+    for name in ("wallclock_time", "time", "user_time"):
+        value = getattr(result.solver, name, None)
+        if isinstance(value, (int, float)) and value >= 0:
+            return float(value)
+    return None
+
+
+# Gap από τα φράγματα που αναφέρει ο solver (η καλύτερη λύση είναι το άνω φράγμα στην ελαχιστοποίηση)
+def _reported_gap(model, result):
+    if not len(result.problem):
+        return None
+    objective = next(model.component_data_objects(pe.Objective, active=True), None)
+    bounds = (result.problem.upper_bound, result.problem.lower_bound)
+    if objective is not None and objective.sense == pe.maximize:
+        bounds = bounds[::-1]
+    return solve_metrics.relative_gap(*bounds)
+
+
+# Επίλυση μοντέλου Pyomo με τον solver (όνομα) ή με έτοιμο αντικείμενο opt από το create_solver.
+# Επιστρέφει το termination condition ως κείμενο ("optimal", "infeasible", ...). Στα in-memory
+# backends οι τιμές των μεταβλητών φορτώνονται μαζικά, μόνο όταν υπάρχει λύση, και ισχύει
+# το time_limit (οι solvers μέσω αρχείων έχουν ο καθένας δικό του όνομα για αυτή την επιλογή).
+# Με timing (dict) καταγράφονται ο χρόνος του solver ("solve") και ο υπόλοιπος χρόνος για τη
+# μεταφορά του μοντέλου και της λύσης ("io", None αν ο solver δεν αναφέρει τον χρόνο του), χωρισμένος
+# σε "write" και "load" όπου γίνεται. Μέσα σε solve_metrics.solve_context η κλήση καταγράφεται εκεί.
+def solve_model(model, solver="glpk", tee=False, warmstart=False, time_limit=None, opt=None, timing=None):
+    context = solve_metrics.current_context()
+    if context is not None and timing is None:
+        timing = {}
+    if opt is None:
+        opt = create_solver(solver)
+    start = time.perf_counter()
+    if not isinstance(opt, Solver) or isinstance(opt, LegacySolverInterface):
+        options = {"warmstart": True} if warmstart and opt.warm_start_capable() else {}
+        result = opt.solve(model, tee=tee, **options)
+        termination = str(result.solver.termination_condition)
+        if timing is not None:
+            elapsed = time.perf_counter() - start
+            reported = _reported_time(result)
+            timing["solve"] = elapsed if reported is None else min(reported, elapsed)
+            timing["io"] = None if reported is None else elapsed - timing["solve"]
+            # Οι solvers μέσω αρχείων γράφουν το μοντέλο και διαβάζουν τη λύση στην ίδια κλήση
+            timing["write"] = timing["io"]
+        if context is not None:
+            solve_metrics.record_solve(context, model, termination, timing, _reported_gap(model, result))
+        return termination
+
+    opt.config.stream_solver = tee
+    opt.config.load_solution = False
+    opt.config.warmstart = warmstart
+    opt.config.time_limit = time_limit
+    results = opt.solve(model)
+    solved = time.perf_counter()
+    if results.best_feasible_objective is not None:
+        results.solution_loader.load_vars()
+        # Duals μόνο αν τα ζητά το μοντέλο, όπως με το Suffix "dual" στους άλλους solvers
+        dual = model.component("dual")
+        if isinstance(dual, pe.Suffix) and dual.import_enabled():
+            dual.update(results.solution_loader.get_duals())
+    termination = results.termination_condition.name
+    if timing is not None:
+        elapsed = time.perf_counter() - start
+        reported = results.wallclock_time
+        timing["solve"] = solved - start if reported is None else min(reported, solved - start)
+        timing["io"] = elapsed - timing["solve"]
+        timing["write"] = solved - start - timing["solve"]
+        timing["load"] = elapsed - (solved - start)
+    if context is not None:
+        gap = solve_metrics.relative_gap(results.best_feasible_objective, results.best_objective_bound)
+        solve_metrics.record_solve(context, model, termination, timing, gap)
+    return termination
+
+
+# Σύγκριση χρόνων επίλυσης (μαζί με τη μεταφορά του μοντέλου στον solver και την ανάγνωση της λύσης)
+# για κάθε solver σε μερικά τυχαία instances. Η δημιουργία του μοντέλου Pyomo δεν μετράει.
+def benchmark(solvers=("glpk", "highs"), sizes=(20, 50, 100), repeats=3, seed=0):
+    import assignment
+    import facility
+    import scheduling
+
+    rng = np.random.default_rng(seed)
+    problems = {
+        "assignment": lambda n: (assignment.build_assignment_model, (rng.integers(1, 100, (n, n)),)),
+        "scheduling": lambda n: (scheduling.build_scheduling_model, (rng.integers(1, 100, n).tolist(), 4)),
+        "facility": lambda n: (facility.build_facility_model, (rng.uniform(50, 100, n // 2), rng.uniform(1, 20, (n // 2, n)))),
+    }
+    records = []
+    for name, make in problems.items():
+        for n in sizes:
+            builder, args = make(n)
+            for solver in solvers:
+                if not is_in_memory(solver) and not po.SolverFactory(solver).available(exception_flag=False):
+                    continue
+                elapsed = []
+                for _ in range(repeats):
+                    model = builder(*args)
+                    start = time.perf_counter()
+                    status = solve_model(model, solver)
+                    elapsed.append(time.perf_counter() - start)
+                records.append({
+                    "problem": name, "size": n, "solver": solver, "status": status,
+                    "seconds": float(np.median(elapsed)),
+                })
+    return records
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare file-based and in-memory solver backends.")
+    parser.add_argument("--solvers", nargs="+", default=["glpk", "highs"], help="solver names to compare")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[20, 50, 100], help="instance sizes")
+    parser.add_argument("--repeats", type=int, default=3, help="runs per instance (the median is reported)")
+    args = parser.parse_args()
+    for record in benchmark(args.solvers, args.sizes, args.repeats):
+        print(f"{record['problem']:<12}{record['size']:>6}  {record['solver']:<14}{record['status']:<12}"
+              f"{record['seconds']:.4f} s")
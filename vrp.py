@@ -0,0 +1,355 @@
+import math
+
+import numpy as np
+import pyomo.environ as pe
+from pyomo.solvers.plugins.solvers.persistent_solver import PersistentSolver
+
+from solution_arrays import selected_indices
+from solve_metrics import phase
+from solver_backends import create_solver, solve_model
+
+# Ανοχή για τις συγκρίσεις φορτίων και τιμών μεταβλητών
+EPS = 1e-6
+
+
+# Έλεγχος δεδομένων: demands για τους πελάτες 1..n, costs (n+1)x(n+1) με τον κόμβο 0 ως αποθήκη
+def _prepare(demands, costs):
+    demands = np.asarray(demands, dtype=float)
+    costs = np.asarray(costs, dtype=float)
+    num_customers = len(demands)
+    if demands.ndim != 1 or costs.shape != (num_customers + 1, num_customers + 1):
+        raise ValueError("The demand vector or cost matrix is not correctly formatted.")
+    return demands, costs
+
+
+# Οι k κοντινότεροι πελάτες (1..n) κάθε κόμβου, σύμφωνα με το κόστος μετάβασης: πίνακας (n+1)xk
+def nearest_neighbors(costs, k):
+    costs = np.asarray(costs, dtype=float)
+    n = len(costs) - 1
+    k = min(k, n - 1)
+    if k <= 0:
+        return np.empty((n + 1, 0), dtype=int)
+    distances = costs[:, 1:].copy()
+    distances[np.arange(1, n + 1), np.arange(n)] = np.inf
+    nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+    order = np.argsort(np.take_along_axis(distances, nearest, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(nearest, order, axis=1) + 1
+
+
+# Clarke–Wright savings: κάθε πελάτης ξεκινά σε δική του διαδρομή 0 -> i -> 0 και οι διαδρομές
+# ενώνονται (τέλος της μίας με αρχή της άλλης) με φθίνουσα σειρά εξοικονόμησης
+# s_ij = c_i0 + c_0j - c_ij, όσο χωράει το φορτίο. Με neighbors (από nearest_neighbors) εξετάζονται
+# μόνο τα ζεύγη i -> κοντινός του i. Επιστρέφει λίστα διαδρομών (λίστες πελατών 1..n).
+def clarke_wright(demands, costs, capacity, neighbors=None):
+    demands, costs = _prepare(demands, costs)
+    n = len(demands)
+    if n == 0:
+        return []
+    if neighbors is None:
+        savings = costs[1:, [0]] + costs[[0], 1:] - costs[1:, 1:]
+        np.fill_diagonal(savings, -np.inf)
+        i_index, j_index = np.nonzero(savings > 0)
+        values = savings[i_index, j_index]
+        i_index, j_index = i_index + 1, j_index + 1
+    else:
+        i_index = np.repeat(np.arange(1, n + 1), neighbors.shape[1])
+        j_index = neighbors[1:].ravel()
+        values = costs[i_index, 0] + costs[0, j_index] - costs[i_index, j_index]
+        positive = values > 0
+        i_index, j_index, values = i_index[positive], j_index[positive], values[positive]
+    order = np.argsort(-values, kind="stable")
+
+    routes = {i: [i] for i in range(1, n + 1)}  # id διαδρομής -> πελάτες
+    route_of = np.arange(n + 1)
+    load = {i: demands[i - 1] for i in range(1, n + 1)}
+    for i, j in zip(i_index[order], j_index[order]):
+        ri, rj = route_of[i], route_of[j]
+        if ri == rj or routes[ri][-1] != i or routes[rj][0] != j:
+            continue
+        if load[ri] + load[rj] > capacity + EPS:
+            continue
+        routes[ri].extend(routes[rj])
+        route_of[routes[rj]] = ri
+        load[ri] += load.pop(rj)
+        del routes[rj]
+    return list(routes.values())
+
+
+# Κόστος μιας λύσης σε μορφή λίστας διαδρομών
+def routes_cost(routes, costs):
+    costs = np.asarray(costs, dtype=float)
+    total = 0.0
+    for route in routes:
+        path = [0] + list(route) + [0]
+        total += costs[path[:-1], path[1:]].sum()
+    return float(total)
+
+
+# Αραιό σύνολο τόξων: για κάθε πελάτη τα τόξα προς τους k κοντινότερους πελάτες του και αντίστροφα,
+# όλα τα τόξα από/προς την αποθήκη και τα τόξα των διαδρομών extra_routes (π.χ. της αρχικής λύσης)
+def sparse_arcs(costs, k, extra_routes=()):
+    costs = np.asarray(costs, dtype=float)
+    n = len(costs) - 1
+    nearest = nearest_neighbors(costs, k)
+    rows = np.repeat(np.arange(1, n + 1), nearest.shape[1])
+    arcs = set(zip(rows.tolist(), nearest[1:].ravel().tolist()))
+    arcs |= {(j, i) for i, j in arcs}
+    arcs |= {(0, j) for j in range(1, n + 1)} | {(i, 0) for i in range(1, n + 1)}
+    for route in extra_routes:
+        path = [0] + list(route) + [0]
+        arcs.update(zip(path[:-1], path[1:]))
+    return arcs
+
+
+# Δημιουργία μοντέλου Pyomo για το VRP (two-index): x[i, j] = 1 αν κάποιο όχημα πάει από i σε j.
+# Οι περιορισμοί χωρητικότητας και οι subtours μπαίνουν σταδιακά ως rounded capacity cuts
+# στο model.capacity_cuts από το solve_vrp. Με arcs (π.χ. από sparse_arcs) οι μεταβλητές και οι
+# περιορισμοί φτιάχνονται μόνο για αυτά τα τόξα.
+def build_vrp_model(demands, costs, num_vehicles, capacity, arcs=None):
+    demands, costs = _prepare(demands, costs)
+    num_customers = len(demands)
+    if (demands > capacity + EPS).any():
+        raise ValueError("A customer's demand exceeds the vehicle capacity.")
+    if min_vehicles(demands, capacity) > num_vehicles:
+        raise ValueError("The vehicles cannot carry the total demand.")
+    d = [0.0] + demands.tolist()
+    c = costs.tolist()
+    model = pe.ConcreteModel()
+
+    # Τόξα: χωρίς βρόχους και χωρίς ζεύγη πελατών που δεν χωράνε μαζί σε ένα όχημα
+    if arcs is None:
+        arcs = ((i, j) for i in range(num_customers + 1) for j in range(num_customers + 1))
+    arcs = sorted(
+        (i, j) for i, j in arcs if i != j and (i == 0 or j == 0 or d[i] + d[j] <= capacity + EPS)
+    )
+    successors = {i: [] for i in range(num_customers + 1)}
+    predecessors = {j: [] for j in range(num_customers + 1)}
+    for i, j in arcs:
+        successors[i].append(j)
+        predecessors[j].append(i)
+
+    # Σετ πελατών και κόμβων (πελάτες + αποθήκη)
+    model.customers = pe.Set(initialize=range(1, num_customers + 1))
+    model.nodes = pe.Set(initialize=range(num_customers + 1))  # 0 = αποθήκη
+    model.arcs = pe.Set(dimen=2, initialize=arcs)
+    model.successors = pe.Set(model.nodes, initialize=successors)
+    model.predecessors = pe.Set(model.nodes, initialize=predecessors)
+
+    # Μεταβλητές απόφασης
+    model.x = pe.Var(model.arcs, domain=pe.Binary)  # Αν κάποιο όχημα πάει από i σε j
+
+    # Συνάρτηση στόχου: Ελαχιστοποίηση κόστους
+    model.obj = pe.Objective(expr=sum(c[i][j] * model.x[i, j] for i, j in model.arcs), sense=pe.minimize)
+
+    # Περιορισμοί: Κάθε πελάτης έχει ακριβώς ένα εισερχόμενο και ένα εξερχόμενο τόξο
+    model.visit_constraints = pe.Constraint(
+        model.customers, rule=lambda model, j: sum(model.x[i, j] for i in model.predecessors[j]) == 1
+    )
+    model.leave_constraints = pe.Constraint(
+        model.customers, rule=lambda model, i: sum(model.x[i, j] for j in model.successors[i]) == 1
+    )
+
+    # Περιορισμός: Όσα οχήματα φεύγουν από την αποθήκη επιστρέφουν, το πολύ num_vehicles,
+    # και τουλάχιστον όσα χρειάζονται για τη συνολική ζήτηση
+    depot_out = sum(model.x[0, j] for j in model.customers)
+    depot_in = sum(model.x[i, 0] for i in model.customers)
+    model.depot_balance = pe.Constraint(expr=depot_out == depot_in)
+    model.fleet_size = pe.Constraint(
+        expr=pe.inequality(min_vehicles(demands, capacity), depot_out, num_vehicles)
+    )
+
+    # Rounded capacity cuts που προστίθενται κατά την επίλυση
+    model.capacity_cuts = pe.ConstraintList()
+
+    return model
+
+
+# Ελάχιστο πλήθος οχημάτων για ένα σύνολο πελατών (rounded capacity)
+def min_vehicles(demands, capacity):
+    return max(1, math.ceil(float(np.sum(demands)) / capacity - EPS)) if len(demands) else 0
+
+
+# Διαδρομές από τα τόξα της λύσης: κάθε διαδρομή από την αποθήκη με σειρά επίσκεψης, και
+# οι κύκλοι πελατών που δεν περνούν από την αποθήκη (subtours)
+def _follow_arcs(successor, num_customers):
+    routes, subtours = [], []
+    seen = np.zeros(num_customers + 1, dtype=bool)
+    for first in successor.get(0, []):
+        route = []
+        node = first
+        while node != 0 and not seen[node]:
+            seen[node] = True
+            route.append(node)
+            node = successor[node][0]
+        routes.append(route)
+    for start in range(1, num_customers + 1):
+        if seen[start] or start not in successor:
+            continue
+        cycle = []
+        node = start
+        while not seen[node]:
+            seen[node] = True
+            cycle.append(node)
+            node = successor[node][0]
+        subtours.append(cycle)
+    return routes, subtours
+
+
+def _solution_routes(model):
+    successor = {}
+    for i, j in selected_indices(model.x):
+        successor.setdefault(i, []).append(j)
+    return _follow_arcs(successor, len(model.customers))
+
+
+# Rounded capacity cut για το σύνολο πελατών S: τόξα που φεύγουν από το S >= ceil(d(S) / Q).
+# Για subtours δίνει >= 1, δηλαδή και subtour elimination.
+def _add_capacity_cut(model, customers, demands, capacity):
+    inside = set(customers)
+    needed = min_vehicles([demands[i - 1] for i in customers], capacity)
+    leaving = sum(model.x[i, j] for i in customers for j in model.successors[i] if j not in inside)
+    return model.capacity_cuts.add(leaving >= needed)
+
+
+# Αρχική λύση στις μεταβλητές του μοντέλου από λίστα διαδρομών
+def apply_warm_start(model, routes):
+    arcs = set()
+    for route in routes:
+        path = [0] + list(route) + [0]
+        arcs.update(zip(path[:-1], path[1:]))
+    for i, j in model.arcs:
+        model.x[i, j].set_value(1 if (i, j) in arcs else 0)
+
+
+# Διαδρομές (λίστες πελατών) στη μορφή αποτελέσματος: τόξα (i, j) ανά όχημα με σειρά επίσκεψης
+def route_arcs(routes):
+    result = []
+    for k, route in enumerate(routes):
+        path = [0] + [int(i) for i in route] + [0]
+        result.append({"vehicle": k, "arcs": list(zip(path[:-1], path[1:]))})
+    return result
+
+
+# Ανάγνωση αποτελεσμάτων από λυμένο μοντέλο
+def extract_routes(model):
+    routes, _ = _solution_routes(model)
+    return {"total_cost": pe.value(model.obj), "routes": route_arcs(routes)}
+
+
+# Τόξα εκτός μοντέλου που μπορεί να βελτιώσουν τη λύση: reduced cost στη χαλάρωση LP του μοντέλου
+# (με τα cuts του) c_ij - (dual εξόδου του i) - (dual εισόδου του j) - (duals των cuts που αφήνουν
+# το i μέσα και το j έξω) μικρότερο από το gap μεταξύ της ακέραιας λύσης (upper) και του φράγματος
+# LP. Τόξο με reduced cost >= gap δεν υπάρχει σε καμία καλύτερη λύση, οπότε αν δεν επιστραφεί
+# κανένα τόξο η λύση του περιορισμένου μοντέλου είναι βέλτιστη και για όλα τα τόξα.
+# Επιστρέφει None αν η χαλάρωση δεν λυθεί (τότε δεν αποδεικνύεται τίποτα).
+def _price_arcs(model, demands, costs, capacity, cut_sets, solver, upper):
+    lp = pe.TransformationFactory("core.relax_integer_vars").create_using(model)
+    lp.dual = pe.Suffix(direction=pe.Suffix.IMPORT)
+    if solve_model(lp, solver) != "optimal":
+        return None
+    gap = max(0.0, upper - pe.value(lp.obj))
+
+    n = len(demands)
+    visit = np.array([lp.dual.get(lp.visit_constraints[j], 0.0) for j in range(1, n + 1)])
+    leave = np.array([lp.dual.get(lp.leave_constraints[i], 0.0) for i in range(1, n + 1)])
+    reduced = costs[1:, 1:] - leave[:, None] - visit[None, :]
+    for index, customers in enumerate(cut_sets, start=1):
+        dual = lp.dual.get(lp.capacity_cuts[index], 0.0)
+        if dual:
+            inside = np.zeros(n, dtype=bool)
+            inside[np.asarray(customers) - 1] = True
+            reduced -= dual * np.outer(inside, ~inside)
+
+    candidate = reduced < gap - EPS
+    np.fill_diagonal(candidate, False)
+    candidate &= demands[:, None] + demands[None, :] <= capacity + EPS
+    for i, j in model.arcs:
+        if i and j:
+            candidate[i - 1, j - 1] = False
+    rows, columns = np.nonzero(candidate)
+    return list(zip((rows + 1).tolist(), (columns + 1).tolist()))
+
+
+# Επίλυση με σταδιακή προσθήκη cuts: σε κάθε λύση εντοπίζονται subtours και διαδρομές που
+# ξεπερνούν τη χωρητικότητα, προστίθενται τα αντίστοιχα cuts και ξαναλύνεται, μέχρι να μη βρεθεί
+# κανένα. Τα σύνολα πελατών των cuts μαζεύονται στο cut_sets (και ξαναμπαίνουν αν το μοντέλο
+# ξαναχτιστεί). Επιστρέφει (model, status).
+def _solve_with_cuts(demands, costs, num_vehicles, capacity, arcs, cut_sets, warm_start, solver, tee, max_rounds):
+    with phase("build"):
+        model = build_vrp_model(demands, costs, num_vehicles, capacity, arcs)
+        for customers in cut_sets:
+            _add_capacity_cut(model, customers, demands, capacity)
+        if warm_start is not None:
+            apply_warm_start(model, warm_start)
+
+    opt = create_solver(solver)
+    persistent = isinstance(opt, PersistentSolver)
+    if persistent:
+        opt.set_instance(model)
+
+    for _ in range(max_rounds):
+        status = solve_model(model, tee=tee, warmstart=warm_start is not None, opt=opt)
+        if status != "optimal":
+            return model, status
+
+        routes, subtours = _solution_routes(model)
+        violated = subtours + [route for route in routes if demands[np.array(route) - 1].sum() > capacity + EPS]
+        if not violated:
+            return model, status
+        for customers in violated:
+            cut_sets.append(customers)
+            cut = _add_capacity_cut(model, customers, demands, capacity)
+            if persistent:
+                opt.add_constraint(cut)
+    return model, "maxIterations"
+
+
+# Επίλυση του VRP χωρίς GUI, με lazy capacity cuts (_solve_with_cuts) και τη λύση Clarke–Wright
+# ως αρχική λύση. Με neighbors=k το μοντέλο έχει μόνο τα τόξα του sparse_arcs και η λύση είναι
+# "feasible"· με price_arcs=True τα τόξα που λείπουν και μπορεί να βελτιώσουν τη λύση (_price_arcs)
+# προστίθενται και το μοντέλο ξαναλύνεται, μέχρι να αποδειχθεί ότι είναι βέλτιστη ("optimal").
+# Αν τα τόξα του sparse_arcs δεν επαρκούν για εφικτή λύση, η επίλυση γίνεται με όλα τα τόξα.
+# engine="lns": ευρετική επίλυση με το vrp_lns για μεγάλα instances (time_limit δευτερόλεπτα).
+def solve_vrp(demands, costs, num_vehicles, capacity, solver="glpk", tee=False, max_rounds=1000,
+              engine="pyomo", time_limit=10.0, workers=1, neighbors=None, price_arcs=False):
+    if engine == "lns":
+        from vrp_lns import solve_vrp_lns
+
+        return solve_vrp_lns(demands, costs, num_vehicles, capacity, time_limit=time_limit, workers=workers)
+    if engine != "pyomo":
+        raise ValueError(f"Unknown engine: {engine}")
+
+    demands, costs = _prepare(demands, costs)
+    capacity = float(capacity)
+    num_vehicles = int(num_vehicles)
+    if len(demands) == 0:
+        return {"status": "optimal", "total_cost": 0.0, "routes": []}
+
+    savings_routes = clarke_wright(demands, costs, capacity)
+    warm_start = savings_routes if len(savings_routes) <= num_vehicles else None
+    arcs = None if neighbors is None else sparse_arcs(costs, int(neighbors), savings_routes)
+    cut_sets = []
+    while True:
+        model, status = _solve_with_cuts(
+            demands, costs, num_vehicles, capacity, arcs, cut_sets, warm_start, solver, tee, max_rounds
+        )
+        if status == "infeasible" and arcs is not None:
+            # Τα cuts ισχύουν και για το πλήρες μοντέλο, οπότε κρατιούνται
+            arcs = None
+            continue
+        if status != "optimal":
+            return {"status": status, "total_cost": None, "routes": []}
+        if arcs is None:
+            break
+        if not price_arcs:
+            status = "feasible"
+            break
+        priced = _price_arcs(model, demands, costs, capacity, cut_sets, solver, pe.value(model.obj))
+        if priced is None:
+            status = "feasible"
+            break
+        if not priced:
+            break
+        arcs.update(priced)
+    with phase("format"):
+        return {"status": status, **extract_routes(model)}
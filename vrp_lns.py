@@ -0,0 +1,327 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from vrp import EPS, _prepare, clarke_wright, nearest_neighbors, route_arcs, routes_cost
+
+# Πλήθος κοντινών πελατών που εξετάζονται στις κινήσεις relocate/swap και στο savings
+NEIGHBORS = 20
+
+# Αρχικό περιθώριο αποδοχής χειρότερων λύσεων (record-to-record travel), μειώνεται γραμμικά ως το 0
+ACCEPT_THRESHOLD = 0.001
+
+
+# Η λύση κρατείται σε πίνακες NumPy ως διπλά συνδεδεμένες λίστες:
+#   succ[u], pred[u]: επόμενος/προηγούμενος πελάτης (0 = αποθήκη), route_of[u]: διαδρομή (-1 αν λείπει),
+#   first[r], load[r], size[r]: πρώτος πελάτης, φορτίο και πλήθος πελατών της διαδρομής r.
+# Έτσι η αφαίρεση/εισαγωγή είναι O(1) και το κόστος όλων των θέσεων εισαγωγής υπολογίζεται με μία πράξη.
+def _from_routes(routes, demands):
+    n = len(demands)
+    solution = {
+        "succ": np.zeros(n + 1, dtype=int),
+        "pred": np.zeros(n + 1, dtype=int),
+        "route_of": np.full(n + 1, -1),
+        "first": np.zeros(n + 1, dtype=int),
+        "load": np.zeros(n + 1),
+        "size": np.zeros(n + 1, dtype=int),
+    }
+    for r, route in enumerate(routes):
+        _relink(solution, r, np.asarray(route, dtype=int))
+        solution["load"][r] = demands[np.asarray(route) - 1].sum()
+    return solution
+
+
+def _copy(solution):
+    return {name: array.copy() for name, array in solution.items()}
+
+
+def _route(solution, r):
+    succ = solution["succ"]
+    route = []
+    u = solution["first"][r]
+    while u:
+        route.append(u)
+        u = succ[u]
+    return np.array(route, dtype=int)
+
+
+def _to_routes(solution):
+    return [_route(solution, r).tolist() for r in np.nonzero(solution["size"] > 0)[0]]
+
+
+# Ορισμός της σειράς της διαδρομής r (μετά από 2-opt ή κατά την κατασκευή)
+def _relink(solution, r, route):
+    solution["size"][r] = len(route)
+    if len(route) == 0:
+        solution["first"][r] = 0
+        return
+    solution["pred"][route] = np.r_[0, route[:-1]]
+    solution["succ"][route] = np.r_[route[1:], 0]
+    solution["route_of"][route] = r
+    solution["first"][r] = route[0]
+
+
+def _remove(solution, u, demands):
+    succ, pred = solution["succ"], solution["pred"]
+    p, s, r = pred[u], succ[u], solution["route_of"][u]
+    if p:
+        succ[p] = s
+    else:
+        solution["first"][r] = s
+    if s:
+        pred[s] = p
+    solution["load"][r] -= demands[u - 1]
+    solution["size"][r] -= 1
+    solution["route_of"][u] = -1
+
+
+# Εισαγωγή του u μετά τον p στη διαδρομή r (p = 0: στην αρχή της διαδρομής)
+def _insert(solution, u, p, r, demands):
+    succ, pred = solution["succ"], solution["pred"]
+    s = succ[p] if p else solution["first"][r]
+    if p:
+        succ[p] = u
+    else:
+        solution["first"][r] = u
+    if s:
+        pred[s] = u
+    pred[u], succ[u] = p, s
+    solution["route_of"][u] = r
+    solution["load"][r] += demands[u - 1]
+    solution["size"][r] += 1
+
+
+# Συνολικό κόστος και πλήθος οχημάτων πάνω από το όριο
+def _evaluate(solution, costs, num_vehicles):
+    served = np.nonzero(solution["route_of"] >= 0)[0]
+    active = np.nonzero(solution["size"] > 0)[0]
+    total = costs[served, solution["succ"][served]].sum() + costs[0, solution["first"][active]].sum()
+    return max(0, len(active) - num_vehicles), float(total)
+
+
+# Επισκευή με regret-2: σε κάθε βήμα εισάγεται ο πελάτης με τη μεγαλύτερη διαφορά ανάμεσα στην
+# καλύτερη θέση και στην καλύτερη θέση άλλης διαδρομής, στη φθηνότερη θέση του. Οι θέσεις είναι τα
+# τόξα (p, s) των διαδρομών που περιέχουν κοντινούς πελάτες των αφαιρεμένων (granular), ή νέα
+# διαδρομή· νέα διαδρομή πάνω από το όριο οχημάτων επιλέγεται μόνο όταν ο πελάτης δεν χωράει αλλού.
+def _repair(solution, removed, costs, demands, capacity, num_vehicles, neighbors):
+    route_of = solution["route_of"]
+    pending = np.asarray(removed, dtype=int)
+    candidates = np.unique(route_of[neighbors[pending]])
+    candidates = candidates[candidates >= 0]
+    while len(pending):
+        served = np.nonzero(np.isin(route_of, candidates))[0]
+        active = candidates[solution["size"][candidates] > 0]
+        prevs = np.r_[served, np.zeros(len(active), dtype=int)]
+        nexts = np.r_[solution["succ"][served], solution["first"][active]]
+        routes = np.r_[route_of[served], active]
+
+        delta = costs[prevs[None, :], pending[:, None]] + costs[pending[:, None], nexts[None, :]] - costs[prevs, nexts]
+        delta[solution["load"][routes][None, :] + demands[pending - 1][:, None] > capacity + EPS] = np.inf
+        if len(prevs):
+            best_position = np.argmin(delta, axis=1)
+            best = delta[np.arange(len(pending)), best_position]
+            second = np.where(routes[None, :] == routes[best_position][:, None], np.inf, delta).min(axis=1)
+        else:
+            best_position = np.zeros(len(pending), dtype=int)
+            best = np.full(len(pending), np.inf)
+            second = np.full(len(pending), np.inf)
+
+        # Νέα διαδρομή ως επιπλέον επιλογή
+        new_route = costs[0, pending] + costs[pending, 0]
+        if np.count_nonzero(solution["size"]) < num_vehicles:
+            second = np.minimum(second, np.maximum(best, new_route))
+            use_new = new_route < best
+            best = np.minimum(best, new_route)
+        else:
+            use_new = ~np.isfinite(best)
+            best = np.where(use_new, new_route, best)
+
+        regret = np.where(np.isfinite(second), second - best, np.inf)
+        k = int(np.lexsort((best, -regret))[0])
+        u = pending[k]
+        if use_new[k]:
+            r = int(np.nonzero(solution["size"] == 0)[0][0])
+            _insert(solution, u, 0, r, demands)
+            candidates = np.r_[candidates, r]
+        else:
+            _insert(solution, u, prevs[best_position[k]], routes[best_position[k]], demands)
+        pending = np.delete(pending, k)
+
+
+# 2-opt μέσα σε μία διαδρομή (και για μη συμμετρικά κόστη: το κόστος του αντεστραμμένου
+# τμήματος υπολογίζεται από αθροίσματα των αντίστροφων τόξων)
+def _two_opt(route, costs):
+    while len(route) >= 2:
+        path = np.r_[0, route, 0]
+        forward = np.r_[0.0, np.cumsum(costs[path[:-1], path[1:]])]
+        backward = np.r_[0.0, np.cumsum(costs[path[1:], path[:-1]])]
+        i = np.arange(len(path) - 1)[:, None]
+        j = np.arange(len(path) - 1)[None, :]
+        valid = j >= i + 2
+        jj = np.where(valid, j, i + 2).clip(max=len(path) - 2)
+        delta = (
+            costs[path[i], path[jj]] + costs[path[i + 1], path[jj + 1]] + backward[jj] - backward[i + 1]
+            - costs[path[i], path[i + 1]] - costs[path[jj], path[jj + 1]] - forward[jj] + forward[i + 1]
+        )
+        delta = np.where(valid, delta, np.inf)
+        a, b = np.unravel_index(np.argmin(delta), delta.shape)
+        if delta[a, b] >= -EPS:
+            break
+        path[a + 1:b + 1] = path[a + 1:b + 1][::-1]
+        route = path[1:-1]
+    return route
+
+
+# Τοπική αναζήτηση για τους πελάτες customers: relocate (μετακίνηση δίπλα σε κοντινό πελάτη άλλης
+# διαδρομής) και swap (ανταλλαγή με κοντινό πελάτη άλλης διαδρομής), και 2-opt στις διαδρομές που άλλαξαν
+def _local_search(solution, customers, costs, demands, capacity, neighbors, max_passes=3):
+    succ, pred, route_of, load = solution["succ"], solution["pred"], solution["route_of"], solution["load"]
+    changed = set(route_of[customers].tolist())
+    for _ in range(max_passes):
+        improved = False
+        for u in customers:
+            p, s, ru = pred[u], succ[u], route_of[u]
+            near = neighbors[u]
+            other = route_of[near] != ru
+            near = near[other]
+            if len(near) == 0:
+                continue
+            rv = route_of[near]
+            removal = costs[p, u] + costs[u, s] - costs[p, s]
+
+            # Relocate: μετά ή πριν από τον κοντινό v
+            fits = load[rv] + demands[u - 1] <= capacity + EPS
+            after = costs[near, u] + costs[u, succ[near]] - costs[near, succ[near]] - removal
+            before = costs[pred[near], u] + costs[u, near] - costs[pred[near], near] - removal
+            after[~fits] = np.inf
+            before[~fits] = np.inf
+
+            # Swap με τον κοντινό v
+            pv, sv = pred[near], succ[near]
+            swap = (
+                costs[p, near] + costs[near, s] - costs[p, u] - costs[u, s]
+                + costs[pv, u] + costs[u, sv] - costs[pv, near] - costs[near, sv]
+            )
+            swap_fits = (load[ru] - demands[u - 1] + demands[near - 1] <= capacity + EPS) & (
+                load[rv] - demands[near - 1] + demands[u - 1] <= capacity + EPS
+            )
+            swap[~swap_fits] = np.inf
+
+            moves = np.vstack([after, before, swap])
+            kind, k = np.unravel_index(np.argmin(moves), moves.shape)
+            if moves[kind, k] >= -EPS:
+                continue
+            v, r = near[k], rv[k]
+            if kind == 2:
+                _remove(solution, u, demands)
+                _insert(solution, u, pv[k], r, demands)
+                _remove(solution, v, demands)
+                _insert(solution, v, p, ru, demands)
+            else:
+                _remove(solution, u, demands)
+                _insert(solution, u, v if kind == 0 else pred[v], r, demands)
+            changed.update((ru, r))
+            improved = True
+        if not improved:
+            break
+
+    for r in changed:
+        if solution["size"][r] > 2:
+            _relink(solution, r, _two_opt(_route(solution, r), costs))
+
+
+# Καταστροφή: τυχαίοι πελάτες, πελάτες κοντά σε έναν τυχαίο (related) ή ολόκληρη μικρή διαδρομή
+def _destroy(solution, rng, costs, count):
+    served = np.nonzero(solution["route_of"] >= 0)[0]
+    method = rng.integers(3)
+    if method == 0:
+        return rng.choice(served, size=min(count, len(served)), replace=False)
+    if method == 1:
+        seed = rng.choice(served)
+        return served[np.argsort(costs[seed, served], kind="stable")[:count]]
+    active = np.nonzero(solution["size"] > 0)[0]
+    smallest = active[np.argsort(solution["size"][active])[: 3]]
+    return _route(solution, rng.choice(smallest))
+
+
+# Μία εκτέλεση του LNS με δικό της seed (χρησιμοποιείται και από τις διεργασίες του pool)
+def _run(demands, costs, num_vehicles, capacity, time_limit, seed, neighbors_count):
+    start = time.perf_counter()
+    rng = np.random.default_rng(seed)
+    n = len(demands)
+    neighbors = nearest_neighbors(costs, neighbors_count)
+
+    # Κατασκευή με savings και πλήρης τοπική αναζήτηση
+    routes = clarke_wright(demands, costs, capacity, neighbors=neighbors if n > 200 else None)
+    current = _from_routes(routes, demands)
+    _local_search(current, np.arange(1, n + 1), costs, demands, capacity, neighbors)
+    current_value = _evaluate(current, costs, num_vehicles)
+    best, best_value = _copy(current), current_value
+    history = [(time.perf_counter() - start, best_value[1])]
+
+    iterations = 0
+    max_remove = min(n, max(5, min(60, n // 5)))
+    while time.perf_counter() - start < time_limit:
+        iterations += 1
+        candidate = _copy(current)
+        removed = _destroy(candidate, rng, costs, int(rng.integers(min(n, 5), max_remove + 1)))
+        for u in removed:
+            _remove(candidate, u, demands)
+
+        _repair(candidate, removed, costs, demands, capacity, num_vehicles, neighbors)
+        _local_search(candidate, removed, costs, demands, capacity, neighbors, max_passes=2)
+
+        # Αποδοχή: όχι περισσότερα οχήματα, κόστος μέσα στο περιθώριο από το καλύτερο
+        value = _evaluate(candidate, costs, num_vehicles)
+        threshold = ACCEPT_THRESHOLD * max(0.0, 1 - (time.perf_counter() - start) / time_limit)
+        if value[0] < current_value[0] or (
+            value[0] == current_value[0] and value[1] <= best_value[1] * (1 + threshold) + EPS
+        ):
+            current, current_value = candidate, value
+            if value < best_value:
+                best, best_value = _copy(candidate), value
+                history.append((time.perf_counter() - start, value[1]))
+
+    return {
+        "routes": _to_routes(best),
+        "excess_vehicles": best_value[0],
+        "total_cost": best_value[1],
+        "iterations": iterations,
+        "history": history,
+        "seed": seed,
+    }
+
+
+# Ευρετική επίλυση του VRP για μεγάλα instances (anytime): savings, μετά destroy/repair LNS
+# με relocate/swap/2-opt, μέχρι να τελειώσει το time_limit. Με workers > 1 τρέχουν ανεξάρτητα
+# seeds σε ProcessPoolExecutor και κρατιέται η καλύτερη λύση. Το history έχει το καλύτερο
+# κόστος ανά χρόνο. Status "feasible", ή "infeasible" αν δεν χωράει στα num_vehicles οχήματα.
+def solve_vrp_lns(demands, costs, num_vehicles, capacity, time_limit=10.0, seed=0, workers=1,
+                  neighbors=NEIGHBORS):
+    demands, costs = _prepare(demands, costs)
+    capacity = float(capacity)
+    num_vehicles = int(num_vehicles)
+    if (demands > capacity + EPS).any():
+        raise ValueError("A customer's demand exceeds the vehicle capacity.")
+    if len(demands) == 0:
+        return {"status": "optimal", "total_cost": 0.0, "routes": []}
+
+    arguments = (demands, costs, num_vehicles, capacity, float(time_limit))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_run, *arguments, seed + i, neighbors) for i in range(workers)]
+            runs = [future.result() for future in futures]
+    else:
+        runs = [_run(*arguments, seed, neighbors)]
+    best = min(runs, key=lambda run: (run["excess_vehicles"], run["total_cost"]))
+
+    status = "feasible" if best["excess_vehicles"] == 0 else "infeasible"
+    return {
+        "status": status,
+        "total_cost": routes_cost(best["routes"], costs),
+        "routes": route_arcs(best["routes"]),
+        "iterations": sum(run["iterations"] for run in runs),
+        "history": best["history"],
+        "seed": best["seed"],
+    }